@@ -0,0 +1,639 @@
+"""
+Handler for the Buffer Arena, which keeps the meshes of every Chunk Section in one shared buffer
+
+Class
+-----
+ArenaAllocation - Handles a single range of vertices of the Buffer Arena
+
+BufferArena - Handles the shared buffer, its free ranges and drawing every range at once
+"""
+
+from bisect import bisect_left
+from ctypes import c_void_p
+
+import numpy as np
+from OpenGL.GL import *
+
+from vbohandler import BufferPool, VBOHandler
+
+
+class ArenaAllocation:
+    """
+    This Class Handles a single range of vertices of the Buffer Arena, a Section's mesh
+
+    Parameters
+    ----------
+    first : int
+        The first vertex of the range in the arena
+
+    capacity : int
+        The amount of vertices reserved for the range
+
+    Attributes
+    ----------
+    first : int
+        The first vertex of the range in the arena, it changes when the arena is compacted
+
+    capacity : int
+        The amount of vertices reserved for the range, can be more than the vertexCount
+
+    vertexCount : int
+        The amount of vertices of the mesh in the range
+
+    surfaceQuadCounts : None/np.ndarray
+        The amount of Quads of each surface index, None when the Quads aren't grouped so they are always all drawn
+
+    offset : tuple
+        The (X, Y, Z) added to the packed positions
+    """
+
+    def __init__(self, first: int, capacity: int):
+        self.first = first
+        self.capacity = capacity
+
+        self.vertexCount = 0
+        self.surfaceQuadCounts = None
+        self.offset = (0, 0, 0)
+
+    @property
+    def quadCount(self):
+        return self.vertexCount // 4
+
+    def getDrawRanges(self, surfacesVisible=None):
+        """
+        Gets the ranges of Quads of the mesh to draw, from VBOHandler.getSurfaceDrawRanges
+
+        Parameters
+        ----------
+        surfacesVisible : None/tuple
+            Keyword-Argument, a bool for each surface index, None draws every Quad
+
+        Returns
+        -------
+        list
+            A list containing (first Quad, Quad count) tuples, the Quads are counted from the start of the range
+        """
+
+        return VBOHandler.getSurfaceDrawRanges(self.quadCount, self.surfaceQuadCounts, surfacesVisible)
+
+
+class BufferArena:
+    """
+    This Class Handles one VBO and VAO shared by the meshes of every Chunk Section
+    Each mesh gets a range of the buffer from a free list, and every range is drawn with a single
+    glMultiDrawElementsBaseVertex call which starts the shared Quad indices at the first vertex of each range
+    The packed meshes are drawn with a single glMultiDrawElementsIndirect call instead, where each range
+    is its own instance so it reads its offset from an instanced attribute
+
+    Parameters
+    ----------
+    vertexFormat : str
+        Keyword-Argument, "float" or "packed", the vertex layout of every mesh
+
+    capacity : int
+        Keyword-Argument, the amount of vertices the buffer starts with
+
+    Attributes
+    ----------
+    vertexFormat : str
+        "float" or "packed"
+
+    vertexSize : int
+        Size of a single vertex in bytes
+
+    capacity : int
+        The amount of vertices the buffer holds, it doubles when a mesh doesn't fit in any free range
+
+    capacityHeadroom : float
+        Multiplier for the vertices reserved for a mesh, so small edits can be updated in place
+
+    compactThreshold : float
+        The part of the capacity in free ranges between meshes before compactIfFragmented moves the meshes together
+
+    freeRanges : list
+        A list containing the (first vertex, vertex count) of each free range, sorted by the first vertex
+        with no two ranges next to each other
+
+    allocations : set
+        The ArenaAllocation of every mesh in the buffer
+
+    usedVertexCount : int
+        The amount of vertices of every mesh in the buffer
+
+    vbo : int
+        The OpenGL buffer name
+
+    vao : int
+        The OpenGL vertex array name
+
+    indirectDraw : bool
+        Whether the packed meshes are drawn with glMultiDrawElementsIndirect, False when it isn't supported
+        and the packed meshes are drawn one by one
+
+    offsetBuffer : None/int
+        The OpenGL buffer name of the offset of each drawn range, for the meshOffset attribute of the packed shader
+
+    commandBuffer : None/int
+        The OpenGL buffer name of the draw commands of glMultiDrawElementsIndirect
+
+    drawBufferCapacity : int
+        The amount of ranges the offsetBuffer and commandBuffer hold
+    """
+
+    def __init__(self, vertexFormat="float", capacity=1 << 18):
+        self.vertexFormat = vertexFormat
+        self.vertexSize = VBOHandler.getVertexSize(vertexFormat)
+
+        self.capacity = capacity
+        self.capacityHeadroom = 1.25
+        self.compactThreshold = 0.25
+
+        self.freeRanges = [(0, capacity)]
+        self.allocations = set()
+        self.usedVertexCount = 0
+
+        self.vbo = BufferPool.createBuffer(capacity * self.vertexSize)
+        self.vao = glGenVertexArrays(1)
+        VBOHandler.liveVertexArrayCount += 1
+
+        self.indirectDraw = vertexFormat == "packed" and bool(glMultiDrawElementsIndirect)
+        self.offsetBuffer = None
+        self.commandBuffer = None
+        self.drawBufferCapacity = 0
+
+        if self.indirectDraw:
+            self.reserveDrawBuffers(1024)
+
+        self.setPointers()
+
+    def setPointers(self):
+        """
+        Points the VAO at the current buffer and the shared Quad element buffer
+
+        Returns
+        -------
+        None
+        """
+
+        quadIndexBuffer = VBOHandler.reserveQuadIndices(0)
+
+        glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+
+        if self.vertexFormat == "packed":
+            VBOHandler.setPackedPointers(self.vertexSize)
+        else:
+            VBOHandler.setFloatPointers(self.vertexSize)
+
+        if self.indirectDraw:
+            # One offset per instance, each range is drawn as its own instance
+            glBindBuffer(GL_ARRAY_BUFFER, self.offsetBuffer)
+            glEnableVertexAttribArray(2)
+            glVertexAttribPointer(2, 3, GL_FLOAT, GL_FALSE, 0, None)
+            glVertexAttribDivisor(2, 1)
+
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, quadIndexBuffer)
+
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def reserveDrawBuffers(self, rangeCount: int):
+        """
+        Makes sure the offsetBuffer and commandBuffer hold at least rangeCount ranges
+        The buffers keep their names when they grow, so the VAO stays valid
+
+        Parameters
+        ----------
+        rangeCount : int
+            The amount of ranges that will be drawn
+
+        Returns
+        -------
+        None
+        """
+
+        if self.offsetBuffer is None:
+            self.offsetBuffer = BufferPool.createBuffer(0)
+            self.commandBuffer = BufferPool.createBuffer(0)
+
+        if rangeCount <= self.drawBufferCapacity:
+            return
+
+        oldCapacity = self.drawBufferCapacity
+        self.drawBufferCapacity = max(rangeCount, oldCapacity * 2)
+
+        # 3 float offsets and 5 uint32 command values per range
+        for buffer, rangeSize in ((self.offsetBuffer, 3 * 4), (self.commandBuffer, 5 * 4)):
+            glBindBuffer(GL_COPY_WRITE_BUFFER, buffer)
+            glBufferData(GL_COPY_WRITE_BUFFER, self.drawBufferCapacity * rangeSize, None, GL_STREAM_DRAW)
+            BufferPool.resizeBuffer(oldCapacity * rangeSize, self.drawBufferCapacity * rangeSize)
+
+        glBindBuffer(GL_COPY_WRITE_BUFFER, 0)
+
+    def replaceBuffer(self, capacity: int, copyRanges: list):
+        """
+        Moves the vertices to a new buffer, the old buffer is deleted
+
+        Parameters
+        ----------
+        capacity : int
+            The amount of vertices of the new buffer
+
+        copyRanges : list
+            A list containing (old first vertex, new first vertex, vertex count) tuples of the vertices to keep
+
+        Returns
+        -------
+        None
+        """
+
+        vbo = BufferPool.createBuffer(capacity * self.vertexSize)
+
+        glBindBuffer(GL_COPY_READ_BUFFER, self.vbo)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, vbo)
+
+        for oldFirst, newFirst, vertexCount in copyRanges:
+            glCopyBufferSubData(
+                GL_COPY_READ_BUFFER,
+                GL_COPY_WRITE_BUFFER,
+                oldFirst * self.vertexSize,
+                newFirst * self.vertexSize,
+                vertexCount * self.vertexSize
+            )
+
+        glBindBuffer(GL_COPY_READ_BUFFER, 0)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, 0)
+
+        BufferPool.deleteBuffer(self.vbo, self.capacity * self.vertexSize)
+
+        self.vbo = vbo
+        self.capacity = capacity
+        self.setPointers()
+
+    def addFreeRange(self, first: int, vertexCount: int):
+        """
+        Adds a range to the freeRanges, joining it with the free ranges either side of it
+
+        Parameters
+        ----------
+        first : int
+            The first vertex of the range
+
+        vertexCount : int
+            The amount of vertices of the range
+
+        Returns
+        -------
+        None
+        """
+
+        index = bisect_left(self.freeRanges, (first, vertexCount))
+        self.freeRanges.insert(index, (first, vertexCount))
+
+        if index + 1 < len(self.freeRanges):
+            nextFirst, nextCount = self.freeRanges[index + 1]
+
+            if first + vertexCount == nextFirst:
+                vertexCount += nextCount
+                self.freeRanges[index] = (first, vertexCount)
+                del self.freeRanges[index + 1]
+
+        if index > 0:
+            previousFirst, previousCount = self.freeRanges[index - 1]
+
+            if previousFirst + previousCount == first:
+                self.freeRanges[index - 1] = (previousFirst, previousCount + vertexCount)
+                del self.freeRanges[index]
+
+    def grow(self, vertexCount: int):
+        """
+        Doubles the capacity of the buffer, or more until a range of vertexCount fits at the end
+
+        Parameters
+        ----------
+        vertexCount : int
+            The amount of vertices that have to fit
+
+        Returns
+        -------
+        None
+        """
+
+        oldCapacity = self.capacity
+        capacity = max(oldCapacity * 2, oldCapacity + vertexCount)
+
+        self.replaceBuffer(capacity, [(0, 0, oldCapacity)])
+        self.addFreeRange(oldCapacity, capacity - oldCapacity)
+
+    def allocate(self, vertexCount: int):
+        """
+        Reserves a range for a mesh of vertexCount vertices from the first free range it fits in
+
+        Parameters
+        ----------
+        vertexCount : int
+            The amount of vertices of the mesh
+
+        Returns
+        -------
+        ArenaAllocation
+        """
+
+        # Whole Quads, with headroom so the range can be updated in place after small edits
+        capacity = max(-(-int(vertexCount * self.capacityHeadroom) // 4) * 4, 4)
+
+        for index, (first, freeCount) in enumerate(self.freeRanges):
+            if freeCount >= capacity:
+                break
+        else:
+            self.grow(capacity)
+            return self.allocate(vertexCount)
+
+        if freeCount == capacity:
+            del self.freeRanges[index]
+        else:
+            self.freeRanges[index] = (first + capacity, freeCount - capacity)
+
+        allocation = ArenaAllocation(first, capacity)
+        self.allocations.add(allocation)
+
+        return allocation
+
+    def free(self, allocation: ArenaAllocation):
+        """
+        Gives the range of a mesh back to the freeRanges
+
+        Parameters
+        ----------
+        allocation : ArenaAllocation
+            The range of the mesh
+
+        Returns
+        -------
+        None
+        """
+
+        self.allocations.discard(allocation)
+        self.usedVertexCount -= allocation.vertexCount
+        self.addFreeRange(allocation.first, allocation.capacity)
+
+    def upload(self, allocation, combinedData, surfaceQuadCounts=None, offset=(0, 0, 0)):
+        """
+        Uploads the Vertex Data of a mesh, it keeps its range when the data fits and isn't much smaller
+
+        Parameters
+        ----------
+        allocation : None/ArenaAllocation
+            The current range of the mesh, None when it doesn't have one
+
+        combinedData : np.ndarray
+            The Vertex Data in the vertexFormat
+
+        surfaceQuadCounts : None/np.ndarray
+            Keyword-Argument, the amount of Quads of each surface index when the Quads are grouped by it
+
+        offset : tuple
+            Keyword-Argument, the (X, Y, Z) added to the packed positions
+
+        Returns
+        -------
+        ArenaAllocation
+            The range of the mesh
+        """
+
+        combinedData = VBOHandler.prepareData(combinedData, self.vertexFormat)
+        vertexCount = len(combinedData)
+
+        if allocation and not vertexCount <= allocation.capacity < vertexCount * self.capacityHeadroom * 2:
+            self.free(allocation)
+            allocation = None
+
+        if not allocation:
+            allocation = self.allocate(vertexCount)
+        else:
+            self.usedVertexCount -= allocation.vertexCount
+
+        VBOHandler.reserveQuadIndices(vertexCount // 4)
+
+        if vertexCount:
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+            glBufferSubData(GL_ARRAY_BUFFER, allocation.first * self.vertexSize, combinedData.nbytes, combinedData)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        allocation.vertexCount = vertexCount
+        allocation.surfaceQuadCounts = surfaceQuadCounts
+        allocation.offset = offset
+
+        self.usedVertexCount += vertexCount
+
+        return allocation
+
+    @property
+    def fragmentedVertexCount(self):
+        """
+        The amount of free vertices between meshes, the free range at the end of the buffer isn't counted
+        """
+
+        fragmentedCount = sum(freeCount for first, freeCount in self.freeRanges)
+
+        if self.freeRanges and sum(self.freeRanges[-1]) == self.capacity:
+            fragmentedCount -= self.freeRanges[-1][1]
+
+        return fragmentedCount
+
+    def compact(self):
+        """
+        Moves every mesh to the start of a new buffer in order, so the free vertices are one range at the end
+        Meshes that are already next to each other are copied together
+
+        Returns
+        -------
+        None
+        """
+
+        copyRanges = []
+        nextFirst = 0
+
+        for allocation in sorted(self.allocations, key=lambda allocation: allocation.first):
+            if copyRanges and sum(copyRanges[-1][::2]) == allocation.first:
+                oldFirst, newFirst, vertexCount = copyRanges[-1]
+                copyRanges[-1] = (oldFirst, newFirst, vertexCount + allocation.capacity)
+            else:
+                copyRanges.append((allocation.first, nextFirst, allocation.capacity))
+
+            allocation.first = nextFirst
+            nextFirst += allocation.capacity
+
+        self.replaceBuffer(self.capacity, copyRanges)
+
+        self.freeRanges = [(nextFirst, self.capacity - nextFirst)] if nextFirst < self.capacity else []
+
+    def compactIfFragmented(self):
+        """
+        Compacts the buffer when more than the compactThreshold of it is free ranges between meshes
+
+        Returns
+        -------
+        bool
+            Whether the buffer was compacted
+        """
+
+        if self.fragmentedVertexCount <= self.capacity * self.compactThreshold:
+            return False
+
+        self.compact()
+
+        return True
+
+    def draw(self, meshDraws: list):
+        """
+        Draws the meshes, in the order given
+
+        Parameters
+        ----------
+        meshDraws : list
+            A list containing (ArenaAllocation, surfacesVisible) tuples, surfacesVisible is None to draw every Quad
+            or a bool for each surface index to skip the groups of surfaces which can't be seen
+
+        Returns
+        -------
+        None
+        """
+
+        drawRanges = [
+            (allocation, firstQuad, quadCount)
+            for allocation, surfacesVisible in meshDraws
+            if allocation.vertexCount
+            for firstQuad, quadCount in allocation.getDrawRanges(surfacesVisible)
+        ]
+
+        if not drawRanges:
+            return
+
+        glBindVertexArray(self.vao)
+
+        if self.indirectDraw:
+            shader = VBOHandler.getPackedShader()
+            shader.use()
+
+            # The offsets come from the meshOffset attribute instead
+            glUniform3f(shader.getUniformLocation("chunkOffset"), 0, 0, 0)
+            self.multiDrawIndirect(drawRanges)
+
+            shader.stop()
+        elif self.vertexFormat == "packed":
+            # The packed positions are relative to each mesh, so the meshes are drawn one by one after setting the offset
+            shader = VBOHandler.getPackedShader()
+            shader.use()
+            offsetLocation = shader.getUniformLocation("chunkOffset")
+
+            offsetAllocation = None
+
+            for allocation, firstQuad, quadCount in drawRanges:
+                if allocation is not offsetAllocation:
+                    glUniform3f(offsetLocation, *allocation.offset)
+                    offsetAllocation = allocation
+
+                glDrawElementsBaseVertex(
+                    GL_TRIANGLES, quadCount * 6, GL_UNSIGNED_INT, c_void_p(firstQuad * 6 * 4), allocation.first
+                )
+
+            shader.stop()
+        else:
+            self.multiDraw(drawRanges)
+
+        glBindVertexArray(0)
+
+    @staticmethod
+    def multiDraw(drawRanges: list):
+        """
+        Draws ranges of Quads of the bound VAO with one glMultiDrawElementsBaseVertex call
+
+        Parameters
+        ----------
+        drawRanges : list
+            A list containing (ArenaAllocation, first Quad, Quad count) tuples
+
+        Returns
+        -------
+        None
+        """
+
+        drawArray = np.array(
+            [(allocation.first, firstQuad, quadCount) for allocation, firstQuad, quadCount in drawRanges],
+            dtype=np.int64
+        ).reshape(-1, 3)
+
+        # Each Quad has 6 uint32 indices in the shared element buffer, counted from the first vertex of the range
+        baseVertices = drawArray[:, 0].astype(np.int32)
+        indexOffsets = (drawArray[:, 1] * 6 * 4).astype(np.uintp)
+        indexCounts = (drawArray[:, 2] * 6).astype(np.int32)
+
+        glMultiDrawElementsBaseVertex(
+            GL_TRIANGLES, indexCounts, GL_UNSIGNED_INT, indexOffsets, len(drawArray), baseVertices
+        )
+
+    def multiDrawIndirect(self, drawRanges: list):
+        """
+        Draws ranges of Quads of the bound VAO with one glMultiDrawElementsIndirect call,
+        each range is an instance whose meshOffset is the offset of its mesh
+
+        Parameters
+        ----------
+        drawRanges : list
+            A list containing (ArenaAllocation, first Quad, Quad count) tuples
+
+        Returns
+        -------
+        None
+        """
+
+        rangeCount = len(drawRanges)
+        self.reserveDrawBuffers(rangeCount)
+
+        offsets = np.array([allocation.offset for allocation, firstQuad, quadCount in drawRanges], dtype=np.float32)
+
+        # (index count, instance count, first index, base vertex, base instance) of each range
+        commands = np.empty((rangeCount, 5), dtype=np.uint32)
+        commands[:, 0] = [quadCount * 6 for allocation, firstQuad, quadCount in drawRanges]
+        commands[:, 1] = 1
+        commands[:, 2] = [firstQuad * 6 for allocation, firstQuad, quadCount in drawRanges]
+        commands[:, 3] = [allocation.first for allocation, firstQuad, quadCount in drawRanges]
+        commands[:, 4] = np.arange(rangeCount)
+
+        glBindBuffer(GL_ARRAY_BUFFER, self.offsetBuffer)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, offsets.nbytes, offsets)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, self.commandBuffer)
+        glBufferSubData(GL_DRAW_INDIRECT_BUFFER, 0, commands.nbytes, commands)
+
+        glMultiDrawElementsIndirect(GL_TRIANGLES, GL_UNSIGNED_INT, None, rangeCount, 0)
+
+        glBindBuffer(GL_DRAW_INDIRECT_BUFFER, 0)
+
+    def delete(self):
+        """
+        Deletes the buffer and VAO of the arena
+
+        Returns
+        -------
+        None
+        """
+
+        glDeleteVertexArrays(1, [self.vao])
+        VBOHandler.liveVertexArrayCount -= 1
+
+        BufferPool.deleteBuffer(self.vbo, self.capacity * self.vertexSize)
+
+        if self.offsetBuffer is not None:
+            BufferPool.deleteBuffer(self.offsetBuffer, self.drawBufferCapacity * 3 * 4)
+            BufferPool.deleteBuffer(self.commandBuffer, self.drawBufferCapacity * 5 * 4)
+
+            self.offsetBuffer = None
+            self.commandBuffer = None
+            self.drawBufferCapacity = 0
+
+        self.allocations.clear()
+        self.freeRanges = []
+        self.usedVertexCount = 0
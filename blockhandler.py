@@ -19,6 +19,8 @@ class Block:
     """
     This Class handle a single block in minecraft
 
+    Chunks only store the Block Type of each block, a Block is created as a view when it is needed (highlighting, editing)
+
     Parameters
     ----------
     centre : Vector3
@@ -55,22 +57,25 @@ class Block:
     vertices: list
         Contains a list of Vector3 Vertices of the block, all relative to the centre point
 
-    edges : list
-        Contains a list of tuple which each contain a tuple which refers to two vertex of the block, hence making a edge
+    edges : tuple
+        Class Attribute, contains tuples which each refer to two vertex of the block, hence making a edge
 
-    normals : list
-        Contains a list of Vector3 used for light diffraction, based on the orientation of the surface
+    normals : tuple
+        Class Attribute, contains Vector3 used for light diffraction, based on the orientation of the surface
 
-    surfaces : list
-        Contains a list of tuple of length 4 which contain the indexes to the Vertex of the cube
+    surfaces : tuple
+        Class Attribute, contains tuples of length 4 which contain the indexes to the Vertex of the cube
         4 indexes referring to a vertex on the block in order
 
+    vertexOffsets : tuple
+        Class Attribute, contains the direction of each vertex from the centre of the block
+
     surfaceMiddle : list
         Originally contains a empty list
         After generation stores Vector3's which are the centre point of each face respective to the centre of the block
 
-    surfaceEdgeLinker : list
-        Contains a list of tuple with length 2
+    surfaceEdgeLinker : tuple
+        Class Attribute, contains tuples with length 2
         Each refer to the index of the surfaces tuple
 
     surfacesShow : list
@@ -78,74 +83,85 @@ class Block:
         Boolean values refer to whether that surfaces should be drawn
     """
 
-    def __init__(self, centre: Vector3, blockType: enums.BlockType, sideLength=None):
-        if sideLength:
-            self.side = sideLength
-        else:
-            self.side = 1
-        self.halfSide = self.side / 2
+    edges = (
+        (0, 3),
+        (0, 5),
+        (0, 7),
 
-        self.blockType = blockType
-        self.blockPosChunk = Vector3(0, 0, 0)
+        (1, 3),
+        (1, 4),
+        (1, 7),
 
-        self.parentChunk = None
+        (2, 4),
+        (2, 5),
+        (2, 7),
 
-        self.closestSurface = None
+        (3, 6),
 
-        self.centre = centre
-        self.vertices = [
-            Vector3(centre.X - self.halfSide, centre.Y + self.halfSide, centre.Z + self.halfSide),  # 0
-            Vector3(centre.X + self.halfSide, centre.Y - self.halfSide, centre.Z + self.halfSide),  # 1
-            Vector3(centre.X + self.halfSide, centre.Y + self.halfSide, centre.Z - self.halfSide),  # 2
+        (4, 6),
 
-            Vector3(centre.X - self.halfSide, centre.Y - self.halfSide, centre.Z + self.halfSide),  # 3
-            Vector3(centre.X + self.halfSide, centre.Y - self.halfSide, centre.Z - self.halfSide),  # 4
-            Vector3(centre.X - self.halfSide, centre.Y + self.halfSide, centre.Z - self.halfSide),  # 5
+        (5, 6),
+    )
 
-            Vector3(centre.X - self.halfSide, centre.Y - self.halfSide, centre.Z - self.halfSide),  # 6
-            Vector3(centre.X + self.halfSide, centre.Y + self.halfSide, centre.Z + self.halfSide),  # 7
-        ]
-        # Checking If Two Operators are the same.
-        self.edges = [
-            (0, 3),
-            (0, 5),
-            (0, 7),
+    normals = (
+        Vector3(0, 1, 0),
+        Vector3(0, -1, 0),
 
-            (1, 3),
-            (1, 4),
-            (1, 7),
+        Vector3(0, 0, 1),
+        Vector3(0, 0, -1),
 
-            (2, 4),
-            (2, 5),
-            (2, 7),
+        Vector3(-1, 0, 0),
+        Vector3(1, 0, 0),
+    )
 
-            (3, 6),
+    surfaces = (
+        (0, 7, 2, 5),  # Top
+        (1, 3, 6, 4),  # Bottom
 
-            (4, 6),
+        (0, 7, 1, 3),  # Back
+        (2, 4, 6, 5),  # Front
 
-            (5, 6),
-        ]
+        (0, 3, 6, 5),  # Left
+        (1, 4, 2, 7),  # Right
+    )
 
-        self.normals = [
-            Vector3(0, 1, 0),
-            Vector3(0, -1, 0),
+    # Direction of each Vertex from the Centre, multiplied by the halfSide
+    vertexOffsets = (
+        (-1, 1, 1),  # 0
+        (1, -1, 1),  # 1
+        (1, 1, -1),  # 2
 
-            Vector3(0, 0, 1),
-            Vector3(0, 0, -1),
+        (-1, -1, 1),  # 3
+        (1, -1, -1),  # 4
+        (-1, 1, -1),  # 5
 
-            Vector3(-1, 0, 0),
-            Vector3(1, 0, 0),
-        ]
+        (-1, -1, -1),  # 6
+        (1, 1, 1),  # 7
+    )
 
-        self.surfaces = [
-            (0, 7, 2, 5),  # Top
-            (1, 3, 6, 4),  # Bottom
+    surfaceEdgeLinker = ((0, 1), (1, 2), (2, 3), (3, 0))
 
-            (0, 7, 1, 3),  # Back
-            (2, 4, 6, 5),  # Front
+    def __init__(self, centre: Vector3, blockType: enums.BlockType, sideLength=None):
+        if sideLength:
+            self.side = sideLength
+        else:
+            self.side = 1
+        self.halfSide = self.side / 2
+
+        self.blockType = blockType
+        self.blockPosChunk = Vector3(0, 0, 0)
+
+        self.parentChunk = None
+
+        self.closestSurface = None
 
-            (0, 3, 6, 5),  # Left
-            (1, 4, 2, 7),  # Right
+        self.centre = centre
+        self.vertices = [
+            Vector3(
+                centre.X + offsetX * self.halfSide,
+                centre.Y + offsetY * self.halfSide,
+                centre.Z + offsetZ * self.halfSide
+            ) for offsetX, offsetY, offsetZ in self.vertexOffsets
         ]
 
         self.surfaceMiddle = [
@@ -158,8 +174,6 @@ class Block:
 
         self.genMiddleSurface()
 
-        self.surfaceEdgeLinker = [(0, 1), (1, 2), (2, 3), (3, 0)]
-
         self.surfacesShow = [
             True,
             True,
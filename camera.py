@@ -136,9 +136,9 @@ class Camera:
         else:
             glRotatef(self.deltaVector.X, 0.0, 1.0, 0.0)
 
-    def moveCamera(self, dt: float, moveConstraints: dict):
+    def getMoveDelta(self, dt: float):
         """
-        Handles the Turning of the Camera
+        Works out the move of the Camera from the pressed keys
 
         Parameters
         ----------
@@ -147,7 +147,8 @@ class Camera:
 
         Returns
         -------
-        None
+        Vector3
+            The world space move of the Camera
         """
 
         directionalXVector = Vector3(
@@ -166,36 +167,30 @@ class Camera:
         directionalXVector = directionalXVector.unit * frameDistance
         directionalZVector = directionalZVector.unit * frameDistance
 
-        moveVector = Vector3(0, 0, 0)
+        moveDelta = Vector3(0, 0, 0)
         keysPressed = key.get_pressed()
 
-        if keysPressed[K_w] and not moveConstraints["w"]:
-            self.currentCameraPosition -= directionalXVector
-            moveVector.Z += frameDistance
+        if keysPressed[K_w]:
+            moveDelta -= directionalXVector
 
-        if keysPressed[K_s] and not moveConstraints["s"]:
-            self.currentCameraPosition += directionalXVector
-            moveVector.Z -= frameDistance
+        if keysPressed[K_s]:
+            moveDelta += directionalXVector
 
-        if keysPressed[K_a] and not moveConstraints["a"]:
-            self.currentCameraPosition += directionalZVector
-            moveVector.X += frameDistance
+        if keysPressed[K_a]:
+            moveDelta += directionalZVector
 
-        if keysPressed[K_d] and not moveConstraints["d"]:
-            self.currentCameraPosition -= directionalZVector
-            moveVector.X -= frameDistance
+        if keysPressed[K_d]:
+            moveDelta -= directionalZVector
 
-        if keysPressed[K_q] and not moveConstraints["q"]:
-            self.currentCameraPosition.Y -= frameDistance
-            moveVector.Y += frameDistance
+        if keysPressed[K_q]:
+            moveDelta.Y -= frameDistance
 
-        if keysPressed[K_e] and not moveConstraints["e"]:
-            self.currentCameraPosition.Y += frameDistance
-            moveVector.Y -= frameDistance
+        if keysPressed[K_e]:
+            moveDelta.Y += frameDistance
 
-        glTranslatef(*moveVector.tuple)
+        return moveDelta
 
-    def move(self, dt, viewMatrix, moveConstraints):
+    def move(self, dt, viewMatrix, clipMove=None):
         """
         Controls the Movement of the Camera
 
@@ -207,6 +202,9 @@ class Camera:
         viewMatrix : OpenGL.arrays.ctypesarrays.c_float_Array_4_Array_4
             Used to transform from world-space into view-space
 
+        clipMove : None/function
+            Keyword-Argument, takes the world space move of the Camera and returns the part of it that can be made
+
         Returns
         -------
         OpenGL.arrays.ctypesarrays.c_float_Array_4_Array_4
@@ -216,14 +214,21 @@ class Camera:
 
         self.turnCamera(True)
 
+        moveDelta = self.getMoveDelta(dt)
+
+        if clipMove:
+            moveDelta = clipMove(moveDelta)
+
+        self.currentCameraPosition += moveDelta
+
         glPushMatrix()
         glLoadIdentity()
 
-        self.moveCamera(dt, moveConstraints)
-
         self.turnCamera(False)
 
+        # The view matrix goes from world-space, so the world space move is applied before it
         glMultMatrixf(viewMatrix)
+        glTranslatef(*(moveDelta * -1).tuple)
         viewMatrix = glGetFloatv(GL_MODELVIEW_MATRIX)
 
         # apply view matrix
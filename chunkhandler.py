@@ -6,19 +6,21 @@ Class
 Chunk - This handle a single Chunk
 """
 
-from math import sqrt
 from random import randint
 from time import time
 
 import numpy as np
 import pygame.mouse as mouse
 
+import culling
 import enums
+import lod
+import terrain
 from blockhandler import Block
-from vbohandler import VBOHandler
+from errors import EditLogError
+from sectionhandler import Section
 from vector import Vector3
 
-colourHandler = enums.BlockColour()
 
 
 class Chunk:
@@ -36,6 +38,21 @@ class Chunk:
     noise : opensimplex.OpenSimplex
         The OpenSimplex noise, to make sure the noise data is the same across chunks.
 
+    greedyMeshing : bool
+        Keyword-Argument, whether the mesh merges adjacent surfaces into larger quads
+
+    vertexFormat : str
+        Keyword-Argument, "float" or "packed", the vertex layout of the Section VBOs
+
+    sectionHeight : None/int
+        Keyword-Argument, the height of each Section, when None the Chunk is a single Section
+
+    lodSkirts : bool
+        Keyword-Argument, whether the meshes of cells keep the surfaces on the sides of the Chunk
+
+    bufferArena : None/arenahandler.BufferArena
+        Keyword-Argument, the shared buffer the Section meshes are kept in, None gives each Section its own VBO
+
     Attributes
     ----------
     scale : int
@@ -56,6 +73,9 @@ class Chunk:
     minVector : Vector3
         The Minimum Point of the Chunk
 
+    chunkCoord : tuple
+        The (X, Z) integer Chunk Coordinate, the minVector divided by the size
+
     mouse0Debounce : bool
         Debounce for whether the the Left-Mouse Click is already Registered
 
@@ -74,12 +94,15 @@ class Chunk:
     mouse2Timeout : float
         Time before the Debounce of the Right-Mouse Click Ends
 
-    blocks : list
-        A empty list originally
-        After generation, is a triple layer nested list. The first state is the Y, then X, then Z
+    blocks : np.ndarray
+        A empty array originally
+        After generation, is a uint8 array of the Block Type values. The first axis is the Y, then X, then Z
 
-    blocksCanSee : list
-        A list containing Block(s) that can be seen.
+    surfacesShow : np.ndarray
+        A bool array with the shape (6, Y, X, Z), whether each surface of each block should be drawn
+
+    blocksCanSee : np.ndarray
+        A bool array with the shape (Y, X, Z), whether any surface of each block can be seen.
 
     adjacentBlockData : list
         A list containing Vector3 that are relative to the surfaces on the Block class
@@ -99,12 +122,47 @@ class Chunk:
     highlightedSurfaceIndex : None/int
         The Surface Index of the Highlighted Surface
 
-    chunkVBO : vbohandler.VBOHandler
-        A VBO (Vector Buffer Object) of the chunk to make drawing fast.
+    greedyMeshing : bool
+        Whether genChunkVBO merges adjacent surfaces of the same Block Type and direction into larger quads
+
+    vertexFormat : str
+        "float" for 36 byte position/colour/normal vertices or "packed" for 8 byte chunk space vertices
+
+    sectionHeight : int
+        The height of each Section
+
+    sections : list
+        A list containing the Section(s) of the Chunk from the bottom up, each Section has its own mesh
+
+    bufferArena : None/arenahandler.BufferArena
+        The shared buffer the Section meshes are kept in, None when each Section has its own VBO
+
+    lodFactor : int
+        The size in blocks of the cells the Section meshes are built from, 1 for full detail
+
+    lodSkirts : bool
+        Whether the meshes of cells keep the surfaces on the sides of the Chunk,
+        so there are no gaps where the adjacent Chunk has a different lodFactor
+
+    boundingBox : np.ndarray
+        A float array with the shape (2, 3) of the lowest and highest corner the Blocks of the Chunk fill
+
+    saveDirty : bool
+        Whether the Blocks changed since they were last saved to or loaded from a Region File
+
+    blockEdits : list
+        A list containing the (x, y, z, Block Type value) of the Block edits not yet saved to the Edit Log
+
+    surfaceVersion : int
+        Counts the surface updates done on the render thread, so older worker meshes can be dropped
+
+    meshRequest : int
+        Counts the worker mesh requests, only the latest one is uploaded
 
     """
 
-    def __init__(self, bottomCentre: Vector3, size: Vector3, noise):
+    def __init__(self, bottomCentre: Vector3, size: Vector3, noise, greedyMeshing=False, vertexFormat="float",
+                 sectionHeight=None, lodSkirts=True, bufferArena=None):
         self.scale = 200
 
         self.size = size
@@ -124,6 +182,12 @@ class Chunk:
             self.halfSize.Z,
         )
 
+        self.chunkCoord = (int(self.minVector.X // self.size.X), int(self.minVector.Z // self.size.Z))
+
+        # The blocks are centred on the integer positions, so the box is half a block below the minVector
+        meshOffset = np.array(self.getMeshOffset())
+        self.boundingBox = np.array([meshOffset, meshOffset + self.size.list])
+
         self.mouse0Debounce = False
         self.mouse2Debounce = False
 
@@ -133,8 +197,9 @@ class Chunk:
         self.mouse0Timeout = 0.1
         self.mouse2Timeout = 0.1
 
-        self.blocks = np.array([], dtype=Block)
-        self.blocksCanSee = np.array([])
+        self.blocks = np.array([], dtype=np.uint8)
+        self.surfacesShow = np.array([], dtype=bool)
+        self.blocksCanSee = np.array([], dtype=bool)
 
         self.noise = noise
 
@@ -166,82 +231,268 @@ class Chunk:
         self.highlightedBlock = None
         self.highlightedSurfaceIndex = None
 
-        self.chunkVBO = None
+        self.greedyMeshing = greedyMeshing
+        self.vertexFormat = vertexFormat
+        self.bufferArena = bufferArena
+
+        self.lodFactor = 1
+        self.lodSkirts = lodSkirts
+
+        self.saveDirty = True
+        self.blockEdits = []
+        self.surfaceVersion = 0
+        self.meshRequest = 0
+
+        self.sectionHeight = sectionHeight or self.size.Y
+        self.sections = [
+            Section(self, yStart, min(yStart + self.sectionHeight, self.size.Y))
+            for yStart in range(0, self.size.Y, self.sectionHeight)
+        ]
 
     def generateBlocks(self):
         """
-        Generates the Blocks for the self.blocks
+        Generates the Blocks for the self.blocks from a Heightmap computed once per Chunk
+        Sections above the Heightmap are left as Air
 
         Returns
         -------
         None
         """
 
-        rangeValues = [-sqrt(2) / 2, sqrt(2) / 2]
+        self.setBlocks(terrain.generateChunkBlocks(self.noise, *self.getGenerationArgs()))
 
-        self.blocks = np.zeros(self.size.tuple, dtype=Block)
-        for y in range(self.size.Y):
-            #self.blocks.append([])
+    def getGenerationArgs(self):
+        """
+        Gets the arguments after the noise for terrain.generateChunkBlocks
 
-            for x in range(self.size.X):
-                #self.blocks[y].append([])
+        Returns
+        -------
+        tuple
+            (minX, minZ, sizeX, sizeY, sizeZ, scale, sectionHeight)
+        """
 
-                for z in range(self.size.Z):
-                    newPos = Vector3(x - self.halfSize.X + self.bottomCentre.X, y, z - self.halfSize.Z + self.bottomCentre.Z)
+        return (
+            self.bottomCentre.X - self.halfSize.X,
+            self.bottomCentre.Z - self.halfSize.Z,
+            self.size.X,
+            self.size.Y,
+            self.size.Z,
+            self.scale,
+            self.sectionHeight
+        )
+
+    def setBlocks(self, blocks: np.ndarray):
+        """
+        Sets the Blocks of the Chunk, the surfaces are cleared until they are updated
+
+        Parameters
+        ----------
+        blocks : np.ndarray
+            A uint8 array of Block Type values with the shape (Y, X, Z)
+
+        Returns
+        -------
+        None
+        """
+
+        self.blocks = blocks
+        self.surfacesShow = np.zeros((6, self.size.Y, self.size.X, self.size.Z), dtype=bool)
+        self.blocksCanSee = np.zeros((self.size.Y, self.size.X, self.size.Z), dtype=bool)
+
+        for section in self.sections:
+            section.updateFlags()
+
+    def getBlockCentre(self, x: int, y: int, z: int):
+        """
+        Gets the Centre of a Block in the World from its Position in the Chunk
+
+        Parameters
+        ----------
+        x : int
+            X Position of the Block in the Chunk
+
+        y : int
+            Y Position of the Block in the Chunk
+
+        z : int
+            Z Position of the Block in the Chunk
+
+        Returns
+        -------
+        Vector3
+        """
 
-                    maxSolidPoint = self.noise.noise2d(x=newPos.X / self.scale, y=newPos.Z / self.scale) + rangeValues[1]
-                    maxSolidPoint *= self.size.Y / (rangeValues[1] * 2)
-                    maxSolidPoint = int(maxSolidPoint)
+        return Vector3(x - self.halfSize.X + self.bottomCentre.X, y, z - self.halfSize.Z + self.bottomCentre.Z)
 
-                    blockType = enums.BlockType.AIR
-                    if y == maxSolidPoint:
-                        blockType = enums.BlockType.GRASS
-                    elif 0 < y < maxSolidPoint:
-                        blockType = enums.BlockType.DIRT
-                    elif y == 0:
-                        blockType = enums.BlockType.STONE
+    def getBlockType(self, blockPos: Vector3):
+        """
+        Gets the Block Type at a Position in the Chunk
 
-                    newBlock = Block(
-                        newPos,
-                        blockType,
-                        sideLength=1
-                    )
+        Parameters
+        ----------
+        blockPos : Vector3
+            Position of the Block in the Chunk
 
-                    newBlock.parentChunk = self
-                    newBlock.blockPosChunk = Vector3(x, y, z)
+        Returns
+        -------
+        enums.BlockType
+        """
+
+        return enums.BlockType(int(self.blocks[blockPos.Y, blockPos.X, blockPos.Z]))
+
+    def setBlockType(self, blockPos: Vector3, blockType: enums.BlockType):
+        """
+        Sets the Block Type at a Position in the Chunk
+
+        Parameters
+        ----------
+        blockPos : Vector3
+            Position of the Block in the Chunk
+
+        blockType : enums.BlockType
+            The new Block Type
+
+        Returns
+        -------
+        None
+        """
+
+        self.blocks[blockPos.Y, blockPos.X, blockPos.Z] = blockType.value
+        self.saveDirty = True
+
+    def recordEdit(self, blockPos: Vector3, blockType: enums.BlockType):
+        """
+        Records a Block edit made by the player, to be saved to the Edit Log
+
+        Parameters
+        ----------
+        blockPos : Vector3
+            Position of the Block in the Chunk
+
+        blockType : enums.BlockType
+            The new Block Type
+
+        Returns
+        -------
+        None
+        """
+
+        if not all(0 <= num < self.size.tuple[numI] for numI, num in enumerate(blockPos.tuple)):
+            raise EditLogError(f"Edit at {blockPos} is outside the Chunk")
+
+        self.blockEdits.append((blockPos.X, blockPos.Y, blockPos.Z, blockType.value))
+
+    def replayEdits(self, edits: list):
+        """
+        Sets the Blocks of saved edits on top of the generated Blocks
+
+        Parameters
+        ----------
+        edits : list
+            A list containing (x, y, z, Block Type value) tuples
+
+        Returns
+        -------
+        None
+        """
+
+        if not edits:
+            return
+
+        x, y, z, blockTypes = np.array(edits, dtype=np.int64).T
+
+        self.blocks[y, x, z] = blockTypes
+
+        for section in self.sections:
+            section.updateFlags()
+
+    def getBlock(self, x: int, y: int, z: int):
+        """
+        Creates a Block view of a Position in the Chunk, used for highlighting and editing
+
+        Parameters
+        ----------
+        x : int
+            X Position of the Block in the Chunk
+
+        y : int
+            Y Position of the Block in the Chunk
+
+        z : int
+            Z Position of the Block in the Chunk
+
+        Returns
+        -------
+        Block
+        """
+
+        block = Block(
+            self.getBlockCentre(x, y, z),
+            enums.BlockType(int(self.blocks[y, x, z])),
+            sideLength=1
+        )
 
-                    self.blocks[y][x][z] = newBlock
+        block.parentChunk = self
+        block.blockPosChunk = Vector3(x, y, z)
+        block.surfacesShow = self.surfacesShow[:, y, x, z].tolist()
+
+        return block
+
+    def getSection(self, y: int):
+        """
+        Gets the Section which contains a Y Position in the Chunk
+
+        Parameters
+        ----------
+        y : int
+            Y Position of the Block in the Chunk
+
+        Returns
+        -------
+        Section
+        """
+
+        return self.sections[y // self.sectionHeight]
 
     def genChunkVBO(self):
         """
-        Generates the VBO's for the Chunk
+        Generates the VBO's of every Section of the Chunk, an existing VBO is updated in place
 
         Returns
         -------
         None
         """
 
-        combinedChunkData = []
-        self.chunkVBO = None
+        lodSurfaces = self.getLodSurfaces() if self.lodFactor != 1 else None
+
+        for section in self.sections:
+            section.genVBO(lodSurfaces)
+
+    def getLodSurfaces(self):
+        """
+        Gets the surfaces and Block Types of the cells the whole Chunk is meshed from at its lodFactor,
+        worked out once for the Chunk and sliced by each Section
 
-        for block in self.blocksCanSee:
-            for i, surfaceSee in enumerate(block.surfacesShow):
-                if not surfaceSee:
-                    continue
+        Returns
+        -------
+        tuple
+            (cellSurfaces, cellBlocks) from lod.buildLodSurfaces
+        """
 
-                blockQuad = block.surfaces[i]
-                normal = block.normals[i]
-                colour = colourHandler.get(block.blockType)
+        return lod.buildLodSurfaces(self.blocks, self.getAdjacentBlocks(), self.lodFactor, self.lodSkirts)
 
-                surfacesList = [block.vertices[blockVertex] for blockVertex in blockQuad]
+    def getMeshOffset(self):
+        """
+        Gets the Position of the Chunk's mesh origin, the lowest corner of the first block
 
-                for vector3 in surfacesList:
-                    combined = vector3.list + colour.RGBList + normal.list
+        Returns
+        -------
+        tuple
+        """
 
-                    for comb in combined:
-                        combinedChunkData.append(comb)
+        firstCentre = self.getBlockCentre(0, 0, 0)
 
-        self.chunkVBO = VBOHandler(combinedChunkData)
+        return firstCentre.X - 0.5, firstCentre.Y - 0.5, firstCentre.Z - 0.5
 
     def linkChunk(self, adjacentChunkData, cornerChunkData):
         """
@@ -260,6 +511,20 @@ class Chunk:
         self.adjacentChunks = adjacentChunkData
         self.cornerChunks = cornerChunkData
 
+    def getAdjacentBlocks(self):
+        """
+        Gets the Block Type arrays of the adjacent Chunks
+
+        Returns
+        -------
+        dict
+            A (X, Z) offset tuple: Block Type array, or None when there is no Chunk
+        """
+
+        return {
+            (offset.X, offset.Z): chunk.blocks if chunk else None for offset, chunk in self.adjacentChunks.items()
+        }
+
     def updateAllSurface(self):
         """
         Updates All Surfaces of each Block inside the self.Blocks, to see whether a surface should be visible or not
@@ -269,135 +534,167 @@ class Chunk:
         None
         """
 
-        self.blocksCanSee = []
-        for yI, yList in enumerate(self.blocks):
-            for xI, xList in enumerate(yList):
-                for bI, block in enumerate(xList):
-                    self.updateBlockSurfaces(block)
+        for section in self.sections:
+            section.updateFlags()
+            section.updateConnectivity()
+
+        self.updateSectionSurfaces(self.sections)
 
-    def updateBlockSurfaces(self, block):
+    def updateSectionSurfaces(self, sections: list):
         """
-        Updates A Single Block's Surfaces and can either Add or Remove them from self.blocksCanSee
+        Updates the Surfaces of the Sections, Sections which can't have a visible surface are skipped
 
         Parameters
         ----------
-        block : Block
-            A Block which should be inside the self.blocks
+        sections : list
+            A list containing the Section(s) to update
 
         Returns
         -------
         None
         """
 
-        pos = block.blockPosChunk
-        skip = False
+        self.surfaceVersion += 1
 
-        if block.blockType == enums.BlockType.AIR:
-            block.surfacesShow = [False] * 6
-            skip = True
+        solidMask = culling.buildSolidMask(self.blocks, self.getAdjacentBlocks())
 
-        for i, adjacentBlockCoordAdjust in enumerate(self.adjacentBlockData):
-            if skip:
-                break
+        for section in sections:
+            layers = np.s_[section.yStart:section.yEnd]
 
-            adjustCoord = pos + adjacentBlockCoordAdjust
+            if section.canSkipCulling(solidMask):
+                self.surfacesShow[:, layers] = False
+            else:
+                self.surfacesShow[:, layers] = culling.cullSolidMask(solidMask, section.yStart, section.yEnd)
 
-            adjacentBlock = None
+            self.blocksCanSee[layers] = self.surfacesShow[:, layers].any(axis=0)
 
-            if not (any(map(lambda num: num < 0, adjustCoord.tuple)) or
-                    any([num >= self.size.tuple[numI] for numI, num in enumerate(adjustCoord.tuple)])):
-                adjacentBlock = self.blocks[adjustCoord.Y][adjustCoord.X][adjustCoord.Z]
-            else:
-                # Look in the Adjacent Chunk
-                offsetCoord = [
-                    (num if not num >= self.size.tuple[numI] else 1)
-                    if not 0 < num < self.size.tuple[numI] else 0 for numI, num in enumerate(adjustCoord.tuple)
-                ]
-                offsetCoord = Vector3(*offsetCoord)
-
-                if offsetCoord.Y == 0:
-                    adjacentChunk = self.adjacentChunks[offsetCoord]
-                    #print(offsetCoord)
-                    if adjacentChunk:
-                        newCoord = Vector3(*adjustCoord.tuple)
-
-                        if newCoord.X >= self.size.X:
-                            newCoord.X = 0
-                        elif newCoord.X < 0:
-                            newCoord.X = self.size.X - 1
-
-                        if newCoord.Z >= self.size.Z:
-                            newCoord.Z = 0
-                        elif newCoord.Z < 0:
-                            newCoord.Z = self.size.Z - 1
-
-                        adjacentBlock = adjacentChunk.blocks[newCoord.Y][newCoord.X][newCoord.Z]
-
-            if adjacentBlock:
-                if adjacentBlock.blockType == enums.BlockType.AIR:
-                    block.surfacesShow[i] = True
-                else:
-                    block.surfacesShow[i] = False
+    def updateBorderSurfaces(self):
+        """
+        Updates the Surfaces after an adjacent Chunk was loaded or unloaded
+        Only the Sections with changed Surfaces are marked for remeshing
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.blocks.size:
+            return
+
+        oldSurfacesShow = self.surfacesShow.copy()
+
+        self.updateSectionSurfaces(self.sections)
+
+        for section in self.sections:
+            layers = np.s_[:, section.yStart:section.yEnd]
+
+            if (oldSurfacesShow[layers] != self.surfacesShow[layers]).any():
+                section.meshDirty = True
+
+    def applyMeshes(self, surfacesShow: np.ndarray, sectionMeshes: list, sectionConnectivity: list):
+        """
+        Sets the Surfaces and uploads the Section meshes built away from the Chunk, by chunkworker.buildChunkMeshes
+
+        Parameters
+        ----------
+        surfacesShow : np.ndarray
+            A bool array with the shape (6, Y, X, Z)
+
+        sectionMeshes : list
+            The (combinedData, surfaceQuadCounts) of each Section, None for the Sections without any surfaces
+
+        sectionConnectivity : list
+            The (6, 6) faceConnectivity of each Section
+
+        Returns
+        -------
+        None
+        """
+
+        self.surfacesShow = surfacesShow
+        self.blocksCanSee = surfacesShow.any(axis=0)
+
+        for section, sectionMesh, faceConnectivity in zip(self.sections, sectionMeshes, sectionConnectivity):
+            if sectionMesh is None:
+                section.uploadMesh(None)
             else:
-                block.surfacesShow[i] = True
+                section.uploadMesh(*sectionMesh)
+
+            section.faceConnectivity = faceConnectivity
+
+    def canSeeBlock(self, x: int, y: int, z: int):
+        """
+        Checks whether any surface of the block at a Position in the Chunk can be seen
+
+        Parameters
+        ----------
+        x : int
+            X Position of the Block in the Chunk
+
+        y : int
+            Y Position of the Block in the Chunk
+
+        z : int
+            Z Position of the Block in the Chunk
+
+        Returns
+        -------
+        bool
+        """
 
-        if any(block.surfacesShow) and (block not in self.blocksCanSee):
-            self.blocksCanSee = np.append(self.blocksCanSee, [block])
+        return bool(self.blocksCanSee[y, x, z])
 
-            #self.blocksCanSee.append(block)
+    def getBlocksCanSee(self):
+        """
+        Gets the Positions of the blocks that can be seen, ordered by Y, then X, then Z
 
-        elif not any(block.surfacesShow) and (block in self.blocksCanSee):
-            self.blocksCanSee = np.delete(self.blocksCanSee, np.where(self.blocksCanSee == block))
+        Returns
+        -------
+        list
+            A list containing (Y, X, Z) tuples
+        """
 
-            #self.blocksCanSee.remove(block)
+        return [tuple(blockPos) for blockPos in np.argwhere(self.blocksCanSee).tolist()]
 
-    def updateSurfacesAroundBlock(self, block):
+    def updateSurfacesAroundBlock(self, pos: Vector3):
         """
-        Applies the self.updateBlockSurfaces for the adjacent Blocks around the block Parameter
+        Updates the Surfaces after the block at the Position changed, including the adjacent Chunk it borders
+        Only the Sections with changed Surfaces are updated and marked for remeshing
 
         Parameters
         ----------
-        block : Block
-            The Block in which the adjacent Blocks should be Updated
+        pos : Vector3
+            Position of the Block in the Chunk which changed
 
         Returns
         -------
         None
         """
 
-        pos = block.blockPosChunk
+        self.getSection(pos.Y).updateFlags()
+        self.getSection(pos.Y).updateConnectivity()
 
-        for i, adjacentBlockCoordAdjust in enumerate(self.adjacentBlockData):
-            adjustCoord = pos + adjacentBlockCoordAdjust
+        changedSections = []
 
-            if not (any(map(lambda num: num < 0, adjustCoord.tuple)) or
-                    any([num >= self.size.tuple[numI] for numI, num in enumerate(adjustCoord.tuple)])):
-                self.updateBlockSurfaces(self.blocks[adjustCoord.Y][adjustCoord.X][adjustCoord.Z])
-            else:
-                # Look in the Adjacent Chunk
-                offsetCoord = [
-                    (num if not num >= self.size.tuple[numI] else 1)
-                    if not 0 < num < self.size.tuple[numI] else 0 for numI, num in enumerate(adjustCoord.tuple)
-                ]
-                offsetCoord = Vector3(*offsetCoord)
-
-                if offsetCoord.Y == 0:
-                    adjacentChunk = self.adjacentChunks[offsetCoord]
-                    #print(offsetCoord)
-                    if adjacentChunk:
-                        newCoord = Vector3(*adjustCoord.tuple)
-
-                        if newCoord.X >= self.size.X:
-                            newCoord.X = 0
-                        elif newCoord.X < 0:
-                            newCoord.X = self.size.X - 1
-
-                        if newCoord.Z >= self.size.Z:
-                            newCoord.Z = 0
-                        elif newCoord.Z < 0:
-                            newCoord.Z = self.size.Z - 1
-
-                        adjacentChunk.updateBlockSurfaces(adjacentChunk.blocks[newCoord.Y][newCoord.X][newCoord.Z])
+        for y in (pos.Y - 1, pos.Y, pos.Y + 1):
+            if 0 <= y < self.size.Y and self.getSection(y) not in changedSections:
+                changedSections.append(self.getSection(y))
+
+        self.updateSectionSurfaces(changedSections)
+
+        for section in changedSections:
+            section.meshDirty = True
+
+        for offset, adjacentChunk in self.adjacentChunks.items():
+            if not adjacentChunk:
+                continue
+
+            if (offset.X == -1 and pos.X == 0) or (offset.X == 1 and pos.X == self.size.X - 1) or \
+                    (offset.Z == -1 and pos.Z == 0) or (offset.Z == 1 and pos.Z == self.size.Z - 1):
+                adjacentSection = adjacentChunk.getSection(pos.Y)
+
+                adjacentChunk.updateSectionSurfaces([adjacentSection])
+                adjacentSection.meshDirty = True
 
     def isPointInChunk(self, point: Vector3, isList=False):
         #print(minVector, "||", maxVector)
@@ -406,16 +703,35 @@ class Chunk:
 
         return self.minVector.X <= point.X < self.maxVector.X and self.minVector.Y <= point.Y <= self.maxVector.Y and self.minVector.Z <= point.Z < self.maxVector.Z
 
-    def draw(self):
+    def draw(self, cameraPosition=None):
         """
         Draws the Blocks which can be Seen
 
+        Parameters
+        ----------
+        cameraPosition : None/tuple
+            Keyword-Argument, the (X, Y, Z) of the camera to skip the surfaces facing away from it,
+            None draws every surface
+
+        Returns
+        -------
+        None
+        """
+
+        for section in self.sections:
+            section.draw(cameraPosition)
+
+    def delete(self):
+        """
+        Deletes the VBO's of the Chunk
+
         Returns
         -------
         None
         """
 
-        if self.chunkVBO: self.chunkVBO.draw()
+        for section in self.sections:
+            section.delete()
 
     def removeBlock(self, block: Block):
         """
@@ -431,12 +747,10 @@ class Chunk:
         None
         """
 
-        self.highlightedBlock.blockType = enums.BlockType.AIR
+        self.setBlockType(block.blockPosChunk, enums.BlockType.AIR)
+        self.recordEdit(block.blockPosChunk, enums.BlockType.AIR)
 
-        self.updateBlockSurfaces(block)
-        self.updateSurfacesAroundBlock(block)
-        self.genChunkVBO()
-        self.updateVBOChunkAdjacent()
+        self.updateSurfacesAroundBlock(block.blockPosChunk)
 
     def addBlock(self, block: Block, surfaceIndex: int):
         """
@@ -457,36 +771,69 @@ class Chunk:
 
         addition = self.adjacentBlockData[surfaceIndex]
 
-        newBlockPos = block.blockPosChunk + addition
+        targetChunk, newBlockPos = self.getTargetBlock(block.blockPosChunk + addition)
 
-        if any([num >= self.size.tuple[numI] for numI, num in enumerate(newBlockPos.tuple)]):
+        if not targetChunk or not targetChunk.blocks.size:
             return
 
-        targetBlock = self.blocks[newBlockPos.Y][newBlockPos.X][newBlockPos.Z]
-
-        if targetBlock.blockType != enums.BlockType.AIR:
+        if targetChunk.getBlockType(newBlockPos) != enums.BlockType.AIR:
             return
 
         randomBlockType = enums.BlockType(randint(1, 4))
-        targetBlock.blockType = randomBlockType
+        targetChunk.setBlockType(newBlockPos, randomBlockType)
+        targetChunk.recordEdit(newBlockPos, randomBlockType)
+
+        targetChunk.updateSurfacesAroundBlock(newBlockPos)
+
+    def getTargetBlock(self, blockPos: Vector3):
+        """
+        Gets the Chunk and its Position of a Block next to this Chunk's Blocks,
+        a Position past the X or Z edge is moved into the adjacent Chunk on that side
+
+        Parameters
+        ----------
+        blockPos : Vector3
+            Position of the Block relative to this Chunk, at most one Block past an edge
+
+        Returns
+        -------
+        tuple
+            (Chunk, Position in that Chunk), the Chunk is None when the Position is above or below the Chunk
+            or the adjacent Chunk isn't loaded
+        """
+
+        if not 0 <= blockPos.Y < self.size.Y:
+            return None, blockPos
 
-        self.updateBlockSurfaces(targetBlock)
-        self.updateSurfacesAroundBlock(targetBlock)
-        self.genChunkVBO()
-        self.updateVBOChunkAdjacent()
+        offset = Vector3(
+            (blockPos.X >= self.size.X) - (blockPos.X < 0),
+            0,
+            (blockPos.Z >= self.size.Z) - (blockPos.Z < 0)
+        )
 
-    def updateVBOChunkAdjacent(self):
+        if offset == Vector3(0, 0, 0):
+            return self, blockPos
+
+        return self.adjacentChunks.get(offset, None), Vector3(
+            blockPos.X % self.size.X, blockPos.Y, blockPos.Z % self.size.Z
+        )
+
+    def updateMesh(self):
         """
-        Updates the Chunk adjacent to this Chunk
+        Regenerates the VBO of the Sections which are marked for remeshing
 
         Returns
         -------
         None
         """
 
-        for chunk in self.adjacentChunks.values():
-            if chunk:
-                chunk.genChunkVBO()
+        lodSurfaces = None
+
+        if self.lodFactor != 1 and any(section.meshDirty for section in self.sections):
+            lodSurfaces = self.getLodSurfaces()
+
+        for section in self.sections:
+            section.updateMesh(lodSurfaces)
 
     def HandleMouseClicks(self):
         """
@@ -0,0 +1,150 @@
+"""
+Handles the Chunk work done in the worker processes
+Each function only takes and returns arrays and plain values, so it can run away from the render thread
+
+Functions
+-----
+initWorker - Creates the noise of a worker process
+
+generateChunkBlocks - Generates the Blocks of a Chunk with the worker's noise
+
+buildChunkMeshes - Culls a Chunk and builds the Vertex Data and face connectivity of each of its Sections
+"""
+
+import numpy as np
+from opensimplex import OpenSimplex
+
+import culling
+import enums
+import lod
+import mesher
+import terrain
+
+workerNoise = None
+
+
+def initWorker(seed: int):
+    """
+    Creates the OpenSimplex noise of the worker process, the same seed gives the same terrain as the World's noise
+
+    Parameters
+    ----------
+    seed : int
+        The seed of the World
+
+    Returns
+    -------
+    None
+    """
+
+    global workerNoise
+
+    workerNoise = OpenSimplex(seed=seed)
+
+
+def generateChunkBlocks(generationArgs: tuple):
+    """
+    Generates the Blocks of a Chunk
+
+    Parameters
+    ----------
+    generationArgs : tuple
+        The arguments from Chunk.getGenerationArgs
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of Block Type values with the shape (Y, X, Z)
+    """
+
+    return terrain.generateChunkBlocks(workerNoise, *generationArgs)
+
+
+def buildChunkMeshes(blocks: np.ndarray, adjacentBlocks: dict, sectionRanges: list, greedyMeshing: bool,
+                     vertexFormat: str, meshOffset: tuple, lodFactor=1, lodSkirts=True):
+    """
+    Works out which surfaces of a Chunk can be seen, builds the Vertex Data of each Section
+    and works out which faces of each Section are connected through Air
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array of the Chunk with the shape (Y, X, Z)
+
+    adjacentBlocks : dict
+        A (X, Z) offset tuple: Block Type array of the adjacent Chunk, or None when there isn't one
+
+    sectionRanges : list
+        A list containing the (yStart, yEnd) of each Section
+
+    greedyMeshing : bool
+        Whether adjacent surfaces are merged into larger Quads
+
+    vertexFormat : str
+        "float" or "packed"
+
+    meshOffset : tuple
+        The (X, Y, Z) of the Chunk's mesh origin
+
+    lodFactor : int
+        Keyword-Argument, the size in blocks of the cells the meshes are built from, from lod.downsampleBlocks
+
+    lodSkirts : bool
+        Keyword-Argument, whether the meshes of cells keep the surfaces on the sides of the Chunk
+
+    Returns
+    -------
+    tuple
+        (surfacesShow, sectionMeshes, sectionConnectivity), the bool array with the shape (6, Y, X, Z),
+        the (combinedData, surfaceQuadCounts) of each Section from mesher.buildSectionMesh,
+        None for the Sections without any surfaces
+        and the (6, 6) bool face connectivity of each Section
+    """
+
+    solidMask = culling.buildSolidMask(blocks, adjacentBlocks)
+
+    surfacesShow = np.zeros((6,) + blocks.shape, dtype=bool)
+    sectionMeshes = []
+    sectionConnectivity = [culling.buildFaceConnectivity(blocks[yStart:yEnd]) for yStart, yEnd in sectionRanges]
+
+    offsetX, offsetY, offsetZ = meshOffset
+
+    if lodFactor != 1:
+        cellSurfaces, cellBlocks = lod.buildLodSurfaces(blocks, adjacentBlocks, lodFactor, lodSkirts)
+
+    for yStart, yEnd in sectionRanges:
+        sectionBlocks = blocks[yStart:yEnd]
+
+        if (sectionBlocks == enums.BlockType.AIR.value).all():
+            sectionMeshes.append(None)
+            continue
+
+        sectionSurfaces = culling.cullSolidMask(solidMask, yStart, yEnd)
+        surfacesShow[:, yStart:yEnd] = sectionSurfaces
+
+        if not sectionSurfaces.any():
+            sectionMeshes.append(None)
+            continue
+
+        if lodFactor != 1:
+            cellLayers = np.s_[yStart // lodFactor:yEnd // lodFactor]
+
+            sectionMeshes.append(mesher.buildSectionMesh(
+                cellSurfaces[:, cellLayers],
+                cellBlocks[cellLayers],
+                greedyMeshing,
+                vertexFormat,
+                (offsetX, offsetY + yStart, offsetZ),
+                scale=lodFactor
+            ))
+            continue
+
+        sectionMeshes.append(mesher.buildSectionMesh(
+            sectionSurfaces,
+            sectionBlocks,
+            greedyMeshing,
+            vertexFormat,
+            (offsetX, offsetY + yStart, offsetZ)
+        ))
+
+    return surfacesShow, sectionMeshes, sectionConnectivity
@@ -0,0 +1,168 @@
+"""
+Handles the Collision of axis-aligned boxes with the Blocks of the World
+The Blocks are centred on the integer positions, so the Block k along an axis fills k - 0.5 to k + 0.5
+
+Functions
+-----
+getOverlapRange - Gets the Block Positions along an axis whose insides a range overlaps
+
+boxOverlapsSolid - Checks whether a box overlaps any solid Block
+
+sweepAxis - Works out how far a box can move along one axis before it touches a solid Block
+
+moveBox - Works out how far a box can move by a delta, one axis at a time
+"""
+
+from math import ceil, floor
+
+# How far a box can be inside a Block face and still count as touching it, for floating point error
+touchTolerance = 1e-6
+
+
+def getOverlapRange(low: float, high: float):
+    """
+    Gets the Block Positions along an axis whose insides the range overlaps, touching a Block face isn't overlapping
+
+    Parameters
+    ----------
+    low : float
+        The lowest position of the range
+
+    high : float
+        The highest position of the range
+
+    Returns
+    -------
+    range
+    """
+
+    return range(floor(low - 0.5 + touchTolerance) + 1, ceil(high + 0.5 - touchTolerance))
+
+
+def boxOverlapsSolid(minCorner: list, maxCorner: list, isSolid):
+    """
+    Checks whether a box overlaps any solid Block
+
+    Parameters
+    ----------
+    minCorner : list
+        The lowest (X, Y, Z) corner of the box
+
+    maxCorner : list
+        The highest (X, Y, Z) corner of the box
+
+    isSolid : function
+        Takes the world Block Position (X, Y, Z) ints and returns whether the Block is solid
+
+    Returns
+    -------
+    bool
+    """
+
+    rangeX, rangeY, rangeZ = (getOverlapRange(low, high) for low, high in zip(minCorner, maxCorner))
+
+    return any(isSolid(blockX, blockY, blockZ) for blockX in rangeX for blockY in rangeY for blockZ in rangeZ)
+
+
+def sweepAxis(minCorner: list, maxCorner: list, axis: int, distance: float, isSolid):
+    """
+    Works out how far a box can move along one axis before it touches a solid Block
+    Only the Blocks the swept box passes into are checked, the layers of Blocks are checked nearest first
+
+    Parameters
+    ----------
+    minCorner : list
+        The lowest (X, Y, Z) corner of the box
+
+    maxCorner : list
+        The highest (X, Y, Z) corner of the box
+
+    axis : int
+        The axis of the move, 0 for X, 1 for Y and 2 for Z
+
+    distance : float
+        The distance to move along the axis, negative moves towards the lower positions
+
+    isSolid : function
+        Takes the world Block Position (X, Y, Z) ints and returns whether the Block is solid
+
+    Returns
+    -------
+    float
+        The distance the box can move, between 0 and the distance
+    """
+
+    if not distance:
+        return distance
+
+    otherAxes = [otherAxis for otherAxis in range(3) if otherAxis != axis]
+    crossRanges = [getOverlapRange(minCorner[otherAxis], maxCorner[otherAxis]) for otherAxis in otherAxes]
+
+    if distance > 0:
+        leadingFace = maxCorner[axis]
+
+        # The layers with their low face between the leading face and where it moves to
+        layers = range(ceil(leadingFace + 0.5 - touchTolerance), ceil(leadingFace + distance + 0.5))
+    else:
+        leadingFace = minCorner[axis]
+
+        # The layers with their high face between the leading face and where it moves to, nearest first
+        layers = range(floor(leadingFace - 0.5 + touchTolerance), floor(leadingFace + distance - 0.5), -1)
+
+    blockPosition = [0, 0, 0]
+
+    for layer in layers:
+        blockPosition[axis] = layer
+
+        for first in crossRanges[0]:
+            blockPosition[otherAxes[0]] = first
+
+            for second in crossRanges[1]:
+                blockPosition[otherAxes[1]] = second
+
+                if isSolid(*blockPosition):
+                    if distance > 0:
+                        return max(min(distance, layer - 0.5 - leadingFace), 0.0)
+
+                    return min(max(distance, layer + 0.5 - leadingFace), 0.0)
+
+    return distance
+
+
+def moveBox(minCorner: list, maxCorner: list, delta: list, isSolid):
+    """
+    Works out how far a box can move by a delta, the Y is moved first then the X and Z,
+    so the box slides along the Blocks it touches
+
+    Parameters
+    ----------
+    minCorner : list
+        The lowest (X, Y, Z) corner of the box
+
+    maxCorner : list
+        The highest (X, Y, Z) corner of the box
+
+    delta : list
+        The (X, Y, Z) move of the box
+
+    isSolid : function
+        Takes the world Block Position (X, Y, Z) ints and returns whether the Block is solid
+
+    Returns
+    -------
+    list
+        The (X, Y, Z) move the box can make
+    """
+
+    minCorner = list(minCorner)
+    maxCorner = list(maxCorner)
+    clippedDelta = [0.0, 0.0, 0.0]
+
+    for axis in (1, 0, 2):
+        distance = sweepAxis(minCorner, maxCorner, axis, delta[axis], isSolid)
+
+        minCorner[axis] += distance
+        maxCorner[axis] += distance
+        clippedDelta[axis] = distance
+
+    return clippedDelta
@@ -0,0 +1,232 @@
+"""
+Handles Face Culling
+
+Functions
+-----
+buildSolidMask - Builds a Solid Mask of a Chunk padded with a border from the adjacent Chunks
+
+cullSolidMask - Works out which surfaces of a range of layers can be seen
+
+cullFaces - Works out which surfaces of every block can be seen
+
+labelOpenRegions - Labels the connected regions of non-solid blocks
+
+buildFaceConnectivity - Works out which pairs of faces of a block volume are connected through non-solid blocks
+"""
+
+import numpy as np
+
+import enums
+
+# Offset (Y, X, Z) to the block each surface faces, in the same order as Block.surfaces
+surfaceOffsets = (
+    (1, 0, 0),  # Top
+    (-1, 0, 0),  # Bottom
+
+    (0, 0, 1),  # Back
+    (0, 0, -1),  # Front
+
+    (0, -1, 0),  # Left
+    (0, 1, 0),  # Right
+)
+
+# The outer layer (Y, X, Z) of a block volume on each face, in the same order as Block.surfaces
+faceSlices = (
+    np.s_[-1, :, :],  # Top
+    np.s_[0, :, :],  # Bottom
+
+    np.s_[:, :, -1],  # Back
+    np.s_[:, :, 0],  # Front
+
+    np.s_[:, 0, :],  # Left
+    np.s_[:, -1, :],  # Right
+)
+
+
+def buildSolidMask(blocks: np.ndarray, adjacentBlocks: dict):
+    """
+    Builds a bool array of which blocks are solid, with a one block border copied from the adjacent Chunks
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array of the Chunk with the shape (Y, X, Z)
+
+    adjacentBlocks : dict
+        A (X, Z) offset tuple: Block Type array of the adjacent Chunk, or None when there isn't one
+
+    Returns
+    -------
+    np.ndarray
+        A bool array with the shape (Y + 2, X + 2, Z + 2)
+    """
+
+    sizeY, sizeX, sizeZ = blocks.shape
+
+    solidMask = np.zeros((sizeY + 2, sizeX + 2, sizeZ + 2), dtype=bool)
+    solidMask[1:-1, 1:-1, 1:-1] = blocks != enums.BlockType.AIR.value
+
+    borders = {
+        (-1, 0): (np.s_[1:-1, 0, 1:-1], np.s_[:, -1, :]),
+        (1, 0): (np.s_[1:-1, -1, 1:-1], np.s_[:, 0, :]),
+        (0, -1): (np.s_[1:-1, 1:-1, 0], np.s_[:, :, -1]),
+        (0, 1): (np.s_[1:-1, 1:-1, -1], np.s_[:, :, 0]),
+    }
+
+    for offset, (borderSlice, adjacentSlice) in borders.items():
+        adjacent = adjacentBlocks.get(offset, None)
+
+        if adjacent is None or adjacent.size == 0:
+            continue
+
+        solidMask[borderSlice] = adjacent[adjacentSlice] != enums.BlockType.AIR.value
+
+    return solidMask
+
+
+def cullSolidMask(solidMask: np.ndarray, yStart: int, yEnd: int):
+    """
+    Works out which surfaces of the layers yStart to yEnd can be seen from a padded Solid Mask
+
+    Parameters
+    ----------
+    solidMask : np.ndarray
+        The padded Solid Mask from buildSolidMask
+
+    yStart : int
+        The first layer to cull
+
+    yEnd : int
+        The layer after the last layer to cull
+
+    Returns
+    -------
+    np.ndarray
+        A bool array with the shape (6, yEnd - yStart, X, Z), in the order of Block.surfaces
+    """
+
+    sizeY = yEnd - yStart
+    sizeX = solidMask.shape[1] - 2
+    sizeZ = solidMask.shape[2] - 2
+
+    solid = solidMask[1 + yStart:1 + yEnd, 1:-1, 1:-1]
+
+    surfacesShow = np.empty((6, sizeY, sizeX, sizeZ), dtype=bool)
+
+    for i, (offsetY, offsetX, offsetZ) in enumerate(surfaceOffsets):
+        adjacentSolid = solidMask[
+            1 + yStart + offsetY:1 + yEnd + offsetY,
+            1 + offsetX:1 + offsetX + sizeX,
+            1 + offsetZ:1 + offsetZ + sizeZ
+        ]
+
+        np.logical_and(solid, ~adjacentSolid, out=surfacesShow[i])
+
+    return surfacesShow
+
+
+def cullFaces(blocks: np.ndarray, adjacentBlocks: dict):
+    """
+    Works out which surfaces can be seen, a surface can be seen when its block is solid and the block it faces is not
+
+    Surfaces facing outside the world, or facing a missing Chunk, can always be seen.
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array of the Chunk with the shape (Y, X, Z)
+
+    adjacentBlocks : dict
+        A (X, Z) offset tuple: Block Type array of the adjacent Chunk, or None when there isn't one
+
+    Returns
+    -------
+    np.ndarray
+        A bool array with the shape (6, Y, X, Z), in the order of Block.surfaces
+    """
+
+    return cullSolidMask(buildSolidMask(blocks, adjacentBlocks), 0, blocks.shape[0])
+
+
+def labelOpenRegions(openMask: np.ndarray):
+    """
+    Labels the regions of open blocks connected through their surfaces
+    Each label is the flat index of the first block of its region, the labels spread to the adjacent open blocks
+    and jump to the label of their label until nothing changes
+
+    Parameters
+    ----------
+    openMask : np.ndarray
+        A bool array with the shape (Y, X, Z) of which blocks are open
+
+    Returns
+    -------
+    np.ndarray
+        A int array with the shape (Y, X, Z), the closed blocks have the label openMask.size
+    """
+
+    closedLabel = openMask.size
+    labels = np.where(openMask, np.arange(openMask.size).reshape(openMask.shape), closedLabel)
+
+    while True:
+        newLabels = labels.copy()
+
+        for axis in range(3):
+            lower = [slice(None)] * 3
+            upper = [slice(None)] * 3
+            lower[axis] = slice(None, -1)
+            upper[axis] = slice(1, None)
+
+            lower = tuple(lower)
+            upper = tuple(upper)
+
+            np.minimum(newLabels[lower], labels[upper], out=newLabels[lower])
+            np.minimum(newLabels[upper], labels[lower], out=newLabels[upper])
+
+        newLabels[~openMask] = closedLabel
+
+        flatLabels = newLabels.reshape(-1)
+        openLabels = flatLabels < closedLabel
+        flatLabels[openLabels] = flatLabels[flatLabels[openLabels]]
+
+        if (newLabels == labels).all():
+            return labels
+
+        labels = newLabels
+
+
+def buildFaceConnectivity(blocks: np.ndarray):
+    """
+    Works out which pairs of faces of a block volume can see each other through Air
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array with the shape (Y, X, Z)
+
+    Returns
+    -------
+    np.ndarray
+        A bool array with the shape (6, 6) in the order of Block.surfaces,
+        a face is connected to itself when it has any Air on it
+    """
+
+    openMask = blocks == enums.BlockType.AIR.value
+
+    if openMask.all():
+        return np.ones((6, 6), dtype=bool)
+
+    if not openMask.any():
+        return np.zeros((6, 6), dtype=bool)
+
+    labels = labelOpenRegions(openMask)
+
+    faceLabels = np.zeros((6, openMask.size + 1), dtype=bool)
+
+    for i, faceSlice in enumerate(faceSlices):
+        faceLabels[i, labels[faceSlice].reshape(-1)] = True
+
+    faceLabels = faceLabels[:, :-1]
+    faceLabels = faceLabels[:, faceLabels.any(axis=0)].astype(np.int32)
+
+    return (faceLabels @ faceLabels.T) > 0
@@ -0,0 +1,182 @@
+"""
+Handler for the Edit Log, which stores only the Block edits of a World
+The Chunks are regenerated from the World seed and the edits are replayed on top
+
+Class
+-----
+EditLog - Handles a Single Edit Log file
+"""
+
+import os
+
+import numpy as np
+
+from errors import EditLogError
+
+# One record per edit, the last record of a Block wins
+editRecordType = np.dtype([
+    ("chunkX", "<i4"),
+    ("chunkZ", "<i4"),
+    ("x", "u1"),
+    ("y", "<u2"),
+    ("z", "u1"),
+    ("blockType", "u1"),
+])
+
+
+class EditLog:
+    """
+    This Class Handles a Single Edit Log file, new edits are added to the end of the file
+
+    Parameters
+    ----------
+    path : str
+        Path of the Edit Log, it is created with the first saved edit
+
+    Attributes
+    ----------
+    path : str
+        Path of the Edit Log
+
+    chunkEdits : dict
+        Key: (X, Z) Chunk Coordinate
+        Value: dict of (x, y, z) Block Position in the Chunk: Block Type value
+
+    recordCount : int
+        The amount of records in the file, including the records of Blocks edited again later
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        self.chunkEdits = {}
+        self.recordCount = 0
+
+        if os.path.exists(self.path):
+            self.load()
+
+    def load(self):
+        """
+        Reads every record of the file into the chunkEdits
+
+        Returns
+        -------
+        None
+        """
+
+        with open(self.path, "rb") as editFile:
+            editData = editFile.read()
+
+        # A record cut off by a crash is left out
+        recordCount = len(editData) // editRecordType.itemsize
+        records = np.frombuffer(editData[:recordCount * editRecordType.itemsize], dtype=editRecordType)
+
+        for chunkX, chunkZ, x, y, z, blockType in records.tolist():
+            self.chunkEdits.setdefault((chunkX, chunkZ), {})[(x, y, z)] = blockType
+
+        self.recordCount = recordCount
+
+    def getEdits(self, chunkCoord: tuple):
+        """
+        Gets the edits of a Chunk
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        Returns
+        -------
+        list
+            A list containing (x, y, z, Block Type value) tuples
+        """
+
+        return [(*blockPos, blockType) for blockPos, blockType in self.chunkEdits.get(chunkCoord, {}).items()]
+
+    @staticmethod
+    def fitsRecord(edit: tuple):
+        """
+        Checks whether an edit fits in the fields of an edit record
+
+        Parameters
+        ----------
+        edit : tuple
+            (x, y, z, Block Type value) of the edit
+
+        Returns
+        -------
+        bool
+        """
+
+        return all(
+            np.iinfo(editRecordType[field]).min <= value <= np.iinfo(editRecordType[field]).max
+            for field, value in zip(("x", "y", "z", "blockType"), edit)
+        )
+
+    def addEdits(self, chunkCoord: tuple, edits: list):
+        """
+        Adds the edits of a Chunk to the end of the file
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        edits : list
+            A list containing (x, y, z, Block Type value) tuples, in the order they were made
+
+        Returns
+        -------
+        None
+        """
+
+        if not edits:
+            return
+
+        # Checked before anything is written, so a bad edit can't leave part of the edits in the file
+        for edit in edits:
+            if not self.fitsRecord(edit):
+                raise EditLogError(f"Edit {edit} of Chunk {chunkCoord} doesn't fit in an edit record")
+
+        records = np.array([chunkCoord + tuple(edit) for edit in edits], dtype=editRecordType)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+        with open(self.path, "ab") as editFile:
+            editFile.write(records.tobytes())
+
+        blockEdits = self.chunkEdits.setdefault(chunkCoord, {})
+
+        for x, y, z, blockType in edits:
+            blockEdits[(x, y, z)] = blockType
+
+        self.recordCount += len(records)
+
+    def compact(self):
+        """
+        Rewrites the file with only the latest record of each Block, if any record was replaced
+
+        Returns
+        -------
+        None
+        """
+
+        editCount = sum(len(blockEdits) for blockEdits in self.chunkEdits.values())
+
+        if editCount == self.recordCount:
+            return
+
+        records = np.array([
+            chunkCoord + blockPos + (blockType,)
+            for chunkCoord, blockEdits in self.chunkEdits.items()
+            for blockPos, blockType in blockEdits.items()
+        ], dtype=editRecordType)
+
+        compactPath = self.path + ".tmp"
+
+        with open(compactPath, "wb") as editFile:
+            editFile.write(records.tobytes())
+
+        os.replace(compactPath, self.path)
+
+        self.recordCount = editCount
@@ -3,6 +3,9 @@ Handler for Enums (Enumerations)
 """
 
 from enum import Enum
+
+import numpy as np
+
 from colour import Colour
 
 class BlockType(Enum):
@@ -26,6 +29,23 @@ class BlockColour():
     def get(self, blockState: BlockType):
         return self.coloursDict.get(blockState.value, None)
 
+    def getPalette(self):
+        """
+        Gets the RGB Colours as an array indexed by the Block Type value
+
+        Returns
+        -------
+        np.ndarray
+            A float32 array with the shape (Highest Block Type value + 1, 3)
+        """
+
+        palette = np.zeros((max(self.coloursDict) + 1, 3), dtype=np.float32)
+
+        for value, colour in self.coloursDict.items():
+            palette[value] = colour.RGBList
+
+        return palette
+
 
 if __name__ == "__main__":
     pass
\ No newline at end of file
@@ -9,3 +9,19 @@ class VectorError(Exception):
 
 class ColourError(Exception):
     pass
+
+
+class ShaderError(Exception):
+    pass
+
+
+class RegionError(Exception):
+    pass
+
+
+class WorldError(Exception):
+    pass
+
+
+class EditLogError(Exception):
+    pass
@@ -0,0 +1,93 @@
+"""
+Handles View-Frustum Culling
+
+Functions
+-----
+extractPlanes - Works out the six planes of the view frustum from the projection and modelview matrices
+
+getFrustumPlanes - Gets the planes of the view frustum from the current OpenGL matrices
+
+boxesInFrustum - Works out which axis-aligned bounding boxes are at least partly inside the view frustum
+"""
+
+import numpy as np
+from OpenGL.GL import *
+
+
+def extractPlanes(projectionMatrix: np.ndarray, modelviewMatrix: np.ndarray):
+    """
+    Works out the planes of the view frustum in world space, each plane faces into the frustum
+
+    Parameters
+    ----------
+    projectionMatrix : np.ndarray
+        The 4x4 projection matrix as returned by glGetFloatv, in column-major order
+
+    modelviewMatrix : np.ndarray
+        The 4x4 modelview matrix as returned by glGetFloatv, in column-major order
+
+    Returns
+    -------
+    np.ndarray
+        A float array with the shape (6, 4) of the (A, B, C, D) of the left, right, bottom, top, near and far planes
+        A point (X, Y, Z) is on the inner side of a plane when A * X + B * Y + C * Z + D >= 0
+    """
+
+    # The column-major arrays are the transposes, so the product is reversed
+    clipMatrix = (np.asarray(modelviewMatrix, np.float64).reshape(4, 4) @
+                  np.asarray(projectionMatrix, np.float64).reshape(4, 4)).T
+
+    planes = np.array([
+        clipMatrix[3] + clipMatrix[0],
+        clipMatrix[3] - clipMatrix[0],
+        clipMatrix[3] + clipMatrix[1],
+        clipMatrix[3] - clipMatrix[1],
+        clipMatrix[3] + clipMatrix[2],
+        clipMatrix[3] - clipMatrix[2],
+    ])
+
+    return planes / np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+
+
+def getFrustumPlanes():
+    """
+    Gets the planes of the view frustum from the current projection and modelview matrices
+
+    Returns
+    -------
+    np.ndarray
+        A float array with the shape (6, 4), from extractPlanes
+    """
+
+    return extractPlanes(glGetFloatv(GL_PROJECTION_MATRIX), glGetFloatv(GL_MODELVIEW_MATRIX))
+
+
+def boxesInFrustum(planes: np.ndarray, minCorners: np.ndarray, maxCorners: np.ndarray):
+    """
+    Works out which boxes are at least partly inside the view frustum
+    A box is outside when its corner furthest along the normal of any plane is behind that plane
+
+    Parameters
+    ----------
+    planes : np.ndarray
+        A float array with the shape (6, 4), from extractPlanes
+
+    minCorners : np.ndarray
+        A float array with the shape (N, 3) of the lowest corner of each box
+
+    maxCorners : np.ndarray
+        A float array with the shape (N, 3) of the highest corner of each box
+
+    Returns
+    -------
+    np.ndarray
+        A bool array with the shape (N,)
+    """
+
+    normals = planes[:, :3]
+
+    # (N, 6, 3) corner of each box furthest along each plane normal
+    furthestCorners = np.where(normals >= 0, maxCorners[:, np.newaxis], minCorners[:, np.newaxis])
+    distances = (furthestCorners * normals).sum(axis=2) + planes[:, 3]
+
+    return (distances >= 0).all(axis=1)
@@ -0,0 +1,117 @@
+"""
+Handles the Level of Detail of distant Chunks, which are meshed from cells of factor by factor by factor blocks
+
+Functions
+-----
+downsampleBlocks - Merges the blocks of a Block Type array into cells
+
+buildLodSurfaces - Works out which surfaces of the cells of a Chunk can be seen
+"""
+
+import numpy as np
+
+import culling
+import enums
+
+# The solid Block Types picked first when cells mix them, so the surface of the terrain keeps its colour
+priorityTypes = np.array([
+    enums.BlockType.GRASS.value,
+    enums.BlockType.DIRT.value,
+    enums.BlockType.STONE.value,
+] + [
+    blockType.value for blockType in enums.BlockType
+    if blockType not in (enums.BlockType.AIR, enums.BlockType.GRASS, enums.BlockType.DIRT, enums.BlockType.STONE)
+], dtype=np.uint8)
+
+# Block Type value: index in priorityTypes, Air is after every solid Block Type
+blockTypePriority = np.full(256, len(priorityTypes), dtype=np.uint8)
+blockTypePriority[priorityTypes] = np.arange(len(priorityTypes))
+
+
+def downsampleBlocks(blocks: np.ndarray, factor: int):
+    """
+    Merges each factor by factor by factor cell of blocks into one block
+    A cell is solid when at least half its blocks are, or any in the bottom cells, and takes the Block Type from the highest layer of the cell
+    with a solid block, Grass before Dirt before Stone
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array with the shape (Y, X, Z), each size a multiple of factor
+
+    factor : int
+        The amount of blocks along each axis merged into a cell
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of Block Type values with the shape (Y / factor, X / factor, Z / factor)
+    """
+
+    if factor == 1:
+        return blocks
+
+    sizeY, sizeX, sizeZ = blocks.shape
+    air = enums.BlockType.AIR.value
+
+    # (cellY, cellX, cellZ, layer in the cell, block in the layer)
+    cells = blocks.reshape(sizeY // factor, factor, sizeX // factor, factor, sizeZ // factor, factor)
+    cells = cells.transpose(0, 2, 4, 1, 3, 5).reshape(sizeY // factor, sizeX // factor, sizeZ // factor,
+                                                       factor, factor * factor)
+
+    solidBlocks = cells != air
+    cellSolid = solidBlocks.sum(axis=(3, 4)) * 2 >= factor ** 3
+
+    # The bottom cells keep any solid block, so low terrain doesn't leave holes to below the World
+    cellSolid[0] |= solidBlocks[0].any(axis=(2, 3))
+
+    solidLayers = solidBlocks.any(axis=4)
+    highestLayer = factor - 1 - np.argmax(solidLayers[..., ::-1], axis=3)
+
+    topLayer = np.take_along_axis(cells, highestLayer[..., np.newaxis, np.newaxis], axis=3)[..., 0, :]
+    topPriority = blockTypePriority[topLayer].min(axis=3)
+
+    cellTypes = priorityTypes[np.minimum(topPriority, len(priorityTypes) - 1)]
+
+    return np.where(cellSolid, cellTypes, air).astype(np.uint8)
+
+
+def buildLodSurfaces(blocks: np.ndarray, adjacentBlocks: dict, factor: int, skirts: bool):
+    """
+    Works out which surfaces of the cells of a Chunk can be seen
+
+    Parameters
+    ----------
+    blocks : np.ndarray
+        The Block Type array of the Chunk with the shape (Y, X, Z)
+
+    adjacentBlocks : dict
+        A (X, Z) offset tuple: Block Type array of the adjacent Chunk, or None when there isn't one
+
+    factor : int
+        The amount of blocks along each axis merged into a cell
+
+    skirts : bool
+        Whether the surfaces on the sides of the Chunk are always kept,
+        so there are no gaps where the adjacent Chunk has a different factor
+
+    Returns
+    -------
+    surfacesShow : np.ndarray
+        A bool array with the shape (6, Y / factor, X / factor, Z / factor)
+
+    cellBlocks : np.ndarray
+        The downsampled Block Type array with the shape (Y / factor, X / factor, Z / factor)
+    """
+
+    cellBlocks = downsampleBlocks(blocks, factor)
+
+    if skirts:
+        adjacentCells = {}
+    else:
+        adjacentCells = {
+            offset: downsampleBlocks(adjacent, factor) if adjacent is not None and adjacent.size else None
+            for offset, adjacent in adjacentBlocks.items()
+        }
+
+    return culling.cullFaces(cellBlocks, adjacentCells), cellBlocks
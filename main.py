@@ -58,13 +58,13 @@ def main():
         keyPressed = pg.key.get_pressed()
         for event in pg.event.get():
             if event.type == pg.QUIT:
-                pg.quit()
                 CurrentWorld.delete()
+                pg.quit()
                 quit()
 
         if keyPressed[pg.K_ESCAPE] or keyPressed[pg.K_k]:
-            pg.quit()
             CurrentWorld.delete()
+            pg.quit()
             quit()
 
         if pg.mouse.get_focused():
@@ -79,12 +79,13 @@ def main():
             viewMatrix = player.move(dt, viewMatrix)
             glPushMatrix()
 
+            CurrentWorld.updateStreamedChunks()
+            CurrentWorld.processWorkerResults()
+            CurrentWorld.updateLodFactors()
             CurrentWorld.HandleMouseClicks()
+            CurrentWorld.remeshDirtyChunks()
             CurrentWorld.updateCurrentChunk()
 
-            player.resetConstraints()
-            player.bodyDirectionConstraints()
-
             CurrentWorld.setHighlightedBlockData()
 
             glEnable(GL_LIGHTING)
@@ -0,0 +1,333 @@
+"""
+Handles Chunk Meshing
+
+Quads are kept in chunk space, where the block at (X, Y, Z) fills the corners (X, Y, Z) to (X + 1, Y + 1, Z + 1)
+
+Functions
+-----
+buildQuads - Builds a Quad for every visible surface
+
+buildGreedyQuads - Builds Quads which merge adjacent visible surfaces of the same Block Type and direction
+
+emitQuads - Builds the Quad corners from the start corner and size of each Quad
+
+buildVertexData - Builds the interleaved position/colour/normal array of the Quads
+
+buildPackedVertexData - Builds the packed 8 byte per vertex array of the Quads
+
+buildQuadIndices - Builds the triangle indices which draw Quads as two triangles each
+
+buildSectionMesh - Builds the Vertex Data of a Section's visible surfaces
+"""
+
+import numpy as np
+
+import enums
+from blockhandler import Block
+
+# Corner of each surface vertex in chunk space, in the same order as Block.surfaces
+surfaceCorners = np.array([
+    [[(offset + 1) // 2 for offset in Block.vertexOffsets[blockVertex]] for blockVertex in blockQuad]
+    for blockQuad in Block.surfaces
+], dtype=np.int16)
+
+surfaceNormals = np.array([normal.list for normal in Block.normals], dtype=np.float32)
+
+colourPalette = enums.BlockColour().getPalette()
+
+# Chunk space corner, surface index and Block Type of a vertex, the colour and normal are looked up when drawing
+packedVertexType = np.dtype([
+    ("position", np.uint16, 3),
+    ("surfaceIndex", np.uint8),
+    ("blockType", np.uint8),
+])
+
+# (Normal, U, V) axes of each surface in the (Y, X, Z) block array, in the same order as Block.surfaces
+surfacePlaneAxes = (
+    (0, 1, 2),  # Top
+    (0, 1, 2),  # Bottom
+
+    (2, 0, 1),  # Back
+    (2, 0, 1),  # Front
+
+    (1, 0, 2),  # Left
+    (1, 0, 2),  # Right
+)
+
+
+def emitQuads(surfaceIndexes: np.ndarray, startCorners: np.ndarray, quadSizes: np.ndarray):
+    """
+    Builds the corners of each Quad, a Quad covers quadSizes blocks from the startCorner
+
+    Parameters
+    ----------
+    surfaceIndexes : np.ndarray
+        The surface index of each Quad with the shape (N,)
+
+    startCorners : np.ndarray
+        The (X, Y, Z) of the lowest block of each Quad with the shape (N, 3)
+
+    quadSizes : np.ndarray
+        The (X, Y, Z) block count of each Quad with the shape (N, 3), the size is 1 along the normal
+
+    Returns
+    -------
+    np.ndarray
+        A int16 array with the shape (N, 4, 3)
+    """
+
+    return (startCorners[:, np.newaxis, :] + surfaceCorners[surfaceIndexes] * quadSizes[:, np.newaxis, :]).astype(np.int16)
+
+
+def buildQuads(surfacesShow: np.ndarray, blocks: np.ndarray):
+    """
+    Builds a Quad for every visible surface, grouped by surface index
+
+    Parameters
+    ----------
+    surfacesShow : np.ndarray
+        A bool array with the shape (6, Y, X, Z)
+
+    blocks : np.ndarray
+        The Block Type array with the shape (Y, X, Z)
+
+    Returns
+    -------
+    corners : np.ndarray
+        A int16 array with the shape (N, 4, 3)
+
+    surfaceIndexes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    blockTypes : np.ndarray
+        A uint8 array with the shape (N,)
+    """
+
+    surfaceIndexes, y, x, z = np.nonzero(surfacesShow)
+
+    startCorners = np.stack((x, y, z), axis=1)
+    corners = emitQuads(surfaceIndexes, startCorners, np.ones_like(startCorners))
+
+    return corners, surfaceIndexes.astype(np.uint8), blocks[y, x, z]
+
+
+def buildGreedyQuads(surfacesShow: np.ndarray, blocks: np.ndarray):
+    """
+    Builds Quads for the visible surfaces, merging adjacent surfaces of the same Block Type and direction into
+    rectangles, grouped by surface index
+
+    Parameters
+    ----------
+    surfacesShow : np.ndarray
+        A bool array with the shape (6, Y, X, Z)
+
+    blocks : np.ndarray
+        The Block Type array with the shape (Y, X, Z)
+
+    Returns
+    -------
+    corners : np.ndarray
+        A int16 array with the shape (N, 4, 3)
+
+    surfaceIndexes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    blockTypes : np.ndarray
+        A uint8 array with the shape (N,)
+    """
+
+    quadSurfaces = []
+    quadStarts = []
+    quadSizes = []
+    quadBlockTypes = []
+
+    for surfaceIndex, (normalAxis, uAxis, vAxis) in enumerate(surfacePlaneAxes):
+        # Block Type of each visible surface, 0 where the surface can't be seen
+        surfaceTypes = np.where(surfacesShow[surfaceIndex], blocks, 0).transpose(normalAxis, uAxis, vAxis)
+
+        for layer in np.flatnonzero(surfaceTypes.any(axis=(1, 2))).tolist():
+            grid = surfaceTypes[layer].tolist()
+            sizeU = len(grid)
+            sizeV = len(grid[0])
+
+            for u in range(sizeU):
+                row = grid[u]
+                v = 0
+
+                while v < sizeV:
+                    blockType = row[v]
+
+                    if blockType == 0:
+                        v += 1
+                        continue
+
+                    width = 1
+                    while v + width < sizeV and row[v + width] == blockType:
+                        width += 1
+
+                    height = 1
+                    while u + height < sizeU and grid[u + height][v:v + width] == [blockType] * width:
+                        height += 1
+
+                    for coveredRow in grid[u:u + height]:
+                        coveredRow[v:v + width] = [0] * width
+
+                    start = [0, 0, 0]
+                    start[normalAxis] = layer
+                    start[uAxis] = u
+                    start[vAxis] = v
+
+                    size = [1, 1, 1]
+                    size[uAxis] = height
+                    size[vAxis] = width
+
+                    quadSurfaces.append(surfaceIndex)
+                    quadStarts.append((start[1], start[0], start[2]))
+                    quadSizes.append((size[1], size[0], size[2]))
+                    quadBlockTypes.append(blockType)
+
+                    v += width
+
+    if not quadSurfaces:
+        return np.empty((0, 4, 3), dtype=np.int16), np.empty(0, dtype=np.uint8), np.empty(0, dtype=np.uint8)
+
+    surfaceIndexes = np.array(quadSurfaces, dtype=np.uint8)
+    corners = emitQuads(surfaceIndexes, np.array(quadStarts), np.array(quadSizes))
+
+    return corners, surfaceIndexes, np.array(quadBlockTypes, dtype=np.uint8)
+
+
+def buildVertexData(corners: np.ndarray, surfaceIndexes: np.ndarray, blockTypes: np.ndarray, offset: tuple):
+    """
+    Builds the interleaved vertex array of the Quads, 4 vertices per Quad
+
+    Parameters
+    ----------
+    corners : np.ndarray
+        A int16 array with the shape (N, 4, 3)
+
+    surfaceIndexes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    blockTypes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    offset : tuple
+        The (X, Y, Z) of the chunk space origin in the world
+
+    Returns
+    -------
+    np.ndarray
+        A float32 array with the shape (N * 4, 9) of position, colour and normal
+    """
+
+    quadCount = len(corners)
+
+    vertexData = np.empty((quadCount, 4, 9), dtype=np.float32)
+    vertexData[:, :, 0:3] = corners + np.array(offset, dtype=np.float32)
+    vertexData[:, :, 3:6] = colourPalette[blockTypes][:, np.newaxis, :]
+    vertexData[:, :, 6:9] = surfaceNormals[surfaceIndexes][:, np.newaxis, :]
+
+    return vertexData.reshape(quadCount * 4, 9)
+
+
+def buildPackedVertexData(corners: np.ndarray, surfaceIndexes: np.ndarray, blockTypes: np.ndarray):
+    """
+    Builds the packed vertex array of the Quads, 4 vertices per Quad
+    The positions stay in chunk space, the Chunk's offset is added when drawing
+
+    Parameters
+    ----------
+    corners : np.ndarray
+        A int16 array with the shape (N, 4, 3)
+
+    surfaceIndexes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    blockTypes : np.ndarray
+        A uint8 array with the shape (N,)
+
+    Returns
+    -------
+    np.ndarray
+        A packedVertexType array with the shape (N * 4,)
+    """
+
+    quadCount = len(corners)
+
+    vertexData = np.empty((quadCount, 4), dtype=packedVertexType)
+    vertexData["position"] = corners
+    vertexData["surfaceIndex"] = surfaceIndexes[:, np.newaxis]
+    vertexData["blockType"] = blockTypes[:, np.newaxis]
+
+    return vertexData.reshape(quadCount * 4)
+
+
+def buildQuadIndices(quadCount: int):
+    """
+    Builds the triangle indices of quadCount Quads, the pattern is the same for every mesh
+
+    Parameters
+    ----------
+    quadCount : int
+        The amount of Quads
+
+    Returns
+    -------
+    np.ndarray
+        A uint32 array with the shape (quadCount * 6,)
+    """
+
+    firstVertices = np.arange(quadCount, dtype=np.uint32)[:, np.newaxis] * 4
+
+    return (firstVertices + np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)).reshape(quadCount * 6)
+
+
+def buildSectionMesh(surfacesShow: np.ndarray, blocks: np.ndarray, greedyMeshing: bool, vertexFormat: str,
+                     offset: tuple, scale=1):
+    """
+    Builds the Vertex Data of the visible surfaces of a Section, grouped by surface index
+
+    Parameters
+    ----------
+    surfacesShow : np.ndarray
+        A bool array with the shape (6, Y, X, Z)
+
+    blocks : np.ndarray
+        The Block Type array with the shape (Y, X, Z)
+
+    greedyMeshing : bool
+        Whether adjacent surfaces are merged into larger Quads
+
+    vertexFormat : str
+        "float" or "packed"
+
+    offset : tuple
+        The (X, Y, Z) of the mesh origin, added to the float positions
+
+    scale : int
+        Keyword-Argument, the size in blocks of each entry of the arrays, more than 1 for the cells of lod.downsampleBlocks
+
+    Returns
+    -------
+    combinedData : np.ndarray
+        The Vertex Data in the vertexFormat
+
+    surfaceQuadCounts : np.ndarray
+        A int array with the shape (6,) of the amount of Quads of each surface index, in order
+    """
+
+    if greedyMeshing:
+        corners, surfaceIndexes, blockTypes = buildGreedyQuads(surfacesShow, blocks)
+    else:
+        corners, surfaceIndexes, blockTypes = buildQuads(surfacesShow, blocks)
+
+    surfaceQuadCounts = np.bincount(surfaceIndexes, minlength=6)
+
+    if scale != 1:
+        corners = corners * np.int16(scale)
+
+    if vertexFormat == "packed":
+        return buildPackedVertexData(corners, surfaceIndexes, blockTypes), surfaceQuadCounts
+
+    return buildVertexData(corners, surfaceIndexes, blockTypes, offset), surfaceQuadCounts
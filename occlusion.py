@@ -0,0 +1,119 @@
+"""
+Handles Occlusion Culling through the face connectivity of the Chunk Sections
+
+Functions
+-----
+findVisibleSections - Walks from the camera's Section through the open faces to find the Sections which can be seen
+"""
+
+from collections import deque
+
+# (X, Y, Z) Section offset through each face, in the same order as Block.surfaces
+faceOffsets = (
+    (0, 1, 0),  # Top
+    (0, -1, 0),  # Bottom
+
+    (0, 0, 1),  # Back
+    (0, 0, -1),  # Front
+
+    (-1, 0, 0),  # Left
+    (1, 0, 0),  # Right
+)
+
+topFace = 0
+bottomFace = 1
+
+
+def getOppositeFace(faceIndex: int):
+    """
+    Gets the face on the other side of a Section, the faces are in opposite pairs
+
+    Parameters
+    ----------
+    faceIndex : int
+        Index of the face in the order of Block.surfaces
+
+    Returns
+    -------
+    int
+    """
+
+    return faceIndex ^ 1
+
+
+def findVisibleSections(chunks: dict, startSection, chunksInFrustum: set, sectionCount: int):
+    """
+    Walks breadth-first from the Section the camera is in, through the faces connected to the face each Section
+    was entered by. A walk can't go back along X or Z the way it came, as the camera can't see around that corner.
+    The Air above the World connects the top faces of every top Section.
+
+    Parameters
+    ----------
+    chunks : dict
+        Key: (X, Z) Chunk Coordinate
+        Value: Chunk
+
+    startSection : None/tuple
+        The (X, Y, Z) Section Coordinate of the camera, None when the camera is above the World
+
+    chunksInFrustum : set
+        The (X, Z) Chunk Coordinates inside the view frustum, the walk doesn't leave them
+
+    sectionCount : int
+        The amount of Sections in a Chunk
+
+    Returns
+    -------
+    set
+        The (X, Y, Z) Section Coordinates which can be seen
+    """
+
+    topSection = sectionCount - 1
+
+    visible = set()
+    sectionQueue = deque()
+
+    def enterSky():
+        for chunkX, chunkZ in chunksInFrustum:
+            if (chunkX, topSection, chunkZ) not in visible:
+                visible.add((chunkX, topSection, chunkZ))
+                sectionQueue.append((chunkX, topSection, chunkZ, topFace, 0))
+
+    if startSection is None:
+        enterSky()
+    else:
+        visible.add(startSection)
+        sectionQueue.append(startSection + (None, 0))
+
+    while sectionQueue:
+        chunkX, sectionY, chunkZ, entryFace, usedDirections = sectionQueue.popleft()
+
+        faceConnectivity = chunks[(chunkX, chunkZ)].sections[sectionY].faceConnectivity
+
+        for faceIndex, (offsetX, offsetY, offsetZ) in enumerate(faceOffsets):
+            if entryFace is not None and not faceConnectivity[entryFace, faceIndex]:
+                continue
+
+            if usedDirections & (1 << getOppositeFace(faceIndex)):
+                continue
+
+            if faceIndex == topFace and sectionY == topSection:
+                enterSky()
+                continue
+
+            if faceIndex == bottomFace and sectionY == 0:
+                continue
+
+            nextSection = (chunkX + offsetX, sectionY + offsetY, chunkZ + offsetZ)
+
+            if nextSection in visible or (nextSection[0], nextSection[2]) not in chunksInFrustum:
+                continue
+
+            visible.add(nextSection)
+
+            # Only the directions along X and Z are kept, the World is too short for the Y ones to cull anything
+            nextDirections = usedDirections | (1 << faceIndex) if offsetY == 0 else usedDirections
+
+            sectionQueue.append(nextSection + (getOppositeFace(faceIndex), nextDirections))
+
+    return visible
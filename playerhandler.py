@@ -5,10 +5,8 @@ Class
 -----
 Player - Handles A Single Player
 """
-from time import time
-
+import collision
 from camera import Camera
-from ray import raycast
 from vector import Vector3
 
 
@@ -28,6 +26,21 @@ class Player:
     ----------
     camera : Camera
         Camera From the Camera Script
+
+    world : None/World
+        The World the Player is in, set after the World is created
+
+    reach : int
+        The furthest distance a Block can be highlighted from
+
+    bodyHalfWidth : float
+        Half the width of the Player's body along the X and Z
+
+    bodyBelowEye : float
+        The height of the Player's body below the camera
+
+    bodyAboveEye : float
+        The height of the Player's body above the camera
     """
 
     def __init__(self, startPos: Vector3, displayCentre: tuple):
@@ -35,97 +48,60 @@ class Player:
         self.world = None
 
         self.reach = 5
-        self.raycastUpdateLength = .04
 
-        self.moveConstraints = {
-            "q": False,
-            "e": False,
+        self.bodyHalfWidth = 0.3
+        self.bodyBelowEye = 1.5
+        self.bodyAboveEye = 0.25
 
-            "w": False,
-            "a": False,
-            "s": False,
-            "d": False,
+    def move(self, dt, viewMatrix):
+        return self.camera.move(dt, viewMatrix, clipMove=self.clipMove)
 
-        }
+    def getBoundingBox(self):
+        """
+        Gets the box of the Player's body around the camera
 
-    def move(self, dt, viewMatrix):
-        return self.camera.move(dt, viewMatrix, self.moveConstraints)
-
-    def resetConstraints(self):
-        for key in self.moveConstraints.keys():
-            self.moveConstraints[key] = False
-
-    def bodyDirectionConstraints(self):
-        currentPlayerPos = self.camera.currentCameraPosition
-        lookVector = self.camera.lookVector
-        rayMultiplier = .05
-
-        rayDistance = {
-            "e": 2,
-            "q": 2,
-            "w": 1,
-            "s": 1,
-            "a": 1,
-            "d": 1,
-        }
-
-        directionDistanceMultiplier = {
-            "e": Vector3(0, 1, 0),
-            "q": Vector3(0, 1, 0),
-            "w": Vector3(1, 0, 1),
-            "s": Vector3(1, 0, 1),
-            "a": Vector3(1, 0, 1),
-            "d": Vector3(1, 0, 1)
-        }
-
-        bodyDirections = {
-            "e": Vector3(0, 1, 0),
-            "q": Vector3(0, -1, 0),
-            "w": lookVector * Vector3( 1, 0,  1) * -1,
-            "s": lookVector * Vector3( 1, 0,  1),
-            "a": lookVector * Vector3( 1, 0, -1),
-            "d": lookVector * Vector3(-1, 0,  1),
-        }
-
-        raycastPositions = [currentPlayerPos, currentPlayerPos - Vector3(0, 1, 0)]
-
-        blacklist = {
-            raycastPositions[1]: ["q"]
-        }
-
-        if self.world.currentChunk:
-            for raycastOrigin in raycastPositions:
-                for key, vectorDir in bodyDirections.items():
-                    if raycastOrigin in blacklist and key in blacklist[raycastOrigin]:
-                        continue
-
-                    maxRayDistance = rayDistance[key]
-                    s = time()
-                    blockHit = raycast(raycastOrigin,
-                                       vectorDir.unit * rayMultiplier * -1,
-                                       maxRayDistance,
-                                       [self.world.currentChunk])[1]
-                    e = time() - s
-                    #print("Raycasting:", e)
-
-                    if blockHit:
-                        blockPos = blockHit.centre
-                        directionMultiplier = directionDistanceMultiplier[key]
-
-                        playerPosAdj = raycastOrigin * directionMultiplier
-                        blockPosAdj = blockPos * directionMultiplier
-                        canConstrain = (playerPosAdj - blockPosAdj).magnitude < maxRayDistance
-
-                        if not self.moveConstraints[key]:
-                            self.moveConstraints[key] = canConstrain
-
-    def setHighlightedBlockData(self, chunkList: list):
+        Returns
+        -------
+        tuple
+            (minCorner, maxCorner), the lowest and highest (X, Y, Z) corners
         """
-        Sets the Highlighted Block of the Mouse Hit Chunk
+
+        cameraX, cameraY, cameraZ = self.camera.currentCameraPosition.tuple
+
+        return (
+            [cameraX - self.bodyHalfWidth, cameraY - self.bodyBelowEye, cameraZ - self.bodyHalfWidth],
+            [cameraX + self.bodyHalfWidth, cameraY + self.bodyAboveEye, cameraZ + self.bodyHalfWidth],
+        )
+
+    def clipMove(self, moveDelta: Vector3):
+        """
+        Stops the move of the Player's body at the solid Blocks of the World
+        A body already inside a Block isn't stopped, so it can move out
 
         Parameters
         ----------
-        chunkList : A List containing Chunks
+        moveDelta : Vector3
+            The world space move of the camera
+
+        Returns
+        -------
+        Vector3
+            The part of the move that can be made
+        """
+
+        if not self.world:
+            return moveDelta
+
+        minCorner, maxCorner = self.getBoundingBox()
+
+        if collision.boxOverlapsSolid(minCorner, maxCorner, self.world.isBlockSolid):
+            return moveDelta
+
+        return Vector3(*collision.moveBox(minCorner, maxCorner, moveDelta.list, self.world.isBlockSolid))
+
+    def setHighlightedBlockData(self):
+        """
+        Sets the Highlighted Block of the Mouse Hit Chunk, the ray can hit a Block in any loaded Chunk
 
         Returns
         -------
@@ -135,9 +111,9 @@ class Player:
         """
 
         currentRayPosition = self.camera.currentCameraPosition
-        addVector = self.camera.lookVector * self.raycastUpdateLength
 
-        chunk, block, surfaceI = raycast(currentRayPosition, addVector, self.reach, chunkList)
+        # The lookVector points back out of the screen
+        chunk, block, surfaceI, distance = self.world.raycast(currentRayPosition, self.camera.lookVector * -1, self.reach)
 
         if chunk:
             chunk.highlightedBlock = block
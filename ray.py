@@ -3,181 +3,112 @@ Handles Raycasting
 
 Functions
 -----
-getCloseChunks - Gets two closest Chunks based on lookVector
+getAxisSteps - Gets how a ray steps through the Block boundaries of one axis
 
-raycast - Performs a Raycast.
+traverseVoxels - Walks a ray through the Block grid one Block at a time until it hits a solid Block
 """
-from time import time
+from math import floor, inf, sqrt
 
-from vector import Vector3
+# Surface index a ray enters a Block through when stepping along each axis, (positive step, negative step)
+entrySurfaces = (
+    (4, 5),  # X: Left, Right
+    (1, 0),  # Y: Bottom, Top
+    (3, 2),  # Z: Front, Back
+)
 
 
-def getCloseChunks(startPos: Vector3, lookVector: Vector3, world):
+def getAxisSteps(start: float, direction: float):
     """
-
+    Gets how a ray steps through the Block boundaries of one axis
 
     Parameters
     ----------
-    startPos : Vector3
-        The Start Position of the Range Check
-
-    lookVector : Vector3
-        The Direction of the Range Ray
+    start : float
+        The start of the ray on the axis, with the Block boundaries on the integers
 
-    world : World
-        The world that the chunks are used from.
+    direction : float
+        The unit direction of the ray on the axis
 
     Returns
     -------
-    chunkCheck : list
-        A list containing Chunks which are to be checked in the Raycasting.
-
+    tuple
+        (step, tDelta, tMax), the Block step of -1, 0 or 1, the ray distance between two boundaries
+        and the ray distance to the first boundary
     """
 
-    addVector = lookVector * Vector3(1, 0, 1) * 0.1
-    updateCurrentCameraPos = startPos - addVector
-
-    checkChunks = list(world.adjacentCurrentChunk.values()) + list(world.cornerCurrentChunks.values())
-
-    filterCheckChunks = []
-
-    for chunk in checkChunks:
-        if not chunk:
-            continue
-
-        chunkCentre = chunk.bottomCentre.copy()
-        chunkCentre.Y = startPos.Y
-
-        chunkOrigDist = (startPos - chunkCentre).magnitude
-        chunkNewDist = (updateCurrentCameraPos - chunkCentre).magnitude
-
-        if chunkNewDist < chunkOrigDist:
-            filterCheckChunks.append(chunk)
-
-    filterCheckChunks = [chunk for chunk in filterCheckChunks if chunk]
-    filterScoreChunk = {chunk: 0 for chunk in filterCheckChunks}
-    currentRayPos = startPos
+    if direction > 0:
+        return 1, 1 / direction, (floor(start) + 1 - start) / direction
 
-    for _ in range(10):
-        bestChunk = None
-        bestDist = 500
+    if direction < 0:
+        return -1, -1 / direction, (start - floor(start)) / -direction
 
-        currentRayPos += addVector
+    return 0, inf, inf
 
-        for chunk in filterCheckChunks:
-            dist = (chunk.bottomCentre - currentRayPos).magnitude
 
-            if dist < bestDist:
-                bestChunk = chunk
-                bestDist = dist
-
-        if bestChunk:
-            filterScoreChunk[bestChunk] += 1
-
-    closestChunkTarget = None
-    highestScore = 0
-
-    for chunk, score in filterScoreChunk.items():
-        if score > highestScore:
-            highestScore = score
-            closestChunkTarget = chunk
-
-    chunkCheck = [world.currentChunk]
-    if closestChunkTarget:
-        chunkCheck.append(closestChunkTarget)
-
-    chunkCheck = list(filter(None, chunkCheck))
-
-    return chunkCheck
-
-
-def raycast(startPoint: Vector3, lookVector: Vector3, maxDist: int, chunkCheckList: list):
+def traverseVoxels(startPoint: tuple, direction: tuple, maxDist: float, isSolid):
     """
-    Raycasts to find the block hit.
+    Walks a ray through every Block it passes in order, with the Amanatides-Woo grid traversal
+    The Block the ray starts in is skipped, as the ray doesn't enter it through a surface
 
     Parameters
     ----------
-    startPoint : Vector3
-        Starting Position of the Ray
+    startPoint : tuple
+        The (X, Y, Z) start of the ray
 
-    lookVector : Vector3
-        Direction of the Ray
+    direction : tuple
+        The (X, Y, Z) direction of the ray, it doesn't have to be a unit vector
 
-    maxDist : int
-        Max Distance of the Ray
+    maxDist : float
+        The furthest distance along the ray a Block can be hit at
 
-    chunkCheckList : list
-        Chunks that the blocks are to be checked from
+    isSolid : function
+        Takes the world Block Position (X, Y, Z) ints and returns whether the ray stops at that Block
 
     Returns
     -------
-    list
-        Either None list or a list containing about the block hit.
+    None/tuple
+        None when no Block is hit, otherwise ((X, Y, Z) world Block Position, surface index, distance)
+        with the surface the ray entered the Block through and the distance from the startPoint
     """
 
-    s = time()
-
-    def convert(num):
-        if num < 0:
-            return num + 16
-
-        if num >= 16:
-            return num % 16
-
-        return num
-
-    distDiff = 0
-    currentRayPositionList = startPoint.list
-    lookMag = lookVector.magnitude
-    lookVectorList = lookVector.list
-
-    if len(chunkCheckList) == 0:
-        return None, None, None
-
-    lastPos = None
-
-    while distDiff < maxDist:
-        closestBlockPosList = [round(posP) for posP in currentRayPositionList]
-
-        if closestBlockPosList != lastPos:
-            currentRayPosition = Vector3(*currentRayPositionList)
-            closestBlockPos = Vector3(*closestBlockPosList)
-
-            targetChunk = None
-
-            for chunk in chunkCheckList:
-                if chunk.isPointInChunk(closestBlockPos):
-                    targetChunk = chunk
-
-            if targetChunk:
-                if closestBlockPos.Y >= targetChunk.size.Y or closestBlockPos.Y < 0:
-                    return None, None, None
-
-                posChunk = closestBlockPos.copy()
-
-                posChunk.X = convert(posChunk.X)
-                posChunk.Z = convert(posChunk.Z)
-
-                targetBlock = targetChunk.blocks[posChunk.Y][posChunk.X][posChunk.Z]
-
-                if any(targetBlock.surfacesShow):
-                    closestSurfaceI = targetBlock.closestSurfaceIndex(currentRayPosition)
-
-                    #print("Raycast S", time() - s)
-                    return targetChunk, targetBlock, closestSurfaceI
-
-            lastPos = closestBlockPosList
-
-        s1 = time()
-        currentRayPositionList = [
-            currentRayPositionList[0] - lookVectorList[0],
-            currentRayPositionList[1] - lookVectorList[1],
-            currentRayPositionList[2] - lookVectorList[2],
-        ]
-        e1 = time() - s1
-
-        distDiff += lookMag
-
-    #print("Raycast F", time() - s)
-
-    return None, None, None
+    directionX, directionY, directionZ = direction
+    length = sqrt(directionX * directionX + directionY * directionY + directionZ * directionZ)
+
+    if not length:
+        return None
+
+    # The Blocks are centred on the integer positions, so the Block boundaries are moved onto the integers
+    startX, startY, startZ = (num + 0.5 for num in startPoint)
+
+    stepX, tDeltaX, tMaxX = getAxisSteps(startX, directionX / length)
+    stepY, tDeltaY, tMaxY = getAxisSteps(startY, directionY / length)
+    stepZ, tDeltaZ, tMaxZ = getAxisSteps(startZ, directionZ / length)
+
+    surfaceX = entrySurfaces[0][stepX < 0]
+    surfaceY = entrySurfaces[1][stepY < 0]
+    surfaceZ = entrySurfaces[2][stepZ < 0]
+
+    blockX, blockY, blockZ = floor(startX), floor(startY), floor(startZ)
+
+    while True:
+        if tMaxX <= tMaxY and tMaxX <= tMaxZ:
+            distance = tMaxX
+            blockX += stepX
+            tMaxX += tDeltaX
+            surfaceIndex = surfaceX
+        elif tMaxY <= tMaxZ:
+            distance = tMaxY
+            blockY += stepY
+            tMaxY += tDeltaY
+            surfaceIndex = surfaceY
+        else:
+            distance = tMaxZ
+            blockZ += stepZ
+            tMaxZ += tDeltaZ
+            surfaceIndex = surfaceZ
+
+        if distance > maxDist:
+            return None
+
+        if isSolid(blockX, blockY, blockZ):
+            return (blockX, blockY, blockZ), surfaceIndex, distance
@@ -0,0 +1,220 @@
+"""
+Handler for the Region Files, which store the Blocks of many Chunks in one file
+
+A Region File starts with a table of a (offset, length) uint32 pair for each Chunk of the Region.
+A length of 0 means the Chunk isn't stored. Each stored Chunk is the (Y, X, Z) shape as 3 uint16
+followed by the zlib compressed Block Type values.
+
+Class
+-----
+RegionFile - Handles a Single Region File
+"""
+
+import os
+import zlib
+
+import numpy as np
+
+from errors import RegionError
+
+
+class RegionFile:
+    """
+    This Class Handles a Single Region File of regionSize by regionSize Chunks
+
+    Parameters
+    ----------
+    path : str
+        Path of the Region File, it is created with the first saved Chunk
+
+    Attributes
+    ----------
+    path : str
+        Path of the Region File
+
+    regionSize : int
+        Class Attribute, the amount of Chunks along X and Z in a Region
+
+    headerSize : int
+        Class Attribute, the size of the offset table in bytes
+
+    compressionLevel : int
+        Class Attribute, the zlib level the Chunks are compressed with
+
+    shapeType : np.dtype
+        Class Attribute, the little-endian type of the stored shape
+
+    tableType : np.dtype
+        Class Attribute, the little-endian type of the stored offsetTable
+
+    offsetTable : np.ndarray
+        A uint32 array with the shape (regionSize * regionSize, 2) of the (offset, length) of each Chunk
+    """
+
+    regionSize = 32
+    headerSize = regionSize * regionSize * 8
+    compressionLevel = 6
+
+    shapeType = np.dtype("<u2")
+    tableType = np.dtype("<u4")
+
+    def __init__(self, path: str):
+        self.path = path
+
+        if os.path.exists(self.path):
+            with open(self.path, "rb") as regionFile:
+                header = regionFile.read(self.headerSize)
+
+            if len(header) != self.headerSize:
+                raise RegionError(f"{self.path} has a incomplete offset table")
+
+            self.offsetTable = np.frombuffer(header, self.tableType).reshape(-1, 2).astype(np.uint32)
+        else:
+            self.offsetTable = np.zeros((self.regionSize * self.regionSize, 2), dtype=np.uint32)
+
+    @classmethod
+    def getRegionCoord(cls, chunkX: int, chunkZ: int):
+        """
+        Gets the Region Coordinate a Chunk Coordinate is stored in
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        Returns
+        -------
+        tuple
+            (X, Z) Region Coordinate
+        """
+
+        return chunkX // cls.regionSize, chunkZ // cls.regionSize
+
+    def getTableIndex(self, chunkX: int, chunkZ: int):
+        """
+        Gets the index in the offsetTable of a Chunk Coordinate
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        Returns
+        -------
+        int
+        """
+
+        return (chunkZ % self.regionSize) * self.regionSize + chunkX % self.regionSize
+
+    def hasChunk(self, chunkX: int, chunkZ: int):
+        """
+        Checks whether a Chunk is stored in the Region File
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        Returns
+        -------
+        bool
+        """
+
+        return bool(self.offsetTable[self.getTableIndex(chunkX, chunkZ), 1])
+
+    def readChunk(self, chunkX: int, chunkZ: int):
+        """
+        Reads the Blocks of a Chunk from the Region File
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        Returns
+        -------
+        None/np.ndarray
+            A uint8 array of Block Type values with the shape (Y, X, Z), None when the Chunk isn't stored
+        """
+
+        offset, length = self.offsetTable[self.getTableIndex(chunkX, chunkZ)]
+
+        if not length:
+            return None
+
+        with open(self.path, "rb") as regionFile:
+            regionFile.seek(int(offset))
+            chunkData = regionFile.read(int(length))
+
+        shapeSize = self.shapeType.itemsize * 3
+
+        if len(chunkData) != length:
+            raise RegionError(f"Chunk {chunkX}, {chunkZ} is cut off in {self.path}")
+
+        shape = tuple(np.frombuffer(chunkData[:shapeSize], self.shapeType).tolist())
+
+        try:
+            blockData = zlib.decompress(chunkData[shapeSize:])
+        except zlib.error as error:
+            raise RegionError(f"Chunk {chunkX}, {chunkZ} can't be decompressed in {self.path}") from error
+
+        return np.frombuffer(blockData, dtype=np.uint8).reshape(shape).copy()
+
+    def writeChunk(self, chunkX: int, chunkZ: int, blocks: np.ndarray):
+        """
+        Writes the Blocks of a Chunk to the Region File
+        The Chunk is written over its old data when it fits, otherwise it is added to the end of the file
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        blocks : np.ndarray
+            A uint8 array of Block Type values with the shape (Y, X, Z)
+
+        Returns
+        -------
+        None
+        """
+
+        chunkData = np.array(blocks.shape, dtype=self.shapeType).tobytes()
+        chunkData += zlib.compress(np.ascontiguousarray(blocks, dtype=np.uint8).tobytes(), self.compressionLevel)
+
+        tableIndex = self.getTableIndex(chunkX, chunkZ)
+        oldOffset, oldLength = self.offsetTable[tableIndex]
+
+        if not os.path.exists(self.path):
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+            with open(self.path, "wb") as regionFile:
+                regionFile.write(self.offsetTable.astype(self.tableType).tobytes())
+
+        with open(self.path, "r+b") as regionFile:
+            if oldLength and len(chunkData) <= oldLength:
+                offset = int(oldOffset)
+            else:
+                offset = regionFile.seek(0, os.SEEK_END)
+
+            regionFile.seek(offset)
+            regionFile.write(chunkData)
+
+            self.offsetTable[tableIndex] = offset, len(chunkData)
+
+            regionFile.seek(tableIndex * 8)
+            regionFile.write(self.offsetTable[tableIndex].astype(self.tableType).tobytes())
@@ -0,0 +1,341 @@
+"""
+Handler for the Chunk Sections
+
+Class
+-----
+Section - This handle a single vertical Section of a Chunk
+"""
+
+import numpy as np
+
+import culling
+import enums
+import mesher
+from vbohandler import VBOHandler
+
+
+class Section:
+    """
+    This Class handle a fixed-height vertical slice of a Chunk, the Blocks stay in the Chunk's arrays
+
+    Parameters
+    ----------
+    chunk : Chunk
+        The Chunk the Section is part of
+
+    yStart : int
+        The first Y of the Section in the Chunk
+
+    yEnd : int
+        The Y after the last layer of the Section in the Chunk
+
+    Attributes
+    ----------
+    chunk : Chunk
+        The Chunk the Section is part of
+
+    yStart : int
+        The first Y of the Section in the Chunk
+
+    yEnd : int
+        The Y after the last layer of the Section in the Chunk
+
+    isEmpty : bool
+        Whether every block of the Section is Air
+
+    isSolid : bool
+        Whether every block of the Section is solid
+
+    faceConnectivity : np.ndarray
+        A (6, 6) bool array of which faces of the Section can see each other through Air, from
+        culling.buildFaceConnectivity, every face is connected until it is worked out
+
+    sectionVBO : None/vbohandler.VBOHandler
+        A VBO of the Section's visible surfaces, when the Chunk doesn't have a bufferArena
+
+    meshAllocation : None/arenahandler.ArenaAllocation
+        The range of the Chunk's bufferArena with the Section's visible surfaces
+
+    meshDirty : bool
+        Whether the Blocks changed since the sectionVBO was generated
+    """
+
+    def __init__(self, chunk, yStart: int, yEnd: int):
+        self.chunk = chunk
+
+        self.yStart = yStart
+        self.yEnd = yEnd
+
+        self.isEmpty = True
+        self.isSolid = False
+        self.faceConnectivity = np.ones((6, 6), dtype=bool)
+
+        self.sectionVBO = None
+        self.meshAllocation = None
+        self.meshDirty = False
+
+    @property
+    def blocks(self):
+        return self.chunk.blocks[self.yStart:self.yEnd]
+
+    @property
+    def surfacesShow(self):
+        return self.chunk.surfacesShow[:, self.yStart:self.yEnd]
+
+    def updateFlags(self):
+        """
+        Updates the isEmpty and isSolid flags from the Blocks
+
+        Returns
+        -------
+        None
+        """
+
+        airBlocks = self.blocks == enums.BlockType.AIR.value
+
+        self.isEmpty = bool(airBlocks.all())
+        self.isSolid = not airBlocks.any()
+
+    def updateConnectivity(self):
+        """
+        Updates which faces of the Section are connected through Air
+
+        Returns
+        -------
+        None
+        """
+
+        self.faceConnectivity = culling.buildFaceConnectivity(self.blocks)
+
+    def canSkipCulling(self, solidMask: np.ndarray):
+        """
+        Checks whether the Section can't have any visible surfaces, so culling can skip it
+
+        Parameters
+        ----------
+        solidMask : np.ndarray
+            The padded solid mask of the Chunk from culling.buildSolidMask
+
+        Returns
+        -------
+        bool
+        """
+
+        if self.isEmpty:
+            return True
+
+        if not self.isSolid:
+            return False
+
+        # A solid Section is hidden when every block around it is solid as well
+        region = solidMask[self.yStart:self.yEnd + 2]
+
+        return bool(
+            region[[0, -1], 1:-1, 1:-1].all() and
+            region[1:-1, [0, -1], 1:-1].all() and
+            region[1:-1, 1:-1, [0, -1]].all()
+        )
+
+    def getMeshOffset(self):
+        """
+        Gets the Position of the Section's mesh origin, the lowest corner of its first block
+
+        Returns
+        -------
+        tuple
+        """
+
+        offsetX, offsetY, offsetZ = self.chunk.getMeshOffset()
+
+        return offsetX, offsetY + self.yStart, offsetZ
+
+    def genVBO(self, lodSurfaces=None):
+        """
+        Generates the VBO of the Section, an existing VBO is updated in place
+
+        Parameters
+        ----------
+        lodSurfaces : None/tuple
+            Keyword-Argument, the (cellSurfaces, cellBlocks) of the whole Chunk from Chunk.getLodSurfaces,
+            worked out here when None and the Chunk's lodFactor isn't 1
+
+        Returns
+        -------
+        None
+        """
+
+        surfacesShow = self.surfacesShow
+
+        if not self.sectionVBO and not self.meshAllocation and not surfacesShow.any():
+            self.meshDirty = False
+            return
+
+        lodFactor = self.chunk.lodFactor
+
+        if lodFactor != 1:
+            cellSurfaces, cellBlocks = lodSurfaces or self.chunk.getLodSurfaces()
+
+            cellLayers = np.s_[self.yStart // lodFactor:self.yEnd // lodFactor]
+            surfacesShow = cellSurfaces[:, cellLayers]
+            blocks = cellBlocks[cellLayers]
+        else:
+            blocks = self.blocks
+
+        self.uploadMesh(*mesher.buildSectionMesh(
+            surfacesShow,
+            blocks,
+            self.chunk.greedyMeshing,
+            self.chunk.vertexFormat,
+            self.getMeshOffset(),
+            scale=lodFactor
+        ))
+
+    def uploadMesh(self, combinedData, surfaceQuadCounts=None):
+        """
+        Uploads the Vertex Data of the Section to the Chunk's bufferArena or its VBO, an existing VBO is updated in place
+
+        Parameters
+        ----------
+        combinedData : None/np.ndarray
+            The Vertex Data in the Chunk's vertexFormat, None when the Section has no surfaces
+
+        surfaceQuadCounts : None/np.ndarray
+            Keyword-Argument, the amount of Quads of each surface index when the Quads are grouped by it
+
+        Returns
+        -------
+        None
+        """
+
+        self.meshDirty = False
+        bufferArena = self.chunk.bufferArena
+
+        if bufferArena:
+            if combinedData is None or not len(combinedData):
+                if self.meshAllocation:
+                    bufferArena.free(self.meshAllocation)
+                    self.meshAllocation = None
+            else:
+                self.meshAllocation = bufferArena.upload(self.meshAllocation, combinedData, surfaceQuadCounts,
+                                                         offset=self.getMeshOffset())
+
+            return
+
+        if combinedData is None:
+            if self.sectionVBO:
+                self.sectionVBO.update(np.empty(0, self.sectionVBO.combinedData.dtype), np.zeros(6, dtype=int))
+
+            return
+
+        if self.sectionVBO:
+            self.sectionVBO.update(combinedData, surfaceQuadCounts)
+        else:
+            self.sectionVBO = VBOHandler(combinedData, vertexFormat=self.chunk.vertexFormat, offset=self.getMeshOffset(),
+                                         surfaceQuadCounts=surfaceQuadCounts)
+
+    def getSurfacesFacingPoint(self, point: tuple):
+        """
+        Works out which surface directions of the Section can face a point, from the bounds of the Section
+        A surface can only be seen from the side its normal points to
+
+        Parameters
+        ----------
+        point : tuple
+            The (X, Y, Z) of the point
+
+        Returns
+        -------
+        tuple
+            A bool for each surface index, in the order of Block.surfaces
+        """
+
+        (minX, minY, minZ), (maxX, maxY, maxZ) = self.chunk.boundingBox
+        minY += self.yStart
+        maxY = minY + self.yEnd - self.yStart
+
+        pointX, pointY, pointZ = point
+
+        return (
+            pointY > minY,  # Top
+            pointY < maxY,  # Bottom
+
+            pointZ > minZ,  # Back
+            pointZ < maxZ,  # Front
+
+            pointX < maxX,  # Left
+            pointX > minX,  # Right
+        )
+
+    def updateMesh(self, lodSurfaces=None):
+        """
+        Regenerates the VBO if the Section is marked for remeshing
+
+        Parameters
+        ----------
+        lodSurfaces : None/tuple
+            Keyword-Argument, the (cellSurfaces, cellBlocks) of the whole Chunk from Chunk.getLodSurfaces
+
+        Returns
+        -------
+        None
+        """
+
+        if self.meshDirty:
+            self.genVBO(lodSurfaces)
+
+    def getSurfacesVisible(self, cameraPosition=None):
+        """
+        Gets which groups of surfaces of the Section to draw
+
+        Parameters
+        ----------
+        cameraPosition : None/tuple
+            Keyword-Argument, the (X, Y, Z) of the camera to skip the surfaces facing away from it
+
+        Returns
+        -------
+        None/tuple
+            None to draw every surface, otherwise a bool for each surface index from getSurfacesFacingPoint
+        """
+
+        if cameraPosition is None:
+            return None
+
+        return self.getSurfacesFacingPoint(cameraPosition)
+
+    def draw(self, cameraPosition=None):
+        """
+        Draws the Section's VBO, the meshes in a bufferArena are drawn together by the World
+
+        Parameters
+        ----------
+        cameraPosition : None/tuple
+            Keyword-Argument, the (X, Y, Z) of the camera to skip the surfaces facing away from it,
+            None draws every surface
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.sectionVBO:
+            return
+
+        self.sectionVBO.draw(self.getSurfacesVisible(cameraPosition))
+
+    def delete(self):
+        """
+        Deletes the Section's VBO and frees its range of the bufferArena
+
+        Returns
+        -------
+        None
+        """
+
+        if self.sectionVBO:
+            self.sectionVBO.delete()
+            self.sectionVBO = None
+
+        if self.meshAllocation:
+            self.chunk.bufferArena.free(self.meshAllocation)
+            self.meshAllocation = None
@@ -0,0 +1,102 @@
+"""
+Handler for the Shaders
+
+Class
+-----
+ShaderProgram - Handles a Single Shader Program
+"""
+
+from OpenGL.GL import *
+from OpenGL.GL.shaders import compileShader
+
+from errors import ShaderError
+
+
+class ShaderProgram:
+    """
+    This Class Handles a Single Shader Program
+
+    Parameters
+    ----------
+    vertexSource : str
+        GLSL Source of the Vertex Shader
+
+    fragmentSource : str
+        GLSL Source of the Fragment Shader
+
+    attributeLocations : dict
+        A attribute name: location dict, bound before the program is linked
+
+    Attributes
+    ----------
+    program : int
+        The OpenGL program name
+
+    uniformLocations : dict
+        A uniform name: location cache
+    """
+
+    def __init__(self, vertexSource: str, fragmentSource: str, attributeLocations: dict):
+        vertexShader = compileShader(vertexSource, GL_VERTEX_SHADER)
+        fragmentShader = compileShader(fragmentSource, GL_FRAGMENT_SHADER)
+
+        self.program = glCreateProgram()
+        glAttachShader(self.program, vertexShader)
+        glAttachShader(self.program, fragmentShader)
+
+        for name, location in attributeLocations.items():
+            glBindAttribLocation(self.program, location, name)
+
+        glLinkProgram(self.program)
+
+        glDeleteShader(vertexShader)
+        glDeleteShader(fragmentShader)
+
+        if glGetProgramiv(self.program, GL_LINK_STATUS) != GL_TRUE:
+            raise ShaderError(glGetProgramInfoLog(self.program))
+
+        self.uniformLocations = {}
+
+    def getUniformLocation(self, name: str):
+        """
+        Gets the Location of a Uniform
+
+        Parameters
+        ----------
+        name : str
+            Name of the Uniform
+
+        Returns
+        -------
+        int
+        """
+
+        if name not in self.uniformLocations:
+            self.uniformLocations[name] = glGetUniformLocation(self.program, name)
+
+        return self.uniformLocations[name]
+
+    def use(self):
+        """
+        Uses the Program for the next draws
+
+        Returns
+        -------
+        None
+        """
+
+        glUseProgram(self.program)
+
+    def stop(self):
+        """
+        Goes back to the fixed-function pipeline
+
+        Returns
+        -------
+        None
+        """
+
+        glUseProgram(0)
+
+    def delete(self):
+        glDeleteProgram(self.program)
@@ -0,0 +1,158 @@
+"""
+Handles Terrain Generation
+
+Functions
+-----
+generateHeightmap - Generates the Heightmap of a Chunk in one batch
+
+generateBlockTypes - Fills layers of a Chunk's voxel volume from a Heightmap
+
+generateChunkBlocks - Generates the whole voxel volume of a Chunk, leaving the Sections above the Heightmap as Air
+"""
+
+from math import sqrt
+
+import numpy as np
+
+import enums
+
+rangeValues = [-sqrt(2) / 2, sqrt(2) / 2]
+
+
+def generateHeightmap(noise, minX: float, minZ: float, sizeX: int, sizeY: int, sizeZ: int, scale: int):
+    """
+    Generates the Height of the highest solid block for every column of a Chunk
+
+    Parameters
+    ----------
+    noise : opensimplex.OpenSimplex
+        The OpenSimplex noise, shared across the chunks
+
+    minX : float
+        The X Position of the first column of the Chunk
+
+    minZ : float
+        The Z Position of the first column of the Chunk
+
+    sizeX : int
+        Amount of columns along X
+
+    sizeY : int
+        Height of the Chunk
+
+    sizeZ : int
+        Amount of columns along Z
+
+    scale : int
+        Divide Scale for the Noise Library
+
+    Returns
+    -------
+    np.ndarray
+        A int array with the shape (X, Z)
+    """
+
+    noiseX = (minX + np.arange(sizeX)) / scale
+    noiseZ = (minZ + np.arange(sizeZ)) / scale
+
+    if hasattr(noise, "noise2array"):
+        # noise2array returns the values indexed [z][x]
+        noiseValues = noise.noise2array(noiseX, noiseZ).T
+    else:
+        noiseValues = np.array([[noise.noise2d(x=x, y=z) for z in noiseZ] for x in noiseX])
+
+    heightmap = noiseValues + rangeValues[1]
+    heightmap *= sizeY / (rangeValues[1] * 2)
+
+    return np.trunc(heightmap).astype(np.int32)
+
+
+def generateBlockTypes(heightmap: np.ndarray, yStart: int, yEnd: int):
+    """
+    Fills the layers yStart to yEnd of a Chunk by comparing each layer against the Heightmap
+
+    Parameters
+    ----------
+    heightmap : np.ndarray
+        A int array with the shape (X, Z), from generateHeightmap
+
+    yStart : int
+        The first layer to fill
+
+    yEnd : int
+        The layer after the last layer to fill
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of Block Type values with the shape (yEnd - yStart, X, Z)
+    """
+
+    y = np.arange(yStart, yEnd).reshape(-1, 1, 1)
+    height = heightmap[np.newaxis]
+
+    return np.select(
+        [
+            y == height,
+            (0 < y) & (y < height),
+            y == 0,
+        ],
+        [
+            enums.BlockType.GRASS.value,
+            enums.BlockType.DIRT.value,
+            enums.BlockType.STONE.value,
+        ],
+        default=enums.BlockType.AIR.value
+    ).astype(np.uint8)
+
+
+def generateChunkBlocks(noise, minX: float, minZ: float, sizeX: int, sizeY: int, sizeZ: int, scale: int,
+                        sectionHeight: int):
+    """
+    Generates the Block Types of a Chunk from a Heightmap computed once per Chunk
+    Sections above the Heightmap are left as Air
+
+    Parameters
+    ----------
+    noise : opensimplex.OpenSimplex
+        The OpenSimplex noise, shared across the chunks
+
+    minX : float
+        The X Position of the first column of the Chunk
+
+    minZ : float
+        The Z Position of the first column of the Chunk
+
+    sizeX : int
+        Amount of columns along X
+
+    sizeY : int
+        Height of the Chunk
+
+    sizeZ : int
+        Amount of columns along Z
+
+    scale : int
+        Divide Scale for the Noise Library
+
+    sectionHeight : int
+        The height of each Chunk Section
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of Block Type values with the shape (Y, X, Z)
+    """
+
+    heightmap = generateHeightmap(noise, minX, minZ, sizeX, sizeY, sizeZ, scale)
+    maxHeight = heightmap.max()
+
+    blocks = np.full((sizeY, sizeX, sizeZ), enums.BlockType.AIR.value, dtype=np.uint8)
+
+    for yStart in range(0, sizeY, sectionHeight):
+        # The bottom layer is always Stone
+        if yStart == 0 or yStart <= maxHeight:
+            yEnd = min(yStart + sectionHeight, sizeY)
+            blocks[yStart:yEnd] = generateBlockTypes(heightmap, yStart, yEnd)
+
+    return blocks
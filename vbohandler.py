@@ -3,52 +3,835 @@ Handler for the VBO
 
 Class
 -----
+BufferPool - Reuses the buffers of deleted VBOs and counts the live buffers
+
 VBOHandler - Handles a Single VBO
 """
 
 from ctypes import c_void_p
 
-import OpenGL.arrays.vbo as glVBO
 import numpy as np
 from OpenGL.GL import *
 
+import mesher
+from shaderhandler import ShaderProgram
+
+packedVertexSource = """
+#version 120
+
+attribute vec3 position;
+attribute vec2 surfaceBlockType;
+
+// Set per mesh by the BufferArena's multi-draw, left disabled it is 0 and the chunkOffset is used
+attribute vec3 meshOffset;
+
+uniform vec3 chunkOffset;
+uniform vec3 normals[6];
+uniform vec3 palette[{paletteSize}];
+
+varying vec4 colour;
+
+void main() {{
+    vec4 worldPosition = vec4(position + chunkOffset + meshOffset, 1.0);
+    vec4 eyePosition = gl_ModelViewMatrix * worldPosition;
+
+    vec3 normal = normalize(gl_NormalMatrix * normals[int(surfaceBlockType.x)]);
+    vec4 lightPosition = gl_LightSource[0].position;
+    vec3 lightDirection = normalize(lightPosition.xyz - eyePosition.xyz * lightPosition.w);
+
+    // Same terms as the fixed-function lighting with GL_COLOR_MATERIAL
+    vec3 light = gl_LightModel.ambient.rgb + gl_LightSource[0].ambient.rgb +
+                 gl_LightSource[0].diffuse.rgb * max(dot(normal, lightDirection), 0.0);
+
+    colour = vec4(palette[int(surfaceBlockType.y)] * light, 1.0);
+    gl_Position = gl_ModelViewProjectionMatrix * worldPosition;
+}}
+"""
+
+packedFragmentSource = """
+#version 120
+
+varying vec4 colour;
+
+void main() {
+    gl_FragColor = colour;
+}
+"""
+
+
+class BufferPool:
+    """
+    This Class keeps the buffers of deleted VBOs to be reused, in buckets of power of two capacities,
+    and counts every buffer which hasn't been deleted so leaks show up
+
+    Attributes
+    ----------
+    freeBuffers : dict
+        Class Attribute, Key: capacity in bytes, Value: list of the buffer names ready to be reused
+
+    maxFreeBuffers : int
+        Class Attribute, the most buffers kept in each bucket, released buffers past it are deleted
+
+    minCapacity : int
+        Class Attribute, the capacity in bytes of the smallest bucket
+
+    liveBufferCount : int
+        Class Attribute, the amount of buffers created and not yet deleted, the free buffers included
+
+    liveBufferBytes : int
+        Class Attribute, the total capacity in bytes of the live buffers
+    """
+
+    freeBuffers = {}
+    maxFreeBuffers = 16
+    minCapacity = 4096
+
+    liveBufferCount = 0
+    liveBufferBytes = 0
+
+    @classmethod
+    def getBucketCapacity(cls, byteCount: int):
+        """
+        Gets the capacity of the bucket for a buffer of byteCount bytes
+
+        Parameters
+        ----------
+        byteCount : int
+            The amount of bytes the buffer has to hold
+
+        Returns
+        -------
+        int
+            The smallest power of two capacity in bytes it fits in
+        """
+
+        return max(cls.minCapacity, 1 << max(byteCount - 1, 0).bit_length())
+
+    @classmethod
+    def createBuffer(cls, capacity: int):
+        """
+        Creates an empty buffer, counted in the live buffers
+
+        Parameters
+        ----------
+        capacity : int
+            The size of the buffer in bytes
+
+        Returns
+        -------
+        int
+            The OpenGL buffer name
+        """
+
+        vbo = glGenBuffers(1)
+
+        glBindBuffer(GL_COPY_WRITE_BUFFER, vbo)
+        glBufferData(GL_COPY_WRITE_BUFFER, capacity, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_COPY_WRITE_BUFFER, 0)
+
+        cls.liveBufferCount += 1
+        cls.liveBufferBytes += capacity
+
+        return vbo
+
+    @classmethod
+    def resizeBuffer(cls, oldCapacity: int, capacity: int):
+        """
+        Counts a live buffer which was given new storage with glBufferData
+
+        Parameters
+        ----------
+        oldCapacity : int
+            The size of the buffer in bytes before
+
+        capacity : int
+            The size of the buffer in bytes now
+
+        Returns
+        -------
+        None
+        """
+
+        cls.liveBufferBytes += capacity - oldCapacity
+
+    @classmethod
+    def deleteBuffer(cls, vbo: int, capacity: int):
+        """
+        Deletes a buffer
+
+        Parameters
+        ----------
+        vbo : int
+            The OpenGL buffer name
+
+        capacity : int
+            The size of the buffer in bytes
+
+        Returns
+        -------
+        None
+        """
+
+        glDeleteBuffers(1, [vbo])
+
+        cls.liveBufferCount -= 1
+        cls.liveBufferBytes -= capacity
+
+    @classmethod
+    def acquire(cls, byteCount: int):
+        """
+        Gets a buffer which can hold byteCount bytes, a free buffer of the bucket is reused before one is created
+
+        Parameters
+        ----------
+        byteCount : int
+            The amount of bytes the buffer has to hold
+
+        Returns
+        -------
+        tuple
+            (buffer name, capacity in bytes)
+        """
+
+        capacity = cls.getBucketCapacity(byteCount)
+        bucket = cls.freeBuffers.get(capacity)
+
+        if bucket:
+            return bucket.pop(), capacity
+
+        return cls.createBuffer(capacity), capacity
+
+    @classmethod
+    def release(cls, vbo: int, capacity: int):
+        """
+        Gives a buffer back to its bucket to be reused, it is deleted when the bucket is full
+
+        Parameters
+        ----------
+        vbo : int
+            The OpenGL buffer name from acquire
+
+        capacity : int
+            The capacity in bytes from acquire
+
+        Returns
+        -------
+        None
+        """
+
+        bucket = cls.freeBuffers.setdefault(capacity, [])
+
+        if len(bucket) < cls.maxFreeBuffers:
+            bucket.append(vbo)
+        else:
+            cls.deleteBuffer(vbo, capacity)
+
+    @classmethod
+    def clear(cls):
+        """
+        Deletes every free buffer
+
+        Returns
+        -------
+        None
+        """
+
+        for capacity, bucket in cls.freeBuffers.items():
+            for vbo in bucket:
+                cls.deleteBuffer(vbo, capacity)
+
+        cls.freeBuffers.clear()
+
 
 class VBOHandler:
-    def __init__(self, combinedData):
-        self.combinedData = combinedData
-        self.combinedData = np.array(self.combinedData, np.float32)
+    """
+    This Class Handles a Single VBO (Vector Buffer Object) and its VAO (Vertex Array Object)
+
+    Parameters
+    ----------
+    combinedData : np.ndarray
+        The Vertex Data in the vertexFormat
+
+    vertexFormat : str
+        Keyword-Argument, "float" for 9 floats per vertex (position, colour, normal)
+        or "packed" for mesher.packedVertexType which is drawn with a shader
+
+    offset : tuple
+        Keyword-Argument, the (X, Y, Z) added to the packed positions
+
+    surfaceQuadCounts : None/np.ndarray
+        Keyword-Argument, the amount of Quads of each surface index when the Quads are grouped by it
+
+    Attributes
+    ----------
+    combinedData : np.ndarray
+        The Vertex Data with one element or row per vertex
+
+    vertexFormat : str
+        "float" or "packed"
 
-        self.vbo = glVBO.VBO(self.combinedData)
-        self.vbo.bind()
+    vertexSize : int
+        Size of a single vertex in bytes
 
+    offset : tuple
+        The (X, Y, Z) added to the packed positions
+
+    surfaceQuadCounts : None/np.ndarray
+        The amount of Quads of each surface index, None when the Quads aren't grouped so they are always all drawn
+
+    capacity : int
+        The size of the buffer in bytes, the power of two bucket of the BufferPool it came from
+
+    capacityHeadroom : float
+        Multiplier for the size of the data when a buffer is acquired, so small edits can be updated in place
+
+    vbo : None/int
+        The OpenGL buffer name, None after delete
+
+    vao : None/int
+        The OpenGL vertex array name, None after delete
+
+    packedShader : None/ShaderProgram
+        Class Attribute, the shader shared by every packed VBO, created with the first one
+
+    quadIndexBuffer : None/int
+        Class Attribute, the element buffer shared by every VBO, drawing each Quad as two triangles
+
+    quadIndexCapacity : int
+        Class Attribute, the amount of Quads the quadIndexBuffer has indices for
+
+    sharedBufferOwners : int
+        Class Attribute, the amount of owners holding the shared buffers, they are deleted when the last one releases them
+
+    liveVertexArrayCount : int
+        Class Attribute, the amount of VAOs created and not yet deleted
+    """
+
+    packedShader = None
+
+    quadIndexBuffer = None
+    quadIndexCapacity = 0
+
+    sharedBufferOwners = 0
+
+    liveVertexArrayCount = 0
+
+    def __init__(self, combinedData, vertexFormat="float", offset=(0, 0, 0), surfaceQuadCounts=None):
+        self.vertexFormat = vertexFormat
+        self.offset = offset
+        self.surfaceQuadCounts = surfaceQuadCounts
+
+        self.combinedData = self.prepareData(combinedData, self.vertexFormat)
+        self.vertexSize = self.getVertexSize(self.vertexFormat)
+
+        self.capacity = 0
+        self.capacityHeadroom = 1.25
+
+        self.vbo = None
         self.vao = glGenVertexArrays(1)
+        VBOHandler.liveVertexArrayCount += 1
+
+        self.allocate(self.combinedData)
+
+    def setPointers(self):
+        """
+        Points the VAO at the VBO and the shared Quad element buffer
+
+        Returns
+        -------
+        None
+        """
+
+        quadIndexBuffer = self.reserveQuadIndices(self.quadCount)
+
         glBindVertexArray(self.vao)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+
+        if self.vertexFormat == "packed":
+            self.setPackedPointers(self.vertexSize)
+        else:
+            self.setFloatPointers(self.vertexSize)
+
+        # The element buffer binding is part of the VAO
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, quadIndexBuffer)
+
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    @classmethod
+    def getPackedShader(cls):
+        """
+        Gets the shader for the packed vertex format, creating it the first time
+
+        Returns
+        -------
+        ShaderProgram
+        """
+
+        if not cls.packedShader:
+            palette = mesher.colourPalette
+
+            cls.packedShader = ShaderProgram(
+                packedVertexSource.format(paletteSize=len(palette)),
+                packedFragmentSource,
+                {"position": 0, "surfaceBlockType": 1, "meshOffset": 2}
+            )
+
+            cls.packedShader.use()
+            glUniform3fv(cls.packedShader.getUniformLocation("normals"), 6, mesher.surfaceNormals)
+            glUniform3fv(cls.packedShader.getUniformLocation("palette"), len(palette), palette)
+            cls.packedShader.stop()
+
+        return cls.packedShader
+
+    @classmethod
+    def reserveQuadIndices(cls, quadCount: int):
+        """
+        Makes sure the shared element buffer has indices for at least quadCount Quads
+        The buffer keeps its name when it grows, so the VAOs using it stay valid
+
+        Parameters
+        ----------
+        quadCount : int
+            The amount of Quads that will be drawn
+
+        Returns
+        -------
+        int
+            The OpenGL buffer name of the shared element buffer
+        """
+
+        if cls.quadIndexBuffer is None:
+            cls.quadIndexBuffer = BufferPool.createBuffer(0)
+
+        if quadCount > cls.quadIndexCapacity:
+            oldCapacity = cls.quadIndexCapacity
+            cls.quadIndexCapacity = max(quadCount, cls.quadIndexCapacity * 2, 1024)
+            quadIndices = mesher.buildQuadIndices(cls.quadIndexCapacity)
+
+            # Binding without a VAO, so the current VAO's element buffer doesn't change
+            glBindVertexArray(0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, cls.quadIndexBuffer)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, quadIndices.nbytes, quadIndices, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+            # 6 uint32 indices per Quad
+            BufferPool.resizeBuffer(oldCapacity * 6 * 4, quadIndices.nbytes)
+
+        return cls.quadIndexBuffer
+
+    @classmethod
+    def holdSharedBuffers(cls):
+        """
+        Adds an owner of the shared element buffer, the packed shader and the free buffers of the BufferPool
+
+        Returns
+        -------
+        None
+        """
+
+        cls.sharedBufferOwners += 1
+
+    @classmethod
+    def releaseSharedBuffers(cls):
+        """
+        Removes an owner of the shared buffers, the last owner deletes them
+
+        Returns
+        -------
+        None
+        """
+
+        cls.sharedBufferOwners = max(cls.sharedBufferOwners - 1, 0)
+
+        if not cls.sharedBufferOwners:
+            cls.deleteSharedBuffers()
+
+    @classmethod
+    def deleteSharedBuffers(cls):
+        """
+        Deletes the shared element buffer, the packed shader and the free buffers of the BufferPool,
+        after every VBO is deleted
+
+        Returns
+        -------
+        None
+        """
+
+        if cls.quadIndexBuffer is not None:
+            BufferPool.deleteBuffer(cls.quadIndexBuffer, cls.quadIndexCapacity * 6 * 4)
+
+            cls.quadIndexBuffer = None
+            cls.quadIndexCapacity = 0
+
+        if cls.packedShader:
+            cls.packedShader.delete()
+            cls.packedShader = None
+
+        BufferPool.clear()
+
+    @property
+    def quadCount(self):
+        return len(self.combinedData) // 4
+
+    @staticmethod
+    def getVertexSize(vertexFormat: str):
+        """
+        Gets the size of a single vertex of a vertex format
+
+        Parameters
+        ----------
+        vertexFormat : str
+            "float" or "packed"
+
+        Returns
+        -------
+        int
+            Size of a single vertex in bytes
+        """
+
+        if vertexFormat == "packed":
+            return mesher.packedVertexType.itemsize
+
+        return 9 * np.dtype(np.float32).itemsize
+
+    @staticmethod
+    def prepareData(combinedData, vertexFormat: str):
+        """
+        Converts the Vertex Data to the array layout of the vertexFormat
+
+        Parameters
+        ----------
+        combinedData : np.ndarray
+            The Vertex Data
+
+        vertexFormat : str
+            "float" or "packed"
+
+        Returns
+        -------
+        np.ndarray
+        """
+
+        if vertexFormat == "packed":
+            return np.ascontiguousarray(combinedData, dtype=mesher.packedVertexType).reshape(-1)
+
+        # One row per vertex: position, colour, normal
+        return np.ascontiguousarray(combinedData, np.float32).reshape(-1, 9)
+
+    @staticmethod
+    def setFloatPointers(vertexSize: int):
+        """
+        Sets the fixed-function position, colour and normal pointers for the float vertex format
+
+        Parameters
+        ----------
+        vertexSize : int
+            Size of a single vertex in bytes
+
+        Returns
+        -------
+        None
+        """
 
         glEnableClientState(GL_VERTEX_ARRAY)
         glEnableClientState(GL_COLOR_ARRAY)
         glEnableClientState(GL_NORMAL_ARRAY)
 
-        stride = (3+3+3)*self.combinedData.itemsize
+        glVertexPointer(3, GL_FLOAT, vertexSize, None)
+        glColorPointer(3, GL_FLOAT, vertexSize, c_void_p(12))
+        glNormalPointer(GL_FLOAT, vertexSize, c_void_p(24))
+
+    @staticmethod
+    def setPackedPointers(vertexSize: int):
+        """
+        Sets the shader attribute pointers for the packed vertex format
 
-        glVertexPointer(3, GL_FLOAT, stride, None)
-        glColorPointer(3, GL_FLOAT, stride, c_void_p(12))
-        glNormalPointer(GL_FLOAT, stride, c_void_p(24))
+        Parameters
+        ----------
+        vertexSize : int
+            Size of a single vertex in bytes
 
-        glBindVertexArray(0)
+        Returns
+        -------
+        None
+        """
+
+        glEnableVertexAttribArray(0)
+        glEnableVertexAttribArray(1)
+
+        glVertexAttribPointer(0, 3, GL_UNSIGNED_SHORT, GL_FALSE, vertexSize, None)
+        glVertexAttribPointer(1, 2, GL_UNSIGNED_BYTE, GL_FALSE, vertexSize, c_void_p(6))
+
+    def allocate(self, combinedData: np.ndarray):
+        """
+        Swaps the VBO for a buffer of the BufferPool with some headroom, uploads the data and points the VAO at it
+        The old buffer goes back to the BufferPool
 
-    def draw(self):
+        Parameters
+        ----------
+        combinedData : np.ndarray
+            The Vertex Data to upload
+
+        Returns
+        -------
+        None
+        """
+
+        if self.vbo is not None:
+            BufferPool.release(self.vbo, self.capacity)
+
+        self.vbo, self.capacity = BufferPool.acquire(int(combinedData.nbytes * self.capacityHeadroom))
+
+        if combinedData.nbytes:
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+            glBufferSubData(GL_ARRAY_BUFFER, 0, combinedData.nbytes, combinedData)
+
+        self.setPointers()
+
+    def fitsCapacity(self, combinedData: np.ndarray):
+        """
+        Checks whether the data can be updated in the current buffer,
+        it has to fit and not be small enough for a bucket a quarter of the size
+
+        Parameters
+        ----------
+        combinedData : np.ndarray
+            The new Vertex Data
+
+        Returns
+        -------
+        bool
+        """
+
+        bucketCapacity = BufferPool.getBucketCapacity(int(combinedData.nbytes * self.capacityHeadroom))
+
+        return combinedData.nbytes <= self.capacity and bucketCapacity * 4 > self.capacity
+
+    @staticmethod
+    def getGroupStarts(quadCount: int, surfaceQuadCounts):
+        """
+        Gets the first vertex of each surface group and the end of the last one
+
+        Parameters
+        ----------
+        quadCount : int
+            The amount of Quads in the mesh
+
+        surfaceQuadCounts : None/np.ndarray
+            The amount of Quads of each surface index, None when the Quads aren't grouped so they are one group
+
+        Returns
+        -------
+        list
+        """
+
+        if surfaceQuadCounts is None:
+            return [0, quadCount * 4]
+
+        return [0] + (np.cumsum(surfaceQuadCounts) * 4).tolist()
+
+    def getChangedRanges(self, combinedData: np.ndarray, surfaceQuadCounts=None):
+        """
+        Gets the ranges of vertices that differ from the data already in the buffer, one surface group at a time
+        A group which kept its place in the buffer only has its changed vertices uploaded, a group which moved
+        because an earlier group changed size is uploaded whole
+
+        Parameters
+        ----------
+        combinedData : np.ndarray
+            The new Vertex Data
+
+        surfaceQuadCounts : None/np.ndarray
+            Keyword-Argument, the amount of Quads of each surface index when the Quads are grouped by it
+
+        Returns
+        -------
+        list
+            A list containing the (start, end) vertex ranges, next to each other ranges are joined
+        """
+
+        newStarts = self.getGroupStarts(len(combinedData) // 4, surfaceQuadCounts)
+        oldStarts = self.getGroupStarts(self.quadCount, self.surfaceQuadCounts)
+
+        if len(newStarts) != len(oldStarts):
+            return [(0, len(combinedData))] if len(combinedData) else []
+
+        changedRanges = []
+
+        for group in range(len(newStarts) - 1):
+            start, end = newStarts[group], newStarts[group + 1]
+
+            if start == end:
+                continue
+
+            if (oldStarts[group], oldStarts[group + 1]) == (start, end):
+                # Compare the raw bytes of each vertex so both vertex formats are handled the same
+                oldBytes = self.combinedData[start:end].view(np.uint8).reshape(end - start, self.vertexSize)
+                newBytes = combinedData[start:end].view(np.uint8).reshape(end - start, self.vertexSize)
+                changedRows = np.flatnonzero((oldBytes != newBytes).any(axis=1))
+
+                if not len(changedRows):
+                    continue
+
+                start, end = start + int(changedRows[0]), start + int(changedRows[-1]) + 1
+
+            if changedRanges and changedRanges[-1][1] == start:
+                changedRanges[-1] = (changedRanges[-1][0], end)
+            else:
+                changedRanges.append((start, end))
+
+        return changedRanges
+
+    def update(self, combinedData, surfaceQuadCounts=None):
+        """
+        Updates the VBO with new Vertex Data
+        Only the changed vertices of each surface group are uploaded when the data fits in the buffer,
+        otherwise the buffer is swapped for one of the BufferPool
+
+        Parameters
+        ----------
+        combinedData : np.ndarray
+            The new Vertex Data
+
+        surfaceQuadCounts : None/np.ndarray
+            Keyword-Argument, the amount of Quads of each surface index when the Quads are grouped by it
+
+        Returns
+        -------
+        None
+        """
+
+        combinedData = self.prepareData(combinedData, self.vertexFormat)
+
+        if not self.fitsCapacity(combinedData):
+            self.allocate(combinedData)
+        else:
+            changedRanges = self.getChangedRanges(combinedData, surfaceQuadCounts)
+
+            if changedRanges:
+                glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+
+                for start, end in changedRanges:
+                    glBufferSubData(
+                        GL_ARRAY_BUFFER,
+                        start * self.vertexSize,
+                        (end - start) * self.vertexSize,
+                        combinedData[start:end]
+                    )
+
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self.combinedData = combinedData
+        self.surfaceQuadCounts = surfaceQuadCounts
+        self.reserveQuadIndices(self.quadCount)
+
+    @staticmethod
+    def getSurfaceDrawRanges(quadCount: int, surfaceQuadCounts, surfacesVisible=None):
+        """
+        Gets the ranges of Quads to draw, next to each other surface groups are drawn as one range
+
+        Parameters
+        ----------
+        quadCount : int
+            The amount of Quads in the mesh
+
+        surfaceQuadCounts : None/np.ndarray
+            The amount of Quads of each surface index, None when the Quads aren't grouped by it
+
+        surfacesVisible : None/tuple
+            Keyword-Argument, a bool for each surface index, None draws every Quad
+
+        Returns
+        -------
+        list
+            A list containing (first Quad, Quad count) tuples
+        """
+
+        if surfacesVisible is None or surfaceQuadCounts is None:
+            return [(0, quadCount)]
+
+        drawRanges = []
+        firstQuad = 0
+
+        for visible, groupQuadCount in zip(surfacesVisible, surfaceQuadCounts.tolist()):
+            if visible and groupQuadCount:
+                if drawRanges and sum(drawRanges[-1]) == firstQuad:
+                    drawRanges[-1] = (drawRanges[-1][0], drawRanges[-1][1] + groupQuadCount)
+                else:
+                    drawRanges.append((firstQuad, groupQuadCount))
+
+            firstQuad += groupQuadCount
+
+        return drawRanges
+
+    def getDrawRanges(self, surfacesVisible=None):
+        """
+        Gets the ranges of Quads of the VBO to draw, from getSurfaceDrawRanges
+
+        Parameters
+        ----------
+        surfacesVisible : None/tuple
+            Keyword-Argument, a bool for each surface index, None draws every Quad
+
+        Returns
+        -------
+        list
+            A list containing (first Quad, Quad count) tuples
+        """
+
+        return self.getSurfaceDrawRanges(self.quadCount, self.surfaceQuadCounts, surfacesVisible)
+
+    def draw(self, surfacesVisible=None):
         """
         Draws the VBO
 
+        Parameters
+        ----------
+        surfacesVisible : None/tuple
+            Keyword-Argument, a bool for each surface index to skip the groups of surfaces which can't be seen,
+            None draws every Quad
+
         Returns
         -------
         None
         """
 
+        drawRanges = self.getDrawRanges(surfacesVisible)
+
+        if not len(self.combinedData) or not drawRanges:
+            return
+
+        if self.vertexFormat == "packed":
+            shader = self.getPackedShader()
+            shader.use()
+            glUniform3f(shader.getUniformLocation("chunkOffset"), *self.offset)
+
         glBindVertexArray(self.vao)
-        glDrawArrays(GL_QUADS, 0, len(self.combinedData))
+
+        # Each Quad has 6 uint32 indices in the shared element buffer
+        for firstQuad, quadCount in drawRanges:
+            glDrawElements(GL_TRIANGLES, quadCount * 6, GL_UNSIGNED_INT, c_void_p(firstQuad * 6 * 4))
+
         glBindVertexArray(0)
 
+        if self.vertexFormat == "packed":
+            shader.stop()
+
     def delete(self):
-        del self.vao
-        del self.vbo
+        """
+        Deletes the VAO and gives the VBO back to the BufferPool, deleting again does nothing
+
+        Returns
+        -------
+        None
+        """
+
+        if self.vao is not None:
+            glDeleteVertexArrays(1, [self.vao])
+            VBOHandler.liveVertexArrayCount -= 1
+            self.vao = None
+
+        if self.vbo is not None:
+            BufferPool.release(self.vbo, self.capacity)
+            self.vbo = None
@@ -6,14 +6,30 @@ Class
 World - A Single World Handler
 """
 
+import json
+import multiprocessing
+import os
+from math import floor
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from random import randint
 from time import time
 
+import numpy as np
 from opensimplex import OpenSimplex
 
+import chunkworker
+import enums
+import frustum
+import occlusion
+from arenahandler import BufferArena
 from chunkhandler import Chunk
+from edithandler import EditLog
+from errors import RegionError, WorldError
 from playerhandler import Player
-from ray import getCloseChunks
+from ray import traverseVoxels
+from regionhandler import RegionFile
+from vbohandler import BufferPool, VBOHandler
 from vector import Vector3, Vector2
 
 
@@ -26,17 +42,129 @@ class World:
     player : Player
         Player Class To get the Camera Class within it
 
+    displayCentre : tuple
+        The Centre of the Display
+
+    seed : None/int
+        Keyword-Argument, the seed of the noise, None uses the saved seed of the World or a random one for a new World
+
+    worldPath : str
+        Keyword-Argument, the folder the World is saved in
+
+    storageMode : None/str
+        Keyword-Argument, "edits" saves only the player's Block edits, "region" saves the Blocks of every Chunk
+        None uses the saved storageMode of the World or "edits" for a new World
+
     Attributes
     ----------
     player : Player
         Player Class To get the Camera Class within it
 
+    seed : int
+        The seed of the noise, the worker processes make their own noise from it
+
     noise : opensimplex.OpenSimplex
         The Noise Data to be shared accross the Chunks
 
     chunkSize : Vector3
         THe Size of each Chunk
 
+    greedyMeshing : bool
+        Whether the Chunk meshes merge adjacent surfaces into larger quads, False uses one quad per surface
+
+    vertexFormat : str
+        The vertex layout of the Chunk meshes, "float" (36 bytes) or "packed" (8 bytes, drawn with a shader)
+
+    sectionHeight : int
+        The height of each Chunk Section, Sections are the unit of culling and remeshing
+
+    streamChunks : bool
+        Whether Chunks are loaded and unloaded around the player as it moves, False keeps the Chunks from setup
+
+    renderDistance : int
+        The distance in Chunks around the player's Chunk that is kept loaded
+
+    unloadMargin : int
+        The extra distance in Chunks before a Chunk is unloaded, so crossing a border back and forth doesn't reload
+
+    chunkLoadsPerFrame : int
+        The most Chunks loaded in a single frame
+
+    chunkLoadQueue : list
+        The (X, Z) Chunk Coordinates waiting to be loaded, nearest to the player first
+
+    streamCentre : None/tuple
+        The (X, Z) Chunk Coordinate the chunkLoadQueue was made around
+
+    workerCount : int
+        The amount of worker processes generating and meshing Chunks, 0 does the work on the render thread
+
+    workerPool : None/concurrent.futures.ProcessPoolExecutor
+        The worker processes, started in setup
+
+    uploadBudget : int
+        The most finished Chunk meshes uploaded to the GPU in a single frame
+
+    loadingChunks : dict
+        Key: (X, Z) Chunk Coordinate
+        Value: (Chunk, Future) of the Chunks with their Blocks being generated
+
+    pendingMeshes : list
+        A list containing (Chunk, meshRequest, surfaceVersion, Future) of the meshes being built
+
+    finishedMeshes : collections.deque
+        The pendingMeshes which finished and are waiting to be uploaded
+
+    worldPath : str
+        The folder the World is saved in, with the seed and storageMode in world.json
+
+    storageMode : str
+        "edits" saves only the player's Block edits to the editLog and regenerates the rest from the seed,
+        "region" saves the Blocks of every Chunk to the regionFiles
+
+    editLog : None/EditLog
+        The Edit Log of the World when the storageMode is "edits"
+
+    regionFiles : dict
+        Key: (X, Z) Region Coordinate
+        Value: RegionFile
+
+    frustumCulling : bool
+        Whether draw skips the Chunks outside the view frustum of the camera
+
+    occlusionCulling : bool
+        Whether draw skips the Sections which can't be reached from the camera through Air
+
+    directionCulling : bool
+        Whether draw skips the groups of surfaces of each Section which face away from the camera
+
+    lodDistances : tuple
+        The distances in Chunks from the player where the Chunks start being meshed from 2 and 4 block cells,
+        another distance adds 8 block cells
+
+    lodSkirts : bool
+        Whether the meshes of cells keep the surfaces on the sides of the Chunks, which hides the gaps between Chunks
+        meshed from different cell sizes
+
+    lodCentre : None/tuple
+        The (X, Z) Chunk Coordinate the lodFactor of each Chunk was worked out from
+
+    multiDraw : bool
+        Whether the Section meshes are kept in the bufferArena and drawn together with a single call,
+        False gives each Section its own VBO
+
+    bufferArena : None/BufferArena
+        The shared buffer of the Section meshes, created in setup when multiDraw is on
+
+    holdsSharedBuffers : bool
+        Whether the World is an owner of the shared buffers of VBOHandler, from setup until delete
+
+    deleted : bool
+        Whether delete has run, so running it again does nothing
+
+    culledChunkCount : int
+        The amount of Chunks draw skipped in the last frame
+
     halfChunk : Vector3
         Half Sie of each Chunk
 
@@ -53,9 +181,18 @@ class World:
         A list containing Vector3 with relative offsets to the corner Chunks
 
     chunks: dict
-        Key: Vector3 which is the Bottom Centre
+        Key: (X, Z) tuple of the integer Chunk Coordinate, the world position floor divided by the chunkSize
         Value: Chunk
 
+    chunksVersion : int
+        Counts the Chunks added to and removed from the chunks
+
+    drawOrder : list
+        The Chunks sorted front-to-back from the camera, so nearer Chunks fill the depth buffer first
+
+    drawOrderKey : None/tuple
+        The (camera Chunk Coordinate, chunksVersion) the drawOrder was sorted for
+
     currentChunk : None/Chunk
         THe Current Chunk the player is in.
 
@@ -69,15 +206,53 @@ class World:
         A Vector3: Chunk which contains the offset key and then the chunk value for the corners chunks.
     """
 
-    def __init__(self, player: Player, displayCentre: tuple):
+    def __init__(self, player: Player, displayCentre: tuple, seed=None, worldPath="worlds/world", storageMode=None):
         self.player = player
 
+        self.worldPath = worldPath
+        self.seed, self.storageMode = self.loadMetadata(seed, storageMode)
+
         self.noise = OpenSimplex(
-            seed=randint(10000, 99999)
+            seed=self.seed
         )
 
         self.chunkSize = Vector3(16, 16, 16)
         self.halfChunk = self.chunkSize / 2
+        self.greedyMeshing = False
+        self.vertexFormat = "float"
+        self.sectionHeight = 8
+
+        self.streamChunks = True
+        self.renderDistance = 3
+        self.unloadMargin = 1
+        self.chunkLoadsPerFrame = 2
+        self.chunkLoadQueue = []
+        self.streamCentre = None
+
+        self.workerCount = os.cpu_count() or 1
+        self.workerPool = None
+        self.uploadBudget = 4
+        self.loadingChunks = {}
+        self.pendingMeshes = []
+        self.finishedMeshes = deque()
+
+        self.regionFiles = {}
+
+        self.frustumCulling = True
+        self.occlusionCulling = True
+        self.directionCulling = True
+
+        self.lodDistances = (2, 3)
+        self.lodSkirts = True
+        self.lodCentre = None
+        self.multiDraw = True
+        self.bufferArena = None
+        self.holdsSharedBuffers = False
+        self.deleted = False
+
+        self.culledChunkCount = 0
+        self.editLog = EditLog(os.path.join(self.worldPath, "edits.log")) if self.storageMode == "edits" else None
+
         self.displayCentre = Vector2(*displayCentre)
         self.displaySize = self.displayCentre * 2
 
@@ -96,9 +271,13 @@ class World:
         ]
 
         self.chunks = {
-            # BottomCentrePos : Chunk
+            # (ChunkX, ChunkZ) : Chunk
         }
 
+        self.chunksVersion = 0
+        self.drawOrder = []
+        self.drawOrderKey = None
+
         self.currentChunk = None
         self.mouseTouchChunk = None
 
@@ -110,12 +289,56 @@ class World:
 
         }
 
-    def __del__(self):
-        self.delete()
+    def loadMetadata(self, seed, storageMode):
+        """
+        Gets the seed and storageMode of the World from world.json, a new World saves them there
+
+        Parameters
+        ----------
+        seed : None/int
+            The seed asked for, None uses the saved one
+
+        storageMode : None/str
+            The storageMode asked for, None uses the saved one
+
+        Returns
+        -------
+        tuple
+            (seed, storageMode)
+        """
+
+        metadataPath = os.path.join(self.worldPath, "world.json")
+
+        if os.path.exists(metadataPath):
+            with open(metadataPath) as metadataFile:
+                metadata = json.load(metadataFile)
+
+            if seed is not None and seed != metadata["seed"]:
+                raise WorldError(f"{self.worldPath} was saved with the seed {metadata['seed']}, not {seed}")
+
+            if storageMode is not None and storageMode != metadata["storageMode"]:
+                raise WorldError(f"{self.worldPath} was saved with the {metadata['storageMode']} storageMode")
+
+            return metadata["seed"], metadata["storageMode"]
+
+        metadata = {
+            "seed": randint(10000, 99999) if seed is None else seed,
+            "storageMode": storageMode or "edits",
+        }
+
+        if metadata["storageMode"] not in ("edits", "region"):
+            raise WorldError(f"Unknown storageMode {metadata['storageMode']}")
+
+        os.makedirs(self.worldPath, exist_ok=True)
+
+        with open(metadataPath, "w") as metadataFile:
+            json.dump(metadata, metadataFile)
+
+        return metadata["seed"], metadata["storageMode"]
 
     def generateChunks(self):
         """
-        Generates All the Chunks
+        Generates All the Chunks within the renderDistance of the player
 
         Returns
         -------
@@ -124,20 +347,87 @@ class World:
 
         s = time()
 
-        size = 0
-        for chunkMultX in range(-size, size + 1):
-            for chunkMultY in range(-size, size + 1):
-                chunkPosition = self.chunkSize * Vector3(chunkMultX, 0, chunkMultY)
-                chunkPosition += self.chunkSize/2
-                chunkPosition *= Vector3(1, 0, 1)
-                #print(chunkPosition)
+        self.streamCentre = self.getPlayerChunkCoord()
 
-                newChunk = Chunk(chunkPosition, self.chunkSize, self.noise)
+        for chunkX, chunkZ in self.getChunkCoordsInRange(self.streamCentre, self.renderDistance):
+            newChunk = self.createChunk(chunkX, chunkZ)
+            self.chunks[newChunk.chunkCoord] = newChunk
 
-                self.chunks[chunkPosition] = newChunk
+        self.chunksVersion += 1
 
         print("Finished Gen Chunks", round(time() - s, 2))
 
+    def createChunk(self, chunkX: int, chunkZ: int):
+        """
+        Creates the Chunk at a Chunk Coordinate, without generating its Blocks
+
+        Parameters
+        ----------
+        chunkX : int
+            X Chunk Coordinate
+
+        chunkZ : int
+            Z Chunk Coordinate
+
+        Returns
+        -------
+        Chunk
+        """
+
+        chunkPosition = self.chunkSize * Vector3(chunkX, 0, chunkZ)
+        chunkPosition += self.chunkSize/2
+        chunkPosition *= Vector3(1, 0, 1)
+
+        chunk = Chunk(chunkPosition, self.chunkSize, self.noise, greedyMeshing=self.greedyMeshing,
+                      vertexFormat=self.vertexFormat, sectionHeight=self.sectionHeight, lodSkirts=self.lodSkirts,
+                      bufferArena=self.bufferArena)
+        chunk.lodFactor = self.getLodFactor((chunkX, chunkZ), self.getPlayerChunkCoord())
+
+        return chunk
+
+    def getPlayerChunkCoord(self):
+        """
+        Gets the Chunk Coordinate the player is above or below
+
+        Returns
+        -------
+        tuple
+            (X, Z) Chunk Coordinate
+        """
+
+        playerPos = self.player.camera.currentCameraPosition
+
+        return int(playerPos.X // self.chunkSize.X), int(playerPos.Z // self.chunkSize.Z)
+
+    @staticmethod
+    def getChunkCoordsInRange(centre: tuple, distance: int):
+        """
+        Gets the Chunk Coordinates in the square around a Chunk Coordinate, nearest first
+
+        Parameters
+        ----------
+        centre : tuple
+            (X, Z) Chunk Coordinate in the middle
+
+        distance : int
+            The distance in Chunks from the centre to the edge of the square
+
+        Returns
+        -------
+        list
+            A list containing (X, Z) tuples
+        """
+
+        centreX, centreZ = centre
+
+        chunkCoords = [
+            (centreX + offsetX, centreZ + offsetZ)
+            for offsetX in range(-distance, distance + 1)
+            for offsetZ in range(-distance, distance + 1)
+        ]
+
+        return sorted(chunkCoords, key=lambda coord: (coord[0] - centreX) ** 2 + (coord[1] - centreZ) ** 2)
+
     def updateCurrentChunk(self):
         """
         Updates The Chunk that the player is in and the adjacent and corner chunks of that.
@@ -149,33 +439,266 @@ class World:
 
         playerPos = self.player.camera.currentCameraPosition
 
-        for chunk in self.chunks.values():
-            if chunk.isPointInChunk(playerPos):
-                self.currentChunk = chunk
-                self.adjacentCurrentChunk = chunk.adjacentChunks
-                self.cornerCurrentChunks = chunk.cornerChunks
+        chunk = None
+        if 0 <= playerPos.Y <= self.chunkSize.Y:
+            chunk = self.getChunkAt(playerPos.X, playerPos.Z)
 
-                return
+        if chunk:
+            self.currentChunk = chunk
+            self.adjacentCurrentChunk = chunk.adjacentChunks
+            self.cornerCurrentChunks = chunk.cornerChunks
+
+            return
 
         self.currentChunk = None
         self.adjacentCurrentChunk = {}
         self.cornerCurrentChunks = {}
 
+    def getChunkAt(self, x: float, z: float):
+        """
+        Gets the Chunk containing a world Position
+
+        Parameters
+        ----------
+        x : float
+            X Position in the World
+
+        z : float
+            Z Position in the World
+
+        Returns
+        -------
+        None/Chunk
+        """
+
+        return self.chunks.get((int(x // self.chunkSize.X), int(z // self.chunkSize.Z)), None)
+
+    def getBlockLocation(self, blockX: int, blockY: int, blockZ: int):
+        """
+        Gets the Chunk and the Position in the Chunk of a Block from its world Block Position
+        The world Block Position is the rounded centre of the Block
+
+        Parameters
+        ----------
+        blockX : int
+            X Block Position in the World
+
+        blockY : int
+            Y Block Position in the World
+
+        blockZ : int
+            Z Block Position in the World
+
+        Returns
+        -------
+        tuple
+            (Chunk, x, y, z), the Chunk is None when the Block isn't in a loaded Chunk
+        """
+
+        chunkX = blockX // self.chunkSize.X
+        chunkZ = blockZ // self.chunkSize.Z
+
+        if not 0 <= blockY < self.chunkSize.Y:
+            return None, 0, 0, 0
+
+        return (
+            self.chunks.get((chunkX, chunkZ), None),
+            blockX - chunkX * self.chunkSize.X,
+            blockY,
+            blockZ - chunkZ * self.chunkSize.Z
+        )
+
+    def isBlockSolid(self, blockX: int, blockY: int, blockZ: int):
+        """
+        Checks whether the Block at a world Block Position is solid, the Blocks of Chunks which aren't loaded are Air
+        The Blocks of empty Sections aren't looked up, so rays and boxes pass through the open sky quickly
+
+        Parameters
+        ----------
+        blockX : int
+            X Block Position in the World
+
+        blockY : int
+            Y Block Position in the World
+
+        blockZ : int
+            Z Block Position in the World
+
+        Returns
+        -------
+        bool
+        """
+
+        chunk, x, y, z = self.getBlockLocation(blockX, blockY, blockZ)
+
+        if chunk is None or not chunk.blocks.size or chunk.getSection(y).isEmpty:
+            return False
+
+        return chunk.blocks[y, x, z] != enums.BlockType.AIR.value
+
+    def raycast(self, startPoint: Vector3, direction: Vector3, maxDist: float):
+        """
+        Raycasts to find the first solid Block hit in any loaded Chunk, the Blocks are looked up in the chunks
+        so the ray can cross any amount of Chunk borders
+
+        Parameters
+        ----------
+        startPoint : Vector3
+            Starting Position of the Ray
+
+        direction : Vector3
+            Direction of the Ray
+
+        maxDist : float
+            Max Distance of the Ray
+
+        Returns
+        -------
+        tuple
+            (Chunk, Block, surface index, distance) of the Block hit, or four None when nothing is hit
+        """
+
+        hit = traverseVoxels(startPoint.tuple, direction.tuple, maxDist, self.isBlockSolid)
+
+        if not hit:
+            return None, None, None, None
+
+        blockPosition, surfaceIndex, distance = hit
+        chunk, x, y, z = self.getBlockLocation(*blockPosition)
+
+        return chunk, chunk.getBlock(x, y, z), surfaceIndex, distance
+
     def draw(self):
         """
-        Draws All the Chunks
+        Draws the Chunks inside the view frustum of the current projection and modelview matrices
+        Only the Sections which can be reached from the camera's Section through Air are drawn,
+        with the bufferArena every Section is drawn by one call
 
         Returns
         -------
         None
         """
 
-        for chunk in self.chunks.values():
-            chunk.draw()
+        chunks = self.getDrawOrder()
+        self.culledChunkCount = 0
+
+        if self.frustumCulling and chunks:
+            boundingBoxes = np.array([chunk.boundingBox for chunk in chunks])
+            chunksVisible = frustum.boxesInFrustum(
+                frustum.getFrustumPlanes(),
+                boundingBoxes[:, 0],
+                boundingBoxes[:, 1]
+            )
+
+            chunks = [chunk for chunk, visible in zip(chunks, chunksVisible) if visible]
+
+        visibleSections = self.getVisibleSections(chunks) if self.occlusionCulling else None
+        cameraPosition = self.player.camera.currentCameraPosition.tuple if self.directionCulling else None
+        drawnChunkCount = 0
+        meshDraws = []
+
+        for chunk in chunks:
+            if visibleSections is None:
+                sections = chunk.sections
+            else:
+                chunkX, chunkZ = chunk.chunkCoord
+                sections = [
+                    section for sectionY, section in enumerate(chunk.sections)
+                    if (chunkX, sectionY, chunkZ) in visibleSections
+                ]
+
+            for section in sections:
+                if not self.bufferArena:
+                    section.draw(cameraPosition)
+                elif section.meshAllocation:
+                    meshDraws.append((section.meshAllocation, section.getSurfacesVisible(cameraPosition)))
+
+            drawnChunkCount += bool(sections)
+
+        if self.bufferArena:
+            self.bufferArena.compactIfFragmented()
+            self.bufferArena.draw(meshDraws)
+
+        self.culledChunkCount = len(self.chunks) - drawnChunkCount
+
+    def getCameraBlockPosition(self):
+        """
+        Gets the world Block Position the camera is in
+
+        Returns
+        -------
+        tuple
+            (X, Y, Z) world Block Position
+        """
+
+        # The Blocks are centred on the integer positions
+        return tuple(int(floor(num + 0.5)) for num in self.player.camera.currentCameraPosition.tuple)
+
+    def getDrawOrder(self):
+        """
+        Gets the Chunks sorted by the distance of their centre from the camera, nearest first
+        The order is only sorted again when the camera changes Chunk or Chunks are added or removed
+
+        Returns
+        -------
+        list
+        """
+
+        blockX, blockY, blockZ = self.getCameraBlockPosition()
+        drawOrderKey = ((blockX // self.chunkSize.X, blockZ // self.chunkSize.Z), self.chunksVersion)
+
+        if drawOrderKey != self.drawOrderKey:
+            self.drawOrderKey = drawOrderKey
+
+            cameraPosition = np.array(self.player.camera.currentCameraPosition.tuple)
+            chunks = list(self.chunks.values())
+
+            if chunks:
+                chunkCentres = np.array([chunk.boundingBox.mean(axis=0) for chunk in chunks])
+                distances = ((chunkCentres - cameraPosition) ** 2).sum(axis=1)
+
+                self.drawOrder = [chunks[i] for i in np.argsort(distances, kind="stable").tolist()]
+            else:
+                self.drawOrder = []
+
+        return self.drawOrder
+
+    def getVisibleSections(self, chunks: list):
+        """
+        Gets the Sections which can be reached from the camera through Air, from occlusion.findVisibleSections
+
+        Parameters
+        ----------
+        chunks : list
+            The Chunks inside the view frustum
+
+        Returns
+        -------
+        None/set
+            The (X, Y, Z) Section Coordinates which can be seen,
+            None when the camera is below the World or outside the loaded Chunks so nothing can be culled
+        """
+
+        if not chunks:
+            return set()
+
+        blockX, blockY, blockZ = self.getCameraBlockPosition()
+        chunkCoord = (blockX // self.chunkSize.X, blockZ // self.chunkSize.Z)
+
+        chunksInFrustum = {chunk.chunkCoord for chunk in chunks}
+
+        if blockY >= self.chunkSize.Y:
+            startSection = None
+        elif blockY < 0 or chunkCoord not in chunksInFrustum:
+            return None
+        else:
+            startSection = (chunkCoord[0], blockY // self.chunks[chunkCoord].sectionHeight, chunkCoord[1])
+
+        return occlusion.findVisibleSections(self.chunks, startSection, chunksInFrustum, len(chunks[0].sections))
 
     def generateBlocks(self):
         """
-        Generates the Blocks of each Chunk
+        Generates the Blocks of each Chunk, or loads them from the Region Files
 
         Returns
         -------
@@ -185,10 +708,22 @@ class World:
         s = time()
 
         for chunk in self.chunks.values():
-            chunk.generateBlocks()
+            self.loadBlocks(chunk)
 
         print("Finished Gen Blocks", round(time() - s, 2))
 
+    def remeshDirtyChunks(self):
+        """
+        Regenerates the VBO of the Chunks changed by block edits
+
+        Returns
+        -------
+        None
+        """
+
+        for chunk in self.chunks.values():
+            chunk.updateMesh()
+
     def genChunkVBOs(self):
         """
         Generates the VBO of every Chunk
@@ -200,10 +735,36 @@ class World:
 
         s = time()
 
+        vertexCount = 0
+        vertexBytes = 0
+
         for chunk in self.chunks.values():
             chunk.genChunkVBO()
 
-        print("Finished Gen Chunk VBOs", round(time() - s, 2))
+            for section in chunk.sections:
+                if section.sectionVBO:
+                    vertexCount += len(section.sectionVBO.combinedData)
+                    vertexBytes += section.sectionVBO.combinedData.nbytes
+
+        if self.bufferArena:
+            vertexCount = self.bufferArena.usedVertexCount
+            vertexBytes = vertexCount * self.bufferArena.vertexSize
+
+        print("Finished Gen Chunk VBOs", round(time() - s, 2), "Vertices:", vertexCount, "Bytes:", vertexBytes)
+        self.printBufferStats()
+
+    @staticmethod
+    def printBufferStats():
+        """
+        Prints the amount of live OpenGL buffers, their total bytes and the amount of live VAOs
+
+        Returns
+        -------
+        None
+        """
+
+        print("Live Buffers:", BufferPool.liveBufferCount, "Bytes:", BufferPool.liveBufferBytes,
+              "VAOs:", VBOHandler.liveVertexArrayCount)
 
     def linkChunks(self):
         """
@@ -216,23 +777,529 @@ class World:
 
         s = time()
 
-        for chunkPos, chunk in self.chunks.items():
-            adjacentData = {}
-            cornerData = {}
+        for chunkCoord, chunk in self.chunks.items():
+            chunk.linkChunk(*self.getLinkData(chunkCoord))
+
+        print("Finished Link Chunks", round(time() - s, 2))
+
+    def getLinkData(self, chunkCoord: tuple):
+        """
+        Gets the loaded Adjacent and Corner Chunks of a Chunk Coordinate
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
 
-            for chunkOffset in self.adjacentChunkOffsets:
-                newChunkPos = chunkPos + (chunkOffset * self.chunkSize)
+        Returns
+        -------
+        tuple
+            (adjacentData, cornerData), Vector3 offset: Chunk dicts with None for the Chunks that aren't loaded
+        """
 
-                adjacentData[chunkOffset] = self.chunks.get(newChunkPos, None)
+        chunkX, chunkZ = chunkCoord
 
-            for chunkOffset in self.cornerChunksOffsets:
-                newChunkPos = chunkPos + (chunkOffset * self.chunkSize)
+        adjacentData = {}
+        cornerData = {}
 
-                cornerData[chunkOffset] = self.chunks.get(newChunkPos, None)
+        for chunkOffset in self.adjacentChunkOffsets:
+            adjacentData[chunkOffset] = self.chunks.get((chunkX + chunkOffset.X, chunkZ + chunkOffset.Z), None)
 
-            chunk.linkChunk(adjacentData, cornerData)
+        for chunkOffset in self.cornerChunksOffsets:
+            cornerData[chunkOffset] = self.chunks.get((chunkX + chunkOffset.X, chunkZ + chunkOffset.Z), None)
 
-        print("Finished Link Chunks", round(time() - s, 2))
+        return adjacentData, cornerData
+
+    def relinkAround(self, chunkCoord: tuple):
+        """
+        Relinks the loaded Chunks around a Chunk Coordinate after it was loaded or unloaded
+        The Adjacent Chunks have their border Surfaces updated
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate which changed
+
+        Returns
+        -------
+        None
+        """
+
+        adjacentData, cornerData = self.getLinkData(chunkCoord)
+
+        for chunk in cornerData.values():
+            if chunk:
+                chunk.linkChunk(*self.getLinkData(chunk.chunkCoord))
+
+        for chunk in adjacentData.values():
+            if chunk:
+                chunk.linkChunk(*self.getLinkData(chunk.chunkCoord))
+
+                if self.workerPool:
+                    self.requestMesh(chunk)
+                else:
+                    chunk.updateBorderSurfaces()
+
+    def loadChunk(self, chunkCoord: tuple):
+        """
+        Generates or Loads, Links and Meshes the Chunk at a Chunk Coordinate
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        Returns
+        -------
+        Chunk
+        """
+
+        chunk = self.createChunk(*chunkCoord)
+        self.loadBlocks(chunk)
+
+        self.chunks[chunkCoord] = chunk
+        self.chunksVersion += 1
+
+        chunk.linkChunk(*self.getLinkData(chunkCoord))
+        chunk.updateAllSurface()
+        chunk.genChunkVBO()
+
+        self.relinkAround(chunkCoord)
+
+        return chunk
+
+    def unloadChunk(self, chunkCoord: tuple):
+        """
+        Frees the VBO's of the Chunk at a Chunk Coordinate and removes it from the World
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        Returns
+        -------
+        None
+        """
+
+        if chunkCoord in self.loadingChunks:
+            chunk, future = self.loadingChunks.pop(chunkCoord)
+            future.cancel()
+
+            return
+
+        chunk = self.chunks.pop(chunkCoord)
+        self.chunksVersion += 1
+
+        self.saveChunk(chunk)
+        chunk.delete()
+
+        if self.currentChunk is chunk:
+            self.currentChunk = None
+            self.adjacentCurrentChunk = {}
+            self.cornerCurrentChunks = {}
+
+        if self.mouseTouchChunk is chunk:
+            self.mouseTouchChunk = None
+
+        self.relinkAround(chunkCoord)
+
+    def getLodFactor(self, chunkCoord: tuple, centre: tuple):
+        """
+        Gets the size in blocks of the cells a Chunk is meshed from, from its distance band in lodDistances
+        The size is lowered until it fits the Sections
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        centre : tuple
+            (X, Z) Chunk Coordinate of the player
+
+        Returns
+        -------
+        int
+        """
+
+        distance = max(abs(chunkCoord[0] - centre[0]), abs(chunkCoord[1] - centre[1]))
+        lodFactor = 2 ** sum(distance >= lodDistance for lodDistance in self.lodDistances)
+
+        sectionHeight = self.sectionHeight or self.chunkSize.Y
+
+        while lodFactor > 1 and (sectionHeight % lodFactor or self.chunkSize.X % lodFactor or
+                                 self.chunkSize.Z % lodFactor):
+            lodFactor //= 2
+
+        return lodFactor
+
+    def updateLodFactors(self):
+        """
+        Remeshes the Chunks which moved into a different distance band of lodDistances after the player changed Chunk
+
+        Returns
+        -------
+        None
+        """
+
+        playerChunkCoord = self.getPlayerChunkCoord()
+
+        if playerChunkCoord == self.lodCentre:
+            return
+
+        self.lodCentre = playerChunkCoord
+
+        for chunk in self.chunks.values():
+            lodFactor = self.getLodFactor(chunk.chunkCoord, playerChunkCoord)
+
+            if lodFactor == chunk.lodFactor:
+                continue
+
+            chunk.lodFactor = lodFactor
+
+            if self.workerPool:
+                self.requestMesh(chunk)
+            else:
+                for section in chunk.sections:
+                    section.meshDirty = True
+
+    def updateStreamedChunks(self):
+        """
+        Loads the Chunks coming into the renderDistance and unloads the Chunks past it when the player changes Chunk
+        At most chunkLoadsPerFrame Chunks are loaded each call
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.streamChunks:
+            return
+
+        playerChunkCoord = self.getPlayerChunkCoord()
+
+        if playerChunkCoord != self.streamCentre:
+            self.streamCentre = playerChunkCoord
+            centreX, centreZ = playerChunkCoord
+
+            unloadDistance = self.renderDistance + self.unloadMargin
+
+            for chunkX, chunkZ in list(self.chunks.keys()) + list(self.loadingChunks.keys()):
+                if max(abs(chunkX - centreX), abs(chunkZ - centreZ)) > unloadDistance:
+                    self.unloadChunk((chunkX, chunkZ))
+
+            self.evictRegionFiles()
+
+            self.chunkLoadQueue = [
+                chunkCoord for chunkCoord in self.getChunkCoordsInRange(playerChunkCoord, self.renderDistance)
+                if chunkCoord not in self.chunks and chunkCoord not in self.loadingChunks
+            ]
+
+        if self.workerPool:
+            # The workers take the whole queue, the uploadBudget keeps the frames smooth instead
+            for chunkCoord in self.chunkLoadQueue:
+                self.requestChunk(chunkCoord)
+
+            self.chunkLoadQueue = []
+            return
+
+        for chunkCoord in self.chunkLoadQueue[:self.chunkLoadsPerFrame]:
+            self.loadChunk(chunkCoord)
+
+        del self.chunkLoadQueue[:self.chunkLoadsPerFrame]
+
+    def startWorkerPool(self):
+        """
+        Starts the worker processes if there are workerCount and they haven't been started
+        The workers are spawned, a forked worker would copy the display and OpenGL context of this process
+
+        Returns
+        -------
+        None
+        """
+
+        if self.workerCount and not self.workerPool:
+            self.workerPool = ProcessPoolExecutor(
+                max_workers=self.workerCount,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=chunkworker.initWorker,
+                initargs=(self.seed,)
+            )
+
+    def requestChunk(self, chunkCoord: tuple):
+        """
+        Creates the Chunk at a Chunk Coordinate and sends its Block generation to the workerPool
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        Returns
+        -------
+        None
+        """
+
+        chunk = self.createChunk(*chunkCoord)
+        storedBlocks = self.readStoredBlocks(chunk)
+
+        if storedBlocks is None:
+            future = self.workerPool.submit(chunkworker.generateChunkBlocks, chunk.getGenerationArgs())
+        else:
+            # Reading a stored Chunk is cheaper than sending it to a worker
+            chunk.saveDirty = False
+
+            future = Future()
+            future.set_result(storedBlocks)
+
+        self.loadingChunks[chunkCoord] = (chunk, future)
+
+    def getRegionFile(self, chunkCoord: tuple):
+        """
+        Gets the Region File a Chunk Coordinate is stored in, opening it the first time
+
+        Parameters
+        ----------
+        chunkCoord : tuple
+            (X, Z) Chunk Coordinate
+
+        Returns
+        -------
+        RegionFile
+        """
+
+        regionCoord = RegionFile.getRegionCoord(*chunkCoord)
+
+        if regionCoord not in self.regionFiles:
+            regionPath = os.path.join(self.worldPath, "region", "r.{}.{}.region".format(*regionCoord))
+            self.regionFiles[regionCoord] = RegionFile(regionPath)
+
+        return self.regionFiles[regionCoord]
+
+    def evictRegionFiles(self):
+        """
+        Removes the Region Files with no loaded or loading Chunks from the regionFiles,
+        so the Regions the player left behind don't stay in memory
+
+        Returns
+        -------
+        None
+        """
+
+        usedRegionCoords = {
+            RegionFile.getRegionCoord(*chunkCoord) for chunkCoord in list(self.chunks) + list(self.loadingChunks)
+        }
+
+        for regionCoord in list(self.regionFiles):
+            if regionCoord not in usedRegionCoords:
+                del self.regionFiles[regionCoord]
+
+    def readStoredBlocks(self, chunk: Chunk):
+        """
+        Reads the Blocks of a Chunk from its Region File
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The Chunk to read, its Blocks aren't changed
+
+        Returns
+        -------
+        None/np.ndarray
+            None when the Chunk isn't stored, was stored with a different Chunk Size or the storageMode isn't "region"
+        """
+
+        if self.storageMode != "region":
+            return None
+
+        try:
+            storedBlocks = self.getRegionFile(chunk.chunkCoord).readChunk(*chunk.chunkCoord)
+        except RegionError as error:
+            print("Regenerating Chunk", chunk.chunkCoord, error)
+            return None
+
+        if storedBlocks is None or storedBlocks.shape != (chunk.size.Y, chunk.size.X, chunk.size.Z):
+            return None
+
+        return storedBlocks
+
+    def loadBlocks(self, chunk: Chunk):
+        """
+        Sets the Blocks of a Chunk from its Region File, or generates them when it isn't stored
+        The saved edits of the Chunk are replayed on top of generated Blocks
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The Chunk to fill
+
+        Returns
+        -------
+        None
+        """
+
+        storedBlocks = self.readStoredBlocks(chunk)
+
+        if storedBlocks is None:
+            chunk.generateBlocks()
+            self.replayStoredEdits(chunk)
+        else:
+            chunk.setBlocks(storedBlocks)
+            chunk.saveDirty = False
+
+    def replayStoredEdits(self, chunk: Chunk):
+        """
+        Replays the edits of a Chunk from the editLog, if the storageMode is "edits"
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The Chunk with its generated Blocks
+
+        Returns
+        -------
+        None
+        """
+
+        if self.editLog:
+            chunk.replayEdits(self.editLog.getEdits(chunk.chunkCoord))
+
+    def saveChunk(self, chunk: Chunk):
+        """
+        Saves the Chunk in the storageMode
+        "edits" adds its new Block edits to the editLog,
+        "region" writes its Blocks to its Region File if they changed since they were last saved or loaded
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The Chunk to save
+
+        Returns
+        -------
+        None
+        """
+
+        if self.editLog:
+            self.editLog.addEdits(chunk.chunkCoord, chunk.blockEdits)
+            chunk.blockEdits = []
+
+            return
+
+        if not chunk.saveDirty or not chunk.blocks.size:
+            return
+
+        self.getRegionFile(chunk.chunkCoord).writeChunk(*chunk.chunkCoord, chunk.blocks)
+        chunk.saveDirty = False
+
+    def saveChunks(self):
+        """
+        Saves every changed Chunk
+
+        Returns
+        -------
+        None
+        """
+
+        s = time()
+
+        for chunk in self.chunks.values():
+            self.saveChunk(chunk)
+
+        print("Finished Save Chunks", round(time() - s, 2))
+
+    def requestMesh(self, chunk: Chunk):
+        """
+        Sends the culling and meshing of a Chunk to the workerPool, replacing any earlier request of the Chunk
+
+        Parameters
+        ----------
+        chunk : Chunk
+            The loaded Chunk to mesh
+
+        Returns
+        -------
+        None
+        """
+
+        chunk.meshRequest += 1
+
+        # The arrays are copied as the workers receive them after this returns
+        adjacentBlocks = {
+            offset: blocks.copy() if blocks is not None else None
+            for offset, blocks in chunk.getAdjacentBlocks().items()
+        }
+
+        future = self.workerPool.submit(
+            chunkworker.buildChunkMeshes,
+            chunk.blocks.copy(),
+            adjacentBlocks,
+            [(section.yStart, section.yEnd) for section in chunk.sections],
+            chunk.greedyMeshing,
+            chunk.vertexFormat,
+            chunk.getMeshOffset(),
+            lodFactor=chunk.lodFactor,
+            lodSkirts=chunk.lodSkirts
+        )
+
+        self.pendingMeshes.append((chunk, chunk.meshRequest, chunk.surfaceVersion, future))
+
+    def processWorkerResults(self):
+        """
+        Adds the Chunks the workers finished generating and uploads at most uploadBudget finished meshes
+        Meshes of unloaded Chunks, or of Chunks that changed since the request, are dropped
+
+        Returns
+        -------
+        None
+        """
+
+        if not self.workerPool:
+            return
+
+        for chunkCoord, (chunk, future) in list(self.loadingChunks.items()):
+            if not future.done():
+                continue
+
+            del self.loadingChunks[chunkCoord]
+
+            chunk.setBlocks(future.result())
+            self.replayStoredEdits(chunk)
+
+            self.chunks[chunkCoord] = chunk
+            self.chunksVersion += 1
+
+            # The player may have changed Chunk while it was loading, updateLodFactors skipped it then
+            chunk.lodFactor = self.getLodFactor(chunkCoord, self.getPlayerChunkCoord())
+
+            chunk.linkChunk(*self.getLinkData(chunkCoord))
+            self.requestMesh(chunk)
+            self.relinkAround(chunkCoord)
+
+        pendingMeshes = []
+
+        for meshJob in self.pendingMeshes:
+            if meshJob[-1].done():
+                self.finishedMeshes.append(meshJob)
+            else:
+                pendingMeshes.append(meshJob)
+
+        self.pendingMeshes = pendingMeshes
+
+        uploadCount = 0
+
+        while self.finishedMeshes and uploadCount < self.uploadBudget:
+            chunk, meshRequest, surfaceVersion, future = self.finishedMeshes.popleft()
+
+            if self.chunks.get(chunk.chunkCoord) is not chunk or meshRequest != chunk.meshRequest:
+                continue
+
+            if surfaceVersion != chunk.surfaceVersion:
+                self.requestMesh(chunk)
+                continue
+
+            chunk.applyMeshes(*future.result())
+            uploadCount += 1
 
     def setHighlightedBlockData(self):
         """
@@ -249,10 +1316,7 @@ class World:
             if highlightedBlock:
                 highlightedBlock.drawWireSurfaceShow(black=True)
 
-        currentCameraPos = self.player.camera.currentCameraPosition
-        chunkCheck = getCloseChunks(currentCameraPos, self.player.camera.lookVector, self)
-
-        self.mouseTouchChunk = self.player.setHighlightedBlockData(chunkCheck)
+        self.mouseTouchChunk = self.player.setHighlightedBlockData()
 
     def setup(self):
         """
@@ -263,6 +1327,23 @@ class World:
         None
         """
 
+        if not self.holdsSharedBuffers:
+            VBOHandler.holdSharedBuffers()
+            self.holdsSharedBuffers = True
+
+        if self.multiDraw:
+            self.bufferArena = BufferArena(self.vertexFormat)
+
+        self.startWorkerPool()
+
+        if self.workerPool:
+            self.streamCentre = self.getPlayerChunkCoord()
+
+            for chunkCoord in self.getChunkCoordsInRange(self.streamCentre, self.renderDistance):
+                self.requestChunk(chunkCoord)
+
+            return
+
         self.generateChunks()
         self.generateBlocks()
         self.linkChunks()
@@ -290,14 +1371,45 @@ class World:
         None
         """
 
+        if self.deleted:
+            return
+
+        self.deleted = True
+
         print("Exiting...")
 
+        if self.workerPool:
+            for chunk, future in self.loadingChunks.values():
+                future.cancel()
+
+            for meshJob in self.pendingMeshes:
+                meshJob[-1].cancel()
+
+            self.workerPool.shutdown(wait=False)
+            self.workerPool = None
+
+        self.saveChunks()
+
+        if self.editLog:
+            self.editLog.compact()
+
         for i, chunk in enumerate(self.chunks.values()):
             print(f"Deleting Chunk {i}", end=" ")
-            if chunk.chunkVBO:
-                chunk.chunkVBO.delete()
+            chunk.delete()
             print("FINISHED")   
 
+        if self.bufferArena:
+            self.bufferArena.delete()
+            self.bufferArena = None
+
+        # The shared buffers are only deleted when no other World holds them
+        if self.holdsSharedBuffers:
+            VBOHandler.releaseSharedBuffers()
+            self.holdsSharedBuffers = False
+
+        # Anything left here was never deleted
+        self.printBufferStats()
+
     def updateAllSurfaces(self):
         """
         Updates all Surfaces of each Chunk